@@ -0,0 +1,276 @@
+// Sincronización incremental de asistencia con el servidor (user_system.py)
+//
+// Los registros los escribe el servidor al canjear el QR. Las páginas de los
+// estudiantes envían cada check-in a /api/attendance/sync con el token de su QR
+// y la hora a la que se hizo; sin conexión se queda en una cola local y se envía
+// al recuperarla (el servidor lo acepta aunque el token haya caducado, si se
+// escaneó mientras valía y no ha pasado más de un día). Los que el servidor
+// rechaza no se reintentan: se avisa en la página hasta que se cierra el aviso. El panel
+// del profesorado, con la clave de administración, pide solo los registros
+// posteriores a su cursor y los guarda en localStorage, que sigue siendo el
+// almacén local cuando no hay conexión.
+const AttendanceSync = (() => {
+    const API_BASE = 'http://localhost:5000';
+    const API_URL = `${API_BASE}/api/attendance/sync`;
+    const TOKENS_URL = `${API_BASE}/api/attendance/tokens`;
+    const RECORDS_KEY = 'attendanceRecords';
+    const CURSOR_KEY = 'attendanceCursor';
+    const QUEUE_KEY = 'attendanceQueue';
+    const REJECTED_KEY = 'attendanceRejected';
+    const ADMIN_KEY = 'attendanceAdminKey';
+
+    function read(key, fallback) {
+        try {
+            return JSON.parse(localStorage.getItem(key)) ?? fallback;
+        } catch (err) {
+            return fallback;
+        }
+    }
+
+    function records() {
+        return read(RECORDS_KEY, []);
+    }
+
+    // Añadir registros del servidor que aún no estén en el almacén local
+    function merge(incoming) {
+        if (!incoming.length) {
+            return [];
+        }
+        const local = records();
+        const known = new Set(local.map(record => record.record_id).filter(Boolean));
+        const added = incoming.filter(record => !known.has(record.record_id));
+        if (added.length) {
+            localStorage.setItem(RECORDS_KEY, JSON.stringify(local.concat(added)));
+        }
+        return added;
+    }
+
+    // Vaciar el almacén local (el cursor se mantiene: no se vuelven a descargar)
+    function clear() {
+        localStorage.removeItem(RECORDS_KEY);
+    }
+
+    // Clave de administración (X-Admin-Key) para leer los registros del servidor;
+    // se guarda solo mientras dura la pestaña
+    function setAdminKey(key) {
+        sessionStorage.setItem(ADMIN_KEY, key || '');
+    }
+
+    function hasAdminKey() {
+        return Boolean(sessionStorage.getItem(ADMIN_KEY));
+    }
+
+    function adminHeaders() {
+        return { 'X-Admin-Key': sessionStorage.getItem(ADMIN_KEY) || '' };
+    }
+
+    // Pedir al servidor un token firmado para el QR de una sesión (con la clave
+    // de administración); devuelve { token, expires_at }
+    async function mintToken(session, ttl) {
+        let response;
+        try {
+            response = await fetch(TOKENS_URL, {
+                method: 'POST',
+                headers: { 'Content-Type': 'application/json', ...adminHeaders() },
+                body: JSON.stringify({ session, ttl })
+            });
+        } catch (err) {
+            throw new Error('Servidor de asistencia no disponible');
+        }
+        if (response.status === 403) {
+            throw new Error('Clave del servidor incorrecta: vuelve a iniciar sesión con la clave');
+        }
+        if (!response.ok) {
+            throw new Error(`El servidor no pudo emitir el token (${response.status})`);
+        }
+        return response.json();
+    }
+
+    // Caducidad (segundos epoch) que lleva el token, sin comprobar la firma: solo
+    // para mostrar el tiempo restante cuando no se puede preguntar al servidor
+    function tokenExpiry(token) {
+        try {
+            const body = token.split('.')[0].replace(/-/g, '+').replace(/_/g, '/');
+            return JSON.parse(atob(body)).exp || null;
+        } catch (err) {
+            return null;
+        }
+    }
+
+    // Check-ins pendientes de enviar
+    function pending() {
+        return read(QUEUE_KEY, []);
+    }
+
+    // Enviar la cola al servidor; devuelve { local_id: resultado } de los que ya
+    // no tienen que reintentarse. Sin conexión (o con un error del servidor)
+    // siguen en la cola para el siguiente intento.
+    async function sendPending() {
+        const queued = pending();
+        if (!queued.length) {
+            return {};
+        }
+        let response;
+        try {
+            response = await fetch(API_URL, {
+                method: 'POST',
+                headers: { 'Content-Type': 'application/json' },
+                body: JSON.stringify({
+                    records: queued.map(entry => ({
+                        token: entry.token,
+                        student_id: entry.student_id,
+                        student_name: entry.student_name,
+                        timestamp: entry.queued_at
+                    }))
+                })
+            });
+        } catch (err) {
+            return {};
+        }
+        if (!response.ok) {
+            return {};
+        }
+        const data = await response.json();
+
+        const outcomes = {};
+        const rejectedNow = [];
+        data.results.forEach((result, index) => {
+            if (result.status >= 500) {
+                return;
+            }
+            const entry = queued[index];
+            if (result.success) {
+                merge([result.record]);
+                outcomes[entry.local_id] = { status: 'recorded', record: result.record };
+            } else {
+                // Token caducado, ya registrado (p. ej. un reenvío) o datos inválidos
+                outcomes[entry.local_id] = { status: 'rejected', code: result.status, error: result.error };
+                if (result.status !== 409) {
+                    rejectedNow.push({ ...entry, code: result.status, error: result.error });
+                }
+            }
+        });
+        if (rejectedNow.length) {
+            localStorage.setItem(REJECTED_KEY, JSON.stringify(rejected().concat(rejectedNow)));
+            showRejected();
+        }
+        // Se relee la cola: pueden haberse añadido check-ins durante el envío
+        localStorage.setItem(QUEUE_KEY, JSON.stringify(
+            pending().filter(entry => !(entry.local_id in outcomes))));
+        if (Object.keys(outcomes).length) {
+            window.dispatchEvent(new CustomEvent('attendanceFlushed', { detail: outcomes }));
+        }
+        return outcomes;
+    }
+
+    // Check-ins que el servidor no aceptó (no se reintentan)
+    function rejected() {
+        return read(REJECTED_KEY, []);
+    }
+
+    function dismissRejected() {
+        localStorage.removeItem(REJECTED_KEY);
+        document.getElementById('attendanceRejectedNotice')?.remove();
+    }
+
+    // Aviso fijo en la página con los check-ins rechazados, hasta que se cierra
+    function showRejected() {
+        const entries = rejected();
+        if (!entries.length || !document.body) {
+            return;
+        }
+        document.getElementById('attendanceRejectedNotice')?.remove();
+        const notice = document.createElement('div');
+        notice.id = 'attendanceRejectedNotice';
+        notice.style.cssText = 'position: fixed; left: 20px; right: 20px; bottom: 20px; z-index: 10000; ' +
+            'background: #fdecea; color: #611a15; border: 1px solid #f5c6cb; border-radius: 8px; ' +
+            'padding: 15px; box-shadow: 0 4px 12px rgba(0,0,0,0.15); font-size: 14px;';
+
+        const title = document.createElement('strong');
+        title.textContent = '⚠️ Asistencia guardada sin conexión que el servidor no ha aceptado. Avisa al profesor:';
+        const list = document.createElement('ul');
+        entries.forEach(entry => {
+            const item = document.createElement('li');
+            item.textContent = `${entry.student_name} (${entry.student_id}) - ${entry.session || ''}, ` +
+                `${new Date(entry.queued_at).toLocaleString('es-ES')}: ${entry.error || entry.code}`;
+            list.appendChild(item);
+        });
+        const button = document.createElement('button');
+        button.textContent = 'Entendido';
+        button.addEventListener('click', dismissRejected);
+
+        notice.append(title, list, button);
+        document.body.appendChild(notice);
+    }
+
+    // Los envíos van de uno en uno: dos llamadas seguidas no mandan dos veces el
+    // mismo check-in (entre pestañas no se coordina; el servidor responde 409)
+    let flushing = Promise.resolve();
+    function flush() {
+        const run = flushing.then(sendPending);
+        flushing = run.catch(() => {});
+        return run;
+    }
+
+    // Registrar un check-in con el token del QR: { status: 'recorded', record },
+    // { status: 'queued' } si no hay conexión o { status: 'rejected', code, error }
+    async function checkin({ token, studentId, studentName, session }) {
+        const entry = {
+            local_id: `${Date.now()}-${Math.random().toString(36).slice(2, 10)}`,
+            token,
+            student_id: studentId,
+            student_name: studentName,
+            session,
+            queued_at: new Date().toISOString()
+        };
+        localStorage.setItem(QUEUE_KEY, JSON.stringify(pending().concat(entry)));
+        const outcomes = await flush();
+        return outcomes[entry.local_id] || { status: 'queued' };
+    }
+
+    // Traer los registros nuevos del servidor; devuelve los añadidos (el cursor
+    // es global: no se filtra por sesión para no saltarse registros)
+    async function sync() {
+        const added = [];
+        if (!hasAdminKey()) {
+            return added;
+        }
+        let hasMore = true;
+
+        while (hasMore) {
+            const url = new URL(API_URL);
+            url.searchParams.set('cursor', read(CURSOR_KEY, 0));
+            const response = await fetch(url, { headers: adminHeaders() });
+            if (!response.ok) {
+                throw new Error(`Error de sincronización (${response.status})`);
+            }
+            const data = await response.json();
+
+            localStorage.setItem(CURSOR_KEY, JSON.stringify(data.cursor));
+            added.push(...merge(data.records));
+            hasMore = data.has_more;
+        }
+        return added;
+    }
+
+    // Cursor de la última sincronización (el stream en vivo puede empezar ahí)
+    function cursor() {
+        return read(CURSOR_KEY, 0);
+    }
+
+    // La cola se envía al cargar cualquier página que use el módulo y al volver la conexión
+    window.addEventListener('online', () => flush());
+    if (pending().length) {
+        flush();
+    }
+    if (document.readyState === 'loading') {
+        document.addEventListener('DOMContentLoaded', showRejected);
+    } else {
+        showRejected();
+    }
+
+    return {
+        sync, records, merge, clear, cursor, setAdminKey, hasAdminKey, adminHeaders,
+        mintToken, tokenExpiry, checkin, flush, pending, rejected, dismissRejected
+    };
+})();
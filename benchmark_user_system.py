@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+"""
+Benchmark del sistema de usuarios: registros de asistencia concurrentes
+
+Crea usuarios sintéticos en un directorio temporal y mide cuántos registros
+de asistencia por segundo admite UserSystem con 1, 2, 4, 8... hilos.
+
+Con --http compara los servidores por HTTP: la app Flask (servidor de Werkzeug
+con hilos) y la variante ASGI (uvicorn con varios workers), lanzando una ráfaga
+de POST /api/attendance como la que llega al mostrar el QR en clase.
+
+Las cargas mixtas (asistencia, panel y quiz) con percentiles y bytes escritos a
+disco están en loadtest_user_system.py.
+"""
+
+import argparse
+import json
+import os
+import secrets
+import shutil
+import signal
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+from user_storage import JsonStorage, SQLiteStorage
+from user_system import PasswordHasher, UserSystem
+
+# Los benchmarks miden la persistencia: el alta de usuarios usa un hash de contraseña barato
+SEED_HASH_ITERATIONS = 1000
+# Solo la administración registra asistencia con fecha y sin QR: los servidores
+# de prueba heredan esta clave
+ADMIN_KEY = os.environ.setdefault('ADMIN_API_KEY', secrets.token_hex(16))
+
+
+def create_storage(backend, directory):
+    """Backend de almacenamiento aislado dentro de un directorio temporal"""
+    if backend == 'sqlite':
+        return SQLiteStorage(os.path.join(directory, 'user_system.db'))
+    return JsonStorage(os.path.join(directory, 'users_snapshot.ndjson'),
+                       os.path.join(directory, 'users_snapshot.idx'),
+                       os.path.join(directory, 'journal_database.jsonl'),
+                       checkins_file=os.path.join(directory, 'attendance_checkins.ndjson'))
+
+
+def seed_users(system, count):
+    """Crear usuarios sintéticos a través de UserSystem.create_user"""
+    return [system.create_user(f'Estudiante {i}', f'estudiante{i}@ejemplo.com', f'2025{i:05d}')['id']
+            for i in range(count)]
+
+
+def bench_checkins(backend, users, checkins, threads):
+    """Registros de asistencia por segundo con el número de hilos indicado"""
+    directory = tempfile.mkdtemp(prefix='bench_users_')
+    try:
+        storage = create_storage(backend, directory)
+        system = UserSystem(storage, PasswordHasher(iterations=SEED_HASH_ITERATIONS))
+        user_ids = seed_users(system, users)
+        dates = [f'2025-11-{day:02d}' for day in range(1, 31)]
+
+        def worker(offset):
+            for i in range(offset, checkins, threads):
+                system.record_attendance(user_ids[i % users], dates[(i // users) % len(dates)])
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=threads) as pool:
+            list(pool.map(worker, range(threads)))
+        if hasattr(storage, 'sync'):
+            storage.sync()
+        elapsed = time.perf_counter() - start
+
+        storage.close()
+        return checkins / elapsed
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+REPO_DIR = os.path.dirname(os.path.abspath(__file__))
+SERVER_COMMANDS = {
+    'flask': ['-c', 'from user_system import app; app.run(port={port}, threaded=True)'],
+    'asgi': ['-m', 'uvicorn', 'user_system_asgi:app', '--port', '{port}',
+             '--workers', '{workers}', '--log-level', 'warning'],
+    'production': [os.path.join(REPO_DIR, 'start_server.py'), '--production',
+                   '--port', '{port}', '--workers', '{workers}'],
+}
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def post_json(url, payload, token=None, admin=False):
+    """POST con cuerpo JSON (y token de sesión o clave de administración opcionales)
+
+    Devuelve (código, respuesta decodificada).
+    """
+    headers = {'Content-Type': 'application/json'}
+    if token:
+        headers['Authorization'] = f'Bearer {token}'
+    if admin:
+        headers['X-Admin-Key'] = ADMIN_KEY
+    request = urllib.request.Request(url, data=json.dumps(payload).encode('utf-8'), headers=headers)
+    try:
+        with urllib.request.urlopen(request, timeout=30) as response:
+            return response.status, json.loads(response.read())
+    except urllib.error.HTTPError as error:
+        return error.code, None
+
+
+def start_http_server(kind, directory, port, workers, backend):
+    """Lanzar un servidor en un directorio temporal y esperar a que acepte conexiones"""
+    env = dict(os.environ, USER_STORAGE=backend, PASSWORD_HASH_ITERATIONS=str(SEED_HASH_ITERATIONS))
+    env['PYTHONPATH'] = REPO_DIR + os.pathsep + env.get('PYTHONPATH', '')
+    command = [sys.executable] + [part.format(port=port, workers=workers) for part in SERVER_COMMANDS[kind]]
+    # Grupo de procesos propio: al pararlo se paran también sus workers
+    process = subprocess.Popen(command, cwd=directory, env=env, start_new_session=True,
+                               stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f'El servidor {kind} terminó al arrancar (¿falta uvicorn?)')
+        try:
+            socket.create_connection(('127.0.0.1', port), timeout=0.5).close()
+            return process
+        except OSError:
+            time.sleep(0.1)
+    stop_http_server(process)
+    raise RuntimeError(f'El servidor {kind} no respondió en 30 s')
+
+
+def wait_group(process, timeout):
+    """Esperar a que terminen el servidor y todo su grupo de procesos; False si no da tiempo"""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        process.poll()  # recoger al líder si ya terminó
+        try:
+            os.killpg(process.pid, 0)
+        except ProcessLookupError:
+            return True
+        time.sleep(0.05)
+    return False
+
+
+def stop_http_server(process):
+    """Parar el servidor y todos sus workers: SIGTERM al grupo y SIGKILL si no terminan"""
+    try:
+        os.killpg(process.pid, signal.SIGTERM)
+    except ProcessLookupError:
+        return
+    if not wait_group(process, 15):
+        try:
+            os.killpg(process.pid, signal.SIGKILL)
+        except ProcessLookupError:
+            pass
+    process.wait()
+
+
+def bench_http(kind, backend, users, requests, concurrency, workers):
+    """Ráfaga de asistencia por HTTP: (peticiones/s, latencia p95 en ms, errores)"""
+    directory = tempfile.mkdtemp(prefix='bench_http_')
+    port = free_port()
+    base_url = f'http://127.0.0.1:{port}'
+    process = start_http_server(kind, directory, port, workers, backend)
+    try:
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            registered = pool.map(lambda i: post_json(f'{base_url}/api/register', {
+                'name': f'Estudiante {i}', 'email': f'estudiante{i}@ejemplo.com'}), range(users))
+            user_ids = [body['user']['id'] for status, body in registered if status == 200]
+            dates = [f'2025-11-{day:02d}' for day in range(1, 31)]
+
+            def checkin(i):
+                # Con la clave de administración, para repartir la ráfaga en varias fechas
+                start = time.perf_counter()
+                status, _ = post_json(f'{base_url}/api/attendance', {
+                    'user_id': user_ids[i % len(user_ids)],
+                    'class_date': dates[(i // len(user_ids)) % len(dates)]}, admin=True)
+                return time.perf_counter() - start, status
+
+            start = time.perf_counter()
+            results = list(pool.map(checkin, range(requests)))
+            elapsed = time.perf_counter() - start
+
+        latencies = sorted(latency for latency, _ in results)
+        errors = sum(1 for _, status in results if status != 200)
+        p95 = latencies[min(int(len(latencies) * 0.95), len(latencies) - 1)] * 1000
+        return requests / elapsed, p95, errors
+    finally:
+        stop_http_server(process)
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark de concurrencia del sistema de usuarios')
+    parser.add_argument('--backend', choices=['json', 'sqlite'], default='json')
+    parser.add_argument('--users', type=int, default=2000)
+    parser.add_argument('--checkins', type=int, default=20000)
+    parser.add_argument('--threads', default='1,2,4,8')
+    parser.add_argument('--http', action='store_true', help='Comparar los servidores Flask y ASGI por HTTP')
+    parser.add_argument('--servers', default='flask,asgi')
+    parser.add_argument('--requests', type=int, default=5000)
+    parser.add_argument('--concurrency', type=int, default=64)
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    if args.http:
+        users = min(args.users, args.requests)
+        print(f"📊 Ráfaga de asistencia por HTTP ({users} usuarios, {args.requests} peticiones, "
+              f"{args.concurrency} clientes)")
+        for kind in args.servers.split(','):
+            workers = args.workers if kind != 'flask' else 1
+            # Varios workers son procesos distintos: solo SQLite es compartible
+            backend = 'sqlite' if workers > 1 else args.backend
+            throughput, p95, errors = bench_http(kind, backend, users, args.requests,
+                                                 args.concurrency, workers)
+            print(f"   {kind:>5} ({workers} workers, {backend}): {throughput:>8.0f} peticiones/s, "
+                  f"p95 {p95:>7.1f} ms, {errors} errores")
+        return
+
+    print(f"📊 Asistencia concurrente ({args.backend}, {args.users} usuarios, {args.checkins} registros)")
+    for threads in [int(t) for t in args.threads.split(',')]:
+        throughput = bench_checkins(args.backend, args.users, args.checkins, threads)
+        print(f"   {threads:>3} hilos: {throughput:>10.0f} registros/s")
+
+
+if __name__ == "__main__":
+    main()
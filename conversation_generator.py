@@ -3,28 +3,12 @@
 Generador de prácticas de conversación interactivas para el curso de español
 """
 
-from fpdf import FPDF
-import json
-import os
+from pdf_engine import build, target
 
-class ConversationPDF(FPDF):
-    def header(self):
-        self.set_font('Arial', 'B', 16)
-        self.set_text_color(0, 51, 102)
-        self.cell(0, 10, 'Practica de Conversacion - Curso Intensivo de Espanol', 0, 1, 'C')
-        self.set_font('Arial', 'I', 10)
-        self.set_text_color(102, 102, 102)
-        self.cell(0, 6, 'Nivel 3 CLM (A1.2-A2.1) - Universidad de Granada', 0, 1, 'C')
-        self.ln(8)
 
-    def footer(self):
-        self.set_y(-20)
-        self.set_font('Arial', 'I', 9)
-        self.set_text_color(128, 128, 128)
-        self.cell(0, 6, f'Pagina {self.page_no()} de {{nb}}', 0, 1, 'C')
-        self.cell(0, 6, 'Profesor: Javier Benitez Lainez | Centro de Lenguas Modernas', 0, 0, 'C')
-
-def create_conversation_practice():
+@target('conversaciones-practicas', 'materials/conversaciones-practicas.pdf', group='conversacion')
+def conversation_practice():
+    """Diálogos de situaciones cotidianas con ejercicios y vocabulario"""
     conversations = [
         {
             "title": "En el Restaurante",
@@ -108,105 +92,47 @@ def create_conversation_practice():
         }
     ]
 
-    pdf = ConversationPDF()
-    pdf.set_title('Practicas de Conversacion - Curso Intensivo de Espanol')
-    pdf.set_author('Centro de Lenguas Modernas - Universidad de Granada')
-    pdf.add_page()
+    exercises = [
+        "1. Practica este diálogo con un compañero/a",
+        "2. Cambia algunas palabras o frases para hacerlo más personal",
+        "3. Inventa una situación diferente usando el mismo vocabulario",
+        "4. Graba tu voz y escucha tu pronunciación",
+        "5. Escribe 3 preguntas adicionales para esta conversación"
+    ]
+
+    vocab_sections = {
+        "Saludos y cortesia": ["Hola", "Buenos dias/tardes/noches", "Por favor", "Gracias", "De nada"],
+        "Preguntas basicas": ["¿Como...?", "¿Donde...?", "¿Cuando...?", "¿Cuanto...?", "¿Por favor?"]
+    }
 
+    blocks = []
     for i, conv in enumerate(conversations, 1):
         if i > 1:
-            pdf.add_page()
-
-        # Título y contexto
-        pdf.set_font('Arial', 'B', 14)
-        pdf.set_text_color(0, 51, 102)
-        pdf.cell(0, 10, f'Conversacion {i}: {conv["title"]}', 0, 1, 'C')
-        pdf.ln(5)
-
-        pdf.set_font('Arial', '', 11)
-        pdf.set_text_color(0, 0, 0)
-        pdf.multi_cell(0, 6, f'Contexto: {conv["context"]}')
-        pdf.ln(8)
-
-        # Diálogo
-        pdf.set_font('Arial', 'B', 11)
-        pdf.cell(0, 8, 'Dialogo:', 0, 1)
-        pdf.ln(3)
-
-        for line in conv["dialogue"]:
-            pdf.set_font('Arial', 'B', 10)
-            pdf.set_text_color(0, 102, 204)
-            pdf.cell(30, 6, line["person"] + ':', 0, 0)
-            pdf.set_font('Arial', '', 10)
-            pdf.set_text_color(0, 0, 0)
-            pdf.multi_cell(0, 6, line["text"])
-            pdf.ln(2)
-
-        pdf.ln(5)
-
-        # Sección de práctica
-        pdf.set_font('Arial', 'B', 12)
-        pdf.set_text_color(139, 69, 19)
-        pdf.cell(0, 8, 'Ejercicios de Practica:', 0, 1)
-        pdf.ln(3)
-
-        pdf.set_font('Arial', '', 10)
-        pdf.set_text_color(0, 0, 0)
-
-        exercises = [
-            "1. Practica este diálogo con un compañero/a",
-            "2. Cambia algunas palabras o frases para hacerlo más personal",
-            "3. Inventa una situación diferente usando el mismo vocabulario",
-            "4. Graba tu voz y escucha tu pronunciación",
-            "5. Escribe 3 preguntas adicionales para esta conversación"
+            blocks.append(('page',))
+        blocks += [
+            ('chapter', f'Conversacion {i}: {conv["title"]}'),
+            ('text', f'Contexto: {conv["context"]}'),
+            ('line', 'Dialogo:', 'label'),
+            ('pairs', [(line["person"] + ':', line["text"]) for line in conv["dialogue"]], 'dialogue'),
+            ('space', 5),
+            ('section', 'Ejercicios de Practica:'),
+            ('bullets', exercises, 'item'),
+            ('space', 5),
+            ('section', 'Vocabulario Util:'),
         ]
-
-        for exercise in exercises:
-            pdf.multi_cell(0, 6, exercise)
-            pdf.ln(2)
-
-        pdf.ln(5)
-
-        # Vocabulario útil
-        pdf.set_font('Arial', 'B', 12)
-        pdf.set_text_color(139, 69, 19)
-        pdf.cell(0, 8, 'Vocabulario Util:', 0, 1)
-        pdf.ln(3)
-
-        pdf.set_font('Arial', '', 10)
-
-        vocab_sections = {
-            "Saludos y cortesia": ["Hola", "Buenos dias/tardes/noches", "Por favor", "Gracias", "De nada"],
-            "Preguntas basicas": ["¿Como...?", "¿Donde...?", "¿Cuando...?", "¿Cuanto...?", "¿Por favor?"]
-        }
-
         for category, words in vocab_sections.items():
-            pdf.set_font('Arial', 'B', 10)
-            pdf.set_text_color(0, 102, 204)
-            pdf.cell(0, 6, category + ':', 0, 1)
-            pdf.set_font('Arial', '', 10)
-            pdf.set_text_color(0, 0, 0)
-            pdf.multi_cell(0, 6, ', '.join(words))
-            pdf.ln(3)
+            blocks += [('line', category + ':', 'category'), ('text', ', '.join(words), 'small')]
 
-    # Guardar PDF
-    pdf.output('materials/conversaciones-practicas.pdf')
-    print("✅ Created professional conversaciones-practicas.pdf")
+    return {
+        'title': 'Practicas de Conversacion - Curso Intensivo de Espanol',
+        'theme': 'conversacion',
+        'blocks': blocks,
+    }
 
-def create_cultural_guide():
-    pdf = FPDF()
-    pdf.add_page()
 
-    # Título
-    pdf.set_font('Arial', 'B', 16)
-    pdf.set_text_color(0, 51, 102)
-    pdf.cell(0, 10, 'Guia Cultural de Granada', 0, 1, 'C')
-    pdf.set_font('Arial', 'I', 10)
-    pdf.set_text_color(102, 102, 102)
-    pdf.cell(0, 6, 'Para estudiantes del Curso Intensivo de Espanol', 0, 1, 'C')
-    pdf.ln(10)
-
-    # Contenido cultural
+@target('guia-cultural-granada', 'materials/guia-cultural-granada.pdf', group='conversacion')
+def cultural_guide():
+    """Guía cultural de Granada con frases útiles para turistas"""
     cultural_content = [
         {
             "title": "La Alhambra",
@@ -230,23 +156,6 @@ def create_cultural_guide():
         }
     ]
 
-    for section in cultural_content:
-        pdf.set_font('Arial', 'B', 12)
-        pdf.set_text_color(139, 69, 19)
-        pdf.cell(0, 8, section["title"], 0, 1)
-        pdf.ln(3)
-
-        pdf.set_font('Arial', '', 11)
-        pdf.set_text_color(0, 0, 0)
-        pdf.multi_cell(0, 6, section["content"])
-        pdf.ln(8)
-
-    # Frases útiles para turistas
-    pdf.set_font('Arial', 'B', 14)
-    pdf.set_text_color(0, 51, 102)
-    pdf.cell(0, 10, 'Frases Utiles para Turistas', 0, 1, 'C')
-    pdf.ln(5)
-
     useful_phrases = [
         ("Disculpe, ¿sabe cómo llegar a...?", "Excuse me, do you know how to get to...?"),
         ("¿Cuánto cuesta la entrada?", "How much is the admission?"),
@@ -258,21 +167,24 @@ def create_cultural_guide():
         ("¿Hay descuento para estudiantes?", "Is there a student discount?")
     ]
 
+    blocks = [
+        ('line', 'Guia Cultural de Granada', 'title'),
+        ('line', 'Para estudiantes del Curso Intensivo de Espanol', 'subtitle'),
+        ('space', 10),
+    ]
+    for section in cultural_content:
+        blocks += [('section', section["title"]), ('text', section["content"])]
+
+    blocks.append(('chapter', 'Frases Utiles para Turistas'))
     for spanish, english in useful_phrases:
-        pdf.set_font('Arial', 'B', 10)
-        pdf.set_text_color(0, 102, 204)
-        pdf.multi_cell(0, 6, f"ES: {spanish}")
-        pdf.set_font('Arial', 'I', 10)
-        pdf.set_text_color(102, 102, 102)
-        pdf.multi_cell(0, 6, f"EN: {english}")
-        pdf.ln(4)
+        blocks += [('text', f"ES: {spanish}", 'spanish'), ('text', f"EN: {english}", 'english')]
+
+    return {'title': 'Guia Cultural de Granada', 'theme': 'guia', 'blocks': blocks}
 
-    pdf.output('materials/guia-cultural-granada.pdf')
-    print("✅ Created professional guia-cultural-granada.pdf")
 
 if __name__ == "__main__":
     print("🎭 Creating conversation and cultural practice materials...")
-    create_conversation_practice()
-    create_cultural_guide()
+    build('conversaciones-practicas')
+    build('guia-cultural-granada')
     print("\n🌟 All interactive learning materials created successfully!")
-    print("📚 Students now have comprehensive conversation practice and cultural guides")
\ No newline at end of file
+    print("📚 Students now have comprehensive conversation practice and cultural guides")
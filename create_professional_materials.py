@@ -1,157 +1,19 @@
 #!/usr/bin/env python3
 """
 Crear PDFs profesionales para todos los materiales del curso
+
+Cada función devuelve la especificación de un documento; pdf_engine.py la
+maqueta con el tema 'profesional'. Para regenerar un solo material:
+
+    python pdf_engine.py vocabulario
 """
 
-from fpdf import FPDF
-import os
+from pdf_engine import build_group, target
 
-def clean_text(text):
-    """Limpiar caracteres especiales para PDF"""
-    replacements = {
-        '•': '-', 'á': 'a', 'é': 'e', 'í': 'i', 'ó': 'o', 'ú': 'u',
-        'Á': 'A', 'É': 'E', 'Í': 'I', 'Ó': 'O', 'Ú': 'U',
-        'ñ': 'n', 'Ñ': 'N', 'ü': 'u', 'Ü': 'U',
-        '¿': '?', '¡': '!', '·': '.'
-    }
 
-    for old, new in replacements.items():
-        text = text.replace(old, new)
-
-    text = text.encode('ascii', 'ignore').decode('ascii')
-    return text
-
-class ProfessionalPDF(FPDF):
-    def header(self):
-        # Encabezado elegante
-        self.set_font('Arial', 'B', 20)
-        self.set_text_color(0, 51, 102)
-        self.cell(0, 15, self.title, 0, 1, 'C')
-
-        self.set_font('Arial', 'I', 12)
-        self.set_text_color(102, 102, 102)
-        self.cell(0, 8, 'Curso Intensivo de Espanol - Nivel 3 CLM', 0, 1, 'C')
-
-        self.set_text_color(0, 153, 51)
-        self.set_font('Arial', 'B', 14)
-        self.cell(0, 10, 'Periodo: 6 - 27 de noviembre de 2025', 0, 1, 'C')
-
-        self.ln(10)
-
-    def footer(self):
-        # Pie de página elegante
-        self.set_y(-25)
-        self.set_font('Arial', 'I', 9)
-        self.set_text_color(128, 128, 128)
-        self.cell(0, 6, f'Pagina {self.page_no()} de {{nb}}', 0, 1, 'C')
-        self.cell(0, 6, 'Profesor: Javier Benitez Lainez | Aula: A2', 0, 1, 'C')
-        self.cell(0, 6, 'Universidad de Granada - Centro de Lenguas Modernas', 0, 0, 'C')
-
-    def chapter_title(self, title):
-        # Título de capítulo elegante
-        self.set_font('Arial', 'B', 16)
-        self.set_text_color(0, 51, 102)
-        self.cell(0, 10, clean_text(title), 0, 1, 'L')
-        self.ln(3)
-
-    def section_title(self, title):
-        # Título de sección
-        self.set_font('Arial', 'B', 13)
-        self.set_text_color(51, 102, 153)
-        self.cell(0, 8, clean_text(title), 0, 1, 'L')
-        self.ln(2)
-
-    def body_text(self, text):
-        # Texto del cuerpo
-        self.set_font('Arial', '', 11)
-        self.set_text_color(0, 0, 0)
-        self.multi_cell(0, 5, clean_text(text))
-        self.ln(3)
-
-    def highlight_box(self, title, content):
-        # Caja resaltada con altura automática
-        self.set_font('Arial', 'B', 12)
-        self.set_text_color(0, 51, 102)
-
-        # Calcular altura necesaria para el contenido
-        lines = self.multi_cell(0, 5, clean_text(title), 0, 'L')
-        title_height = len(title.split('\n')) * 5 + 5
-
-        content_lines = content.split('\n')
-        content_height = len(content_lines) * 5 + 10
-
-        total_height = title_height + content_height + 10
-
-        # Dibujar rectángulo con altura adecuada
-        self.set_fill_color(240, 248, 255)
-        self.set_draw_color(100, 149, 237)
-        self.rect(10, self.get_y(), 190, total_height, 'FD')
-
-        # Agregar texto dentro del rectángulo
-        self.set_y(self.get_y() + 3)
-        self.cell(0, 5, clean_text(title), 0, 1, 'L')
-
-        self.set_font('Arial', '', 11)
-        self.set_text_color(51, 51, 51)
-        for line in content_lines:
-            self.cell(0, 5, clean_text(line), 0, 1, 'L')
-
-        self.set_y(self.get_y() + 5)
-
-    def bullet_point(self, text):
-        # Punto de viñeta
-        self.set_font('Arial', '', 11)
-        self.set_text_color(0, 0, 0)
-        self.cell(10, 5, '-', 0, 0)
-        self.multi_cell(0, 5, clean_text(text))
-        self.ln(1)
-
-    def vocabulary_pair(self, spanish, english):
-        # Par de vocabulario
-        self.set_font('Arial', 'B', 11)
-        self.cell(80, 6, clean_text(spanish), 0, 0)
-        self.set_font('Arial', '', 10)
-        self.set_text_color(102, 102, 102)
-        self.cell(0, 6, f'- {english}', 0, 1)
-        self.set_text_color(0, 0, 0)
-
-def create_guia_curso_pdf():
-    """Crear guía del curso profesional con espaciado optimizado"""
-
-    pdf = ProfessionalPDF()
-    pdf.title = 'Guia del Curso'
-    pdf.alias_nb_pages()
-    pdf.add_page()
-    pdf.set_auto_page_break(auto=True, margin=25)
-
-    # Función para verificar espacio restante
-    def check_space(required=30):
-        if pdf.get_y() > 250:
-            pdf.add_page()
-            return True
-        return False
-
-    # Contenido principal
-    pdf.chapter_title('Guia del Curso Intensivo de Espanol')
-
-    pdf.highlight_box('Informacion del Curso',
-                     'Profesor: Javier Benitez Lainez\n'
-                     'Nivel: 3 CLM (A1.2-A2.1)\n'
-                     'Periodo: 6 - 27 de noviembre de 2025\n'
-                     'Duracion: 40 horas intensivas\n'
-                     'Ubicacion: Centro de Lenguas Modernas, UGR')
-
-    # Secciones optimizadas
-    pdf.section_title('1. Informacion General')
-    pdf.body_text('El Curso Intensivo de Espanol - Nivel 3 CLM esta disenado para estudiantes con '
-                 'conocimientos basicos de espanol que desean alcanzar un nivel A2.1 en un corto '
-                 'periodo de tiempo. Este curso de 40 horas combina clases teoricas con actividades '
-                 'practicas para desarrollar las cuatro competencias linguisticas: '
-                 'comprension auditiva, comprension lectora, expresion oral y expresion escrita.')
-
-    check_space()
-    pdf.section_title('2. Objetivos del Curso')
-    pdf.body_text('Al finalizar el curso, los estudiantes seran capaces de:')
+@target('guia-curso', 'materials/guia-curso.pdf', group='materiales')
+def guia_curso():
+    """Guía del curso profesional con espaciado optimizado"""
 
     objetivos = [
         'Participar en conversaciones basicas sobre temas cotidianos',
@@ -162,15 +24,6 @@ def create_guia_curso_pdf():
         'Apreciar aspectos culturales del mundo hispanohablante'
     ]
 
-    for i, objetivo in enumerate(objetivos):
-        if i > 0 and i % 3 == 0:  # Evitar grandes bloques
-            check_space()
-        pdf.bullet_point(objetivo)
-
-    check_space()
-    pdf.section_title('3. Metodologia')
-    pdf.body_text('El curso utiliza una metodologia comunicativa y participativa que incluye:')
-
     metodologia = [
         'Clases interactivas con enfasis en la comunicacion',
         'Actividades en parejas y pequenos grupos',
@@ -181,19 +34,6 @@ def create_guia_curso_pdf():
         'Feedback personalizado para cada estudiante'
     ]
 
-    for i, metodo in enumerate(metodologia):
-        if i > 0 and i % 3 == 0:
-            check_space()
-        pdf.bullet_point(metodo)
-
-    check_space()
-    pdf.section_title('4. Evaluacion')
-    pdf.body_text('La evaluacion del curso combina componentes continuos y finales:')
-
-    pdf.set_font('Arial', 'B', 11)
-    pdf.cell(0, 6, '60% - Evaluacion Continua:', 0, 1)
-    pdf.set_font('Arial', '', 11)
-
     continua = [
         'Participacion activa en clase (20%)',
         'Tareas y actividades diarias (15%)',
@@ -201,25 +41,11 @@ def create_guia_curso_pdf():
         'Proyecto final (10%)'
     ]
 
-    for item in continua:
-        pdf.bullet_point(f'{item}')
-
-    pdf.set_font('Arial', 'B', 11)
-    pdf.cell(0, 8, '40% - Evaluacion Final:', 0, 1)
-    pdf.set_font('Arial', '', 11)
-
     finales = [
         'Examen oral: Entrevista y conversacion (20%)',
         'Examen escrito: Comprension y expresion (20%)'
     ]
 
-    for item in finales:
-        pdf.bullet_point(f'{item}')
-
-    check_space()
-    pdf.section_title('5. Recursos y Materiales')
-    pdf.body_text('Los estudiantes tendran acceso a:')
-
     recursos = [
         'Libro de texto principal: "Espanol en Vivo" Nivel A2',
         'Material complementario digital y fisico',
@@ -229,16 +55,6 @@ def create_guia_curso_pdf():
         'Tutorias individuales con el profesor'
     ]
 
-    for i, recurso in enumerate(recursos):
-        if i > 0 and i % 3 == 0:
-            check_space()
-        pdf.bullet_point(recurso)
-
-    # Forzar nueva página para la sección de Horario y Asistencia
-    pdf.add_page()
-    pdf.section_title('6. Horario y Asistencia')
-    pdf.body_text('El curso se desarrolla en el siguiente horario:')
-
     horario = [
         'Lunes y Miercoles: 08:30 - 10:30 (2 horas por dia)',
         'Jueves: 08:30 - 12:30 (4 horas)',
@@ -247,16 +63,6 @@ def create_guia_curso_pdf():
         'Las faltas deben ser justificadas documentalmente'
     ]
 
-    for item in horario:
-        pdf.bullet_point(item)
-
-    pdf.add_page()
-    pdf.section_title('7. Contenido del Programa')
-
-    pdf.body_text('El curso esta organizado en tres modulos principales:')
-
-    # Modulo 1
-    pdf.section_title('Modulo 1: Comunicacion Basica (Sesiones 1-4)')
     modulo1 = [
         'Saludos, presentaciones y despedidas',
         'Alfabeto espanol y pronunciacion',
@@ -267,11 +73,6 @@ def create_guia_curso_pdf():
         'Rutina diaria y actividades habituales'
     ]
 
-    for tema in modulo1:
-        pdf.bullet_point(tema)
-
-    # Modulo 2
-    pdf.section_title('Modulo 2: Vida Cotidiana (Sesiones 5-8)')
     modulo2 = [
         'Comida, restaurantes y compras',
         'Transporte y direcciones',
@@ -283,11 +84,6 @@ def create_guia_curso_pdf():
         'Comunicacion telefonica y digital'
     ]
 
-    for tema in modulo2:
-        pdf.bullet_point(tema)
-
-    # Modulo 3
-    pdf.section_title('Modulo 3: Situaciones Especificas (Sesiones 9-12)')
     modulo3 = [
         'Trabajo y profesiones',
         'Educacion y estudios',
@@ -299,12 +95,6 @@ def create_guia_curso_pdf():
         'Proyectos integrados finales'
     ]
 
-    for tema in modulo3:
-        pdf.bullet_point(tema)
-
-    pdf.section_title('8. Informacion de Contacto')
-    pdf.body_text('Para cualquier duda o consulta:')
-
     contact = [
         'Profesor: Javier Benitez Lainez',
         'Ubicacion: Centro de Lenguas Modernas',
@@ -313,12 +103,6 @@ def create_guia_curso_pdf():
         'Sitio web: www.clm.ugr.es'
     ]
 
-    for info in contact:
-        pdf.bullet_point(info)
-
-    pdf.section_title('9. Recomendaciones')
-    pdf.body_text('Para aprovechar al maximo el curso:')
-
     recomendaciones = [
         'Asistir puntualmente a todas las clases',
         'Participar activamente en las actividades',
@@ -329,12 +113,6 @@ def create_guia_curso_pdf():
         'Ser constante en el estudio'
     ]
 
-    for recomendacion in recomendaciones:
-        pdf.bullet_point(recomendacion)
-
-    pdf.section_title('10. Politicas del Curso')
-    pdf.body_text('Normas importantes:')
-
     politicas = [
         'Uso obligatorio de espanol en clase',
         'Respeto hacia companeros y profesor',
@@ -344,36 +122,85 @@ def create_guia_curso_pdf():
         'Cumplimiento con las normas del CLM'
     ]
 
-    for politica in politicas:
-        pdf.bullet_point(politica)
-
-    pdf.set_y(pdf.get_y() + 20)
-    pdf.set_font('Arial', 'I', 11)
-    pdf.set_text_color(102, 102, 102)
-    pdf.cell(0, 8, 'Esta guia proporciona informacion basica del curso y puede estar', 0, 1, 'C')
-    pdf.cell(0, 6, 'sujeta a cambios segun las necesidades del grupo.', 0, 0, 'C')
-
-    pdf.output('materials/guia-curso.pdf')
-    print("✅ Created professional guia-curso.pdf")
-
-def create_vocabulario_esencial_pdf():
-    """Crear vocabulario esencial profesional"""
-
-    pdf = ProfessionalPDF()
-    pdf.title = 'Vocabulario Esencial'
-    pdf.alias_nb_pages()
-    pdf.add_page()
-
-    pdf.chapter_title('Vocabulario Esencial - Nivel A1.2-A2.1')
+    return {
+        'title': 'Guia del Curso',
+        'blocks': [
+            ('chapter', 'Guia del Curso Intensivo de Espanol'),
+            ('box', 'Informacion del Curso', [
+                'Profesor: Javier Benitez Lainez',
+                'Nivel: 3 CLM (A1.2-A2.1)',
+                'Periodo: 6 - 27 de noviembre de 2025',
+                'Duracion: 40 horas intensivas',
+                'Ubicacion: Centro de Lenguas Modernas, UGR',
+            ]),
+
+            ('section', '1. Informacion General'),
+            ('text', 'El Curso Intensivo de Espanol - Nivel 3 CLM esta disenado para estudiantes con '
+                     'conocimientos basicos de espanol que desean alcanzar un nivel A2.1 en un corto '
+                     'periodo de tiempo. Este curso de 40 horas combina clases teoricas con actividades '
+                     'practicas para desarrollar las cuatro competencias linguisticas: '
+                     'comprension auditiva, comprension lectora, expresion oral y expresion escrita.'),
+
+            ('ensure', 250),
+            ('section', '2. Objetivos del Curso'),
+            ('text', 'Al finalizar el curso, los estudiantes seran capaces de:'),
+            ('bullets', objetivos),
+
+            ('ensure', 250),
+            ('section', '3. Metodologia'),
+            ('text', 'El curso utiliza una metodologia comunicativa y participativa que incluye:'),
+            ('bullets', metodologia),
+
+            ('ensure', 250),
+            ('section', '4. Evaluacion'),
+            ('text', 'La evaluacion del curso combina componentes continuos y finales:'),
+            ('line', '60% - Evaluacion Continua:', 'label'),
+            ('bullets', continua),
+            ('line', '40% - Evaluacion Final:', 'label'),
+            ('bullets', finales),
+
+            ('ensure', 250),
+            ('section', '5. Recursos y Materiales'),
+            ('text', 'Los estudiantes tendran acceso a:'),
+            ('bullets', recursos),
+
+            # Horario y Asistencia siempre en página nueva
+            ('page',),
+            ('section', '6. Horario y Asistencia'),
+            ('text', 'El curso se desarrolla en el siguiente horario:'),
+            ('bullets', horario),
+
+            ('page',),
+            ('section', '7. Contenido del Programa'),
+            ('text', 'El curso esta organizado en tres modulos principales:'),
+            ('section', 'Modulo 1: Comunicacion Basica (Sesiones 1-4)'),
+            ('bullets', modulo1),
+            ('section', 'Modulo 2: Vida Cotidiana (Sesiones 5-8)'),
+            ('bullets', modulo2),
+            ('section', 'Modulo 3: Situaciones Especificas (Sesiones 9-12)'),
+            ('bullets', modulo3),
+
+            ('section', '8. Informacion de Contacto'),
+            ('text', 'Para cualquier duda o consulta:'),
+            ('bullets', contact),
+
+            ('section', '9. Recomendaciones'),
+            ('text', 'Para aprovechar al maximo el curso:'),
+            ('bullets', recomendaciones),
+
+            ('section', '10. Politicas del Curso'),
+            ('text', 'Normas importantes:'),
+            ('bullets', politicas),
+
+            ('note', ['Esta guia proporciona informacion basica del curso y puede estar',
+                      'sujeta a cambios segun las necesidades del grupo.']),
+        ],
+    }
 
-    pdf.highlight_box('Objetivo',
-                     'Este vocabulario cubre las palabras y expresiones mas importantes '
-                     'para alcanzar el nivel A2.1 en espanol. Esta organizado por temas '
-                     'utilidades para facilitar el aprendizaje.')
 
-    # Saludos y presentaciones
-    pdf.section_title('1. Saludos y Presentaciones')
-    pdf.body_text('Expresiones basicas para conocerse y comunicarse en espanol:')
+@target('vocabulario', 'materials/vocabulario.pdf', group='materiales')
+def vocabulario_esencial():
+    """Vocabulario esencial profesional"""
 
     saludos = [
         ('Hola', 'Hi / Hello'),
@@ -392,13 +219,6 @@ def create_vocabulario_esencial_pdf():
         ('Hasta manana', 'See you tomorrow')
     ]
 
-    for esp, ing in saludos:
-        pdf.vocabulary_pair(esp, ing)
-
-    pdf.add_page()
-    pdf.section_title('2. Tiempo y Fechas')
-    pdf.body_text('Expresiones relacionadas con tiempo, dias y fechas:')
-
     tiempo = [
         ('Ahora', 'Now'),
         ('Despues', 'Later'),
@@ -441,23 +261,6 @@ def create_vocabulario_esencial_pdf():
         ('Diciembre', 'December')
     ]
 
-    for esp, ing in tiempo:
-        pdf.vocabulary_pair(esp, ing)
-
-    pdf.ln(5)
-    pdf.section_title('Dias de la Semana')
-    for esp, ing in dias_semana:
-        pdf.vocabulary_pair(esp, ing)
-
-    pdf.ln(5)
-    pdf.section_title('Meses del Ano')
-    for esp, ing in meses:
-        pdf.vocabulary_pair(esp, ing)
-
-    pdf.add_page()
-    pdf.section_title('3. Familia y Relaciones')
-    pdf.body_text('Vocabulario para hablar sobre familia y relaciones personales:')
-
     familia = [
         ('La familia', 'The family'),
         ('Los padres', 'The parents'),
@@ -488,13 +291,6 @@ def create_vocabulario_esencial_pdf():
         ('Los amigos', 'The friends')
     ]
 
-    for esp, ing in familia:
-        pdf.vocabulary_pair(esp, ing)
-
-    pdf.add_page()
-    pdf.section_title('4. Comida y Bebida')
-    pdf.body_text('Vocabulario relacionado con comida, restaurantes y bebidas:')
-
     comidas_dia = [
         ('El desayuno', 'Breakfast'),
         ('La comida / almuerzo', 'Lunch'),
@@ -527,18 +323,6 @@ def create_vocabulario_esencial_pdf():
         ('La sal', 'Salt')
     ]
 
-    for esp, ing in comidas_dia:
-        pdf.vocabulary_pair(esp, ing)
-
-    pdf.ln(5)
-    pdf.section_title('Alimentos y Bebidas')
-    for esp, ing in alimentos:
-        pdf.vocabulary_pair(esp, ing)
-
-    pdf.add_page()
-    pdf.section_title('5. Lugares y Transporte')
-    pdf.body_text('Vocabulario para lugares y medios de transporte:')
-
     lugares = [
         ('La casa', 'House / Home'),
         ('El apartamento', 'Apartment'),
@@ -577,18 +361,6 @@ def create_vocabulario_esencial_pdf():
         ('Viajar', 'To travel')
     ]
 
-    for esp, ing in lugares:
-        pdf.vocabulary_pair(esp, ing)
-
-    pdf.ln(5)
-    pdf.section_title('Transporte')
-    for esp, ing in transporte:
-        pdf.vocabulary_pair(esp, ing)
-
-    pdf.add_page()
-    pdf.section_title('6. Actividades y Tiempo Libre')
-    pdf.body_text('Vocabulario para actividades y tiempo libre:')
-
     actividades = [
         ('Trabajar', 'To work'),
         ('Estudiar', 'To study'),
@@ -630,18 +402,6 @@ def create_vocabulario_esencial_pdf():
         ('La fiesta', 'Party')
     ]
 
-    for esp, ing in actividades:
-        pdf.vocabulary_pair(esp, ing)
-
-    pdf.ln(5)
-    pdf.section_title('Tiempo Libre y Entretenimiento')
-    for esp, ing in tiempo_libre:
-        pdf.vocabulary_pair(esp, ing)
-
-    pdf.add_page()
-    pdf.section_title('7. Adjetivos Utiles')
-    pdf.body_text('Adjetivos comunes para describir personas y cosas:')
-
     adjetivos_personalidad = [
         ('Simpatico/a', 'Nice / Friendly'),
         ('Antipatico/a', 'Unfriendly'),
@@ -699,24 +459,6 @@ def create_vocabulario_esencial_pdf():
         ('Sucio/a', 'Dirty')
     ]
 
-    pdf.section_title('Personalidad y Caracter')
-    for esp, ing in adjetivos_personalidad:
-        pdf.vocabulary_pair(esp, ing)
-
-    pdf.ln(5)
-    pdf.section_title('Descripcion Fisica')
-    for esp, ing in adjetivos_fisicos:
-        pdf.vocabulary_pair(esp, ing)
-
-    pdf.ln(5)
-    pdf.section_title('Calidad y Estados')
-    for esp, ing in adjetivos_calidad:
-        pdf.vocabulary_pair(esp, ing)
-
-    pdf.add_page()
-    pdf.section_title('8. Verbos Irregulares Importantes')
-    pdf.body_text('Verbos irregulares mas comunes en espanol:')
-
     ser_estar = [
         ('Ser - soy, eres, es, somos, son', 'To be (permanent characteristics)'),
         ('Estar - estoy, estas, esta, estamos, estan', 'To be (temporary states/location)')
@@ -745,7 +487,7 @@ def create_vocabulario_esencial_pdf():
         ('Poder + infinitivo', 'To be able to')
     ]
 
-    # Presentar cada irregular con conjugacion basica
+    # Cada irregular con su conjugacion basica
     verbos_irregulares = [
         ('Decir', 'digo, dices, dice, decimos, dicen', 'To say / to tell'),
         ('Poner', 'pongo, pones, pone, ponemos, ponen', 'To put / to place'),
@@ -760,42 +502,6 @@ def create_vocabulario_esencial_pdf():
         ('Oir', 'oigo, oyes, oye, oimos, oyen', 'To hear')
     ]
 
-    # Ser y Estar
-    pdf.vocabulary_pair('Ser', 'To be (permanent)')
-    pdf.vocabulary_pair('Estar', 'To be (temporary)')
-    pdf.ln(3)
-    for esp, ing in ser_estar:
-        pdf.vocabulary_pair(esp, ing)
-
-    pdf.ln(5)
-    pdf.vocabulary_pair('Tener', 'To have')
-    for esp, ing in tener:
-        pdf.vocabulary_pair(esp, ing)
-
-    pdf.ln(5)
-    pdf.vocabulary_pair('Ir', 'To go')
-    for esp, ing in ir:
-        pdf.vocabulary_pair(esp, ing)
-
-    pdf.ln(5)
-    pdf.vocabulary_pair('Hacer', 'To do / To make')
-    for esp, ing in hacer:
-        pdf.vocabulary_pair(esp, ing)
-
-    pdf.ln(5)
-    pdf.vocabulary_pair('Poder', 'To be able to / Can')
-    for esp, ing in poder:
-        pdf.vocabulary_pair(esp, ing)
-
-    pdf.add_page()
-    pdf.section_title('Otros Verbos Irregulares')
-
-    for verb, conjugacion, meaning in verbos_irregulares:
-        pdf.vocabulary_pair(f'{verb} - {conjugacion}', meaning)
-
-    pdf.section_title('9. Palabras de Transicion')
-    pdf.body_text('Conectores y palabras de transicion:')
-
     transicion = [
         ('Y', 'And'),
         ('O', 'Or'),
@@ -822,13 +528,6 @@ def create_vocabulario_esencial_pdf():
         ('Encima de', 'On top of')
     ]
 
-    for esp, ing in transicion:
-        pdf.vocabulary_pair(esp, ing)
-
-    pdf.add_page()
-    pdf.section_title('10. Expresiones Utiles')
-    pdf.body_text('Expresiones comunes y frases utiles:')
-
     expresiones = [
         ('Por favor', 'Please'),
         ('Gracias', 'Thank you'),
@@ -855,35 +554,110 @@ def create_vocabulario_esencial_pdf():
         ('Estoy aprendiendo espanol', 'I am learning Spanish')
     ]
 
-    for esp, ing in expresiones:
-        pdf.vocabulary_pair(esp, ing)
-
-    pdf.set_y(pdf.get_y() + 20)
-    pdf.set_font('Arial', 'I', 11)
-    pdf.set_text_color(102, 102, 102)
-    pdf.cell(0, 8, 'Este vocabulario cubre las palabras mas importantes para', 0, 1, 'C')
-    pdf.cell(0, 6, 'el nivel A2.1. Practica regularmente para dominarlas.', 0, 0, 'C')
-
-    pdf.output('materials/vocabulario.pdf')
-    print("✅ Created professional vocabulario.pdf")
-
-def create_frases_utiles_pdf():
-    """Crear frases útiles profesional"""
-
-    pdf = ProfessionalPDF()
-    pdf.title = 'Frases Utiles'
-    pdf.alias_nb_pages()
-    pdf.add_page()
-
-    pdf.chapter_title('Frases Utiles en Espanol')
+    return {
+        'title': 'Vocabulario Esencial',
+        'blocks': [
+            ('chapter', 'Vocabulario Esencial - Nivel A1.2-A2.1'),
+            ('box', 'Objetivo', [
+                'Este vocabulario cubre las palabras y expresiones mas importantes '
+                'para alcanzar el nivel A2.1 en espanol. Esta organizado por temas '
+                'utilidades para facilitar el aprendizaje.',
+            ]),
+
+            ('section', '1. Saludos y Presentaciones'),
+            ('text', 'Expresiones basicas para conocerse y comunicarse en espanol:'),
+            ('pairs', saludos),
+
+            ('page',),
+            ('section', '2. Tiempo y Fechas'),
+            ('text', 'Expresiones relacionadas con tiempo, dias y fechas:'),
+            ('pairs', tiempo),
+            ('space', 5),
+            ('section', 'Dias de la Semana'),
+            ('pairs', dias_semana),
+            ('space', 5),
+            ('section', 'Meses del Ano'),
+            ('pairs', meses),
+
+            ('page',),
+            ('section', '3. Familia y Relaciones'),
+            ('text', 'Vocabulario para hablar sobre familia y relaciones personales:'),
+            ('pairs', familia),
+
+            ('page',),
+            ('section', '4. Comida y Bebida'),
+            ('text', 'Vocabulario relacionado con comida, restaurantes y bebidas:'),
+            ('pairs', comidas_dia),
+            ('space', 5),
+            ('section', 'Alimentos y Bebidas'),
+            ('pairs', alimentos),
+
+            ('page',),
+            ('section', '5. Lugares y Transporte'),
+            ('text', 'Vocabulario para lugares y medios de transporte:'),
+            ('pairs', lugares),
+            ('space', 5),
+            ('section', 'Transporte'),
+            ('pairs', transporte),
+
+            ('page',),
+            ('section', '6. Actividades y Tiempo Libre'),
+            ('text', 'Vocabulario para actividades y tiempo libre:'),
+            ('pairs', actividades),
+            ('space', 5),
+            ('section', 'Tiempo Libre y Entretenimiento'),
+            ('pairs', tiempo_libre),
+
+            ('page',),
+            ('section', '7. Adjetivos Utiles'),
+            ('text', 'Adjetivos comunes para describir personas y cosas:'),
+            ('section', 'Personalidad y Caracter'),
+            ('pairs', adjetivos_personalidad),
+            ('space', 5),
+            ('section', 'Descripcion Fisica'),
+            ('pairs', adjetivos_fisicos),
+            ('space', 5),
+            ('section', 'Calidad y Estados'),
+            ('pairs', adjetivos_calidad),
+
+            ('page',),
+            ('section', '8. Verbos Irregulares Importantes'),
+            ('text', 'Verbos irregulares mas comunes en espanol:'),
+            ('pairs', [('Ser', 'To be (permanent)'), ('Estar', 'To be (temporary)')]),
+            ('space', 3),
+            ('pairs', ser_estar),
+            ('space', 5),
+            ('pairs', [('Tener', 'To have')] + tener),
+            ('space', 5),
+            ('pairs', [('Ir', 'To go')] + ir),
+            ('space', 5),
+            ('pairs', [('Hacer', 'To do / To make')] + hacer),
+            ('space', 5),
+            ('pairs', [('Poder', 'To be able to / Can')] + poder),
+
+            ('page',),
+            ('section', 'Otros Verbos Irregulares'),
+            ('pairs', [(f'{verb} - {conjugacion}', meaning)
+                       for verb, conjugacion, meaning in verbos_irregulares]),
+
+            ('section', '9. Palabras de Transicion'),
+            ('text', 'Conectores y palabras de transicion:'),
+            ('pairs', transicion),
+
+            ('page',),
+            ('section', '10. Expresiones Utiles'),
+            ('text', 'Expresiones comunes y frases utiles:'),
+            ('pairs', expresiones),
+
+            ('note', ['Este vocabulario cubre las palabras mas importantes para',
+                      'el nivel A2.1. Practica regularmente para dominarlas.']),
+        ],
+    }
 
-    pdf.highlight_box('Objetivo',
-                     'Coleccion de frases esenciales para comunicarse eficazmente '
-                     'en espanol en diferentes situaciones de la vida diaria.')
 
-    # Frases de presentacion
-    pdf.section_title('1. Presentaciones')
-    pdf.body_text('Frases para presentarse y conocer a otras personas:')
+@target('frases-utiles', 'materials/frases-utiles.pdf', group='materiales')
+def frases_utiles():
+    """Frases útiles profesional"""
 
     presentaciones = [
         'Hola, me llamo [nombre].',
@@ -902,13 +676,6 @@ def create_frases_utiles_pdf():
         '¿Vives solo o con familia?'
     ]
 
-    for frase in presentaciones:
-        pdf.bullet_point(frase)
-
-    # Frases en restaurante
-    pdf.section_title('2. En el Restaurante')
-    pdf.body_text('Frases utiles para comer fuera de casa:')
-
     restaurante = [
         'Buenos dias, mesa para [numero] personas, por favor.',
         '¿Que recomienda para hoy?',
@@ -931,13 +698,6 @@ def create_frases_utiles_pdf():
         '¿Aceptan tarjetas de credito?'
     ]
 
-    for frase in restaurante:
-        pdf.bullet_point(frase)
-
-    pdf.add_page()
-    pdf.section_title('3. Haciendo Compras')
-    pdf.body_text('Frases para comprar en tiendas:')
-
     compras = [
         'Busco...',
         '¿Dónde encuentro...?',
@@ -957,12 +717,6 @@ def create_frases_utiles_pdf():
         '¿Hay promociones especiales?'
     ]
 
-    for frase in compras:
-        pdf.bullet_point(frase)
-
-    pdf.section_title('4. Pidiendo Direcciones')
-    pdf.body_text('Frases para orientarse en la ciudad:')
-
     direcciones = [
         'Disculpe, ¿podría ayudarme?',
         '¿Dónde está [lugar]?',
@@ -982,13 +736,6 @@ def create_frases_utiles_pdf():
         '¿Dónde está la parada de metro más cercana?'
     ]
 
-    for frase in direcciones:
-        pdf.bullet_point(frase)
-
-    pdf.add_page()
-    pdf.section_title('5. En el Hotel y Transporte')
-    pdf.body_text('Frases para alojamiento y transporte:')
-
     hotel = [
         'Tengo una reserva a nombre de...',
         '¿Hay una habitación disponible?',
@@ -1006,12 +753,6 @@ def create_frases_utiles_pdf():
         '¿Dónde puedo encontrar...?'
     ]
 
-    for frase in hotel:
-        pdf.bullet_point(frase)
-
-    pdf.ln(5)
-    pdf.section_title('Transporte')
-
     transporte = [
         '¿Dónde está la estación de autobús?',
         '¿Qué autobús va a...?',
@@ -1028,13 +769,6 @@ def create_frases_utiles_pdf():
         '¿Hay servicio nocturno?'
     ]
 
-    for frase in transporte:
-        pdf.bullet_point(frase)
-
-    pdf.add_page()
-    pdf.section_title('6. En Situaciones Medicas')
-    pdf.body_text('Frases para situaciones médicas:')
-
     medico = [
         'No me siento bien.',
         'Me duele [parte del cuerpo].',
@@ -1056,12 +790,6 @@ def create_frases_utiles_pdf():
         '¿Habla inglés?'
     ]
 
-    for frase in medico:
-        pdf.bullet_point(frase)
-
-    pdf.section_title('7. En el Trabajo')
-    pdf.body_text('Frases útiles en contextos laborales:')
-
     trabajo = [
         'Buenos dias, compañeros.',
         '¿Cómo está el proyecto?',
@@ -1079,13 +807,6 @@ def create_frases_utiles_pdf():
         '¿Cuál es el próximo paso?'
     ]
 
-    for frase in trabajo:
-        pdf.bullet_point(frase)
-
-    pdf.add_page()
-    pdf.section_title('8. En Situaciones Sociales')
-    pdf.body_text('Frases para interacciones sociales:')
-
     sociales = [
         '¿Cómo estás?',
         '¿Qué tal todo?',
@@ -1105,12 +826,6 @@ def create_frases_utiles_pdf():
         '¿Hay algo nuevo interesante?'
     ]
 
-    for frase in sociales:
-        pdf.bullet_point(frase)
-
-    pdf.section_title('9. Frases de Emergencia')
-    pdf.body_text('Frases cruciales para emergencias:')
-
     emergencia = [
         '¡Ayuda!',
         '¡Socorro!',
@@ -1132,13 +847,6 @@ def create_frases_utiles_pdf():
         '¡Corra!'
     ]
 
-    for frase in emergencia:
-        pdf.bullet_point(frase)
-
-    pdf.add_page()
-    pdf.section_title('10. Frases Educativas')
-    pdf.body_text('Frases útiles para estudiantes de español:')
-
     educativas = [
         'No entiendo esta palabra.',
         '¿Puede repetir, por favor?',
@@ -1160,12 +868,6 @@ def create_frases_utiles_pdf():
         '¿Podría darme más ejercicios?'
     ]
 
-    for frase in educativas:
-        pdf.bullet_point(frase)
-
-    pdf.section_title('11. Expresiones de Tiempo y Clima')
-    pdf.body_text('Frases sobre tiempo y clima:')
-
     tiempo_clima = [
         'Hace buen tiempo hoy.',
         'Está lloviendo.',
@@ -1185,36 +887,72 @@ def create_frases_utiles_pdf():
         '¿Qué tiempo hace en tu país?'
     ]
 
-    for frase in tiempo_clima:
-        pdf.bullet_point(frase)
-
-    pdf.set_y(pdf.get_y() + 20)
-    pdf.set_font('Arial', 'I', 11)
-    pdf.set_text_color(102, 102, 102)
-    pdf.cell(0, 8, 'Estas frases cubren las situaciones mas comunes en la vida diaria.', 0, 1, 'C')
-    pdf.cell(0, 6, 'Practícalas regularmente para mejorar tu fluidez en espanol.', 0, 0, 'C')
-
-    pdf.output('materials/frases-utiles.pdf')
-    print("✅ Created professional frases-utiles.pdf")
-
-def create_verbos_irregulares_pdf():
-    """Crear verbos irregulares profesional"""
-
-    pdf = ProfessionalPDF()
-    pdf.title = 'Verbos Irregulares'
-    pdf.alias_nb_pages()
-    pdf.add_page()
-
-    pdf.chapter_title('Verbos Irregulares Espanoles')
+    return {
+        'title': 'Frases Utiles',
+        'blocks': [
+            ('chapter', 'Frases Utiles en Espanol'),
+            ('box', 'Objetivo', [
+                'Coleccion de frases esenciales para comunicarse eficazmente '
+                'en espanol en diferentes situaciones de la vida diaria.',
+            ]),
+
+            ('section', '1. Presentaciones'),
+            ('text', 'Frases para presentarse y conocer a otras personas:'),
+            ('bullets', presentaciones),
+            ('section', '2. En el Restaurante'),
+            ('text', 'Frases utiles para comer fuera de casa:'),
+            ('bullets', restaurante),
+
+            ('page',),
+            ('section', '3. Haciendo Compras'),
+            ('text', 'Frases para comprar en tiendas:'),
+            ('bullets', compras),
+            ('section', '4. Pidiendo Direcciones'),
+            ('text', 'Frases para orientarse en la ciudad:'),
+            ('bullets', direcciones),
+
+            ('page',),
+            ('section', '5. En el Hotel y Transporte'),
+            ('text', 'Frases para alojamiento y transporte:'),
+            ('bullets', hotel),
+            ('space', 5),
+            ('section', 'Transporte'),
+            ('bullets', transporte),
+
+            ('page',),
+            ('section', '6. En Situaciones Medicas'),
+            ('text', 'Frases para situaciones médicas:'),
+            ('bullets', medico),
+            ('section', '7. En el Trabajo'),
+            ('text', 'Frases útiles en contextos laborales:'),
+            ('bullets', trabajo),
+
+            ('page',),
+            ('section', '8. En Situaciones Sociales'),
+            ('text', 'Frases para interacciones sociales:'),
+            ('bullets', sociales),
+            ('section', '9. Frases de Emergencia'),
+            ('text', 'Frases cruciales para emergencias:'),
+            ('bullets', emergencia),
+
+            ('page',),
+            ('section', '10. Frases Educativas'),
+            ('text', 'Frases útiles para estudiantes de español:'),
+            ('bullets', educativas),
+            ('section', '11. Expresiones de Tiempo y Clima'),
+            ('text', 'Frases sobre tiempo y clima:'),
+            ('bullets', tiempo_clima),
+
+            ('note', ['Estas frases cubren las situaciones mas comunes en la vida diaria.',
+                      'Practícalas regularmente para mejorar tu fluidez en espanol.']),
+        ],
+    }
 
-    pdf.highlight_box('Objetivo',
-                     'Guía completa de los verbos irregulares mas importantes '
-                     'del espanol con conjugaciones, usos y ejemplos prácticos.')
 
-    pdf.section_title('SER vs ESTAR')
-    pdf.body_text('Los dos verbos para "to be" en espanol:')
+@target('verbos', 'materials/verbos.pdf', group='materiales')
+def verbos_irregulares():
+    """Verbos irregulares profesional"""
 
-    pdf.body_text('SER - Características permanentes, identidad, profesión, nacionalidad:')
     ser_ejemplos = [
         'Soy estudiante.',
         'Eres español.',
@@ -1226,10 +964,6 @@ def create_verbos_irregulares_pdf():
         'El verano es caliente.'
     ]
 
-    for ejemplo in ser_ejemplos:
-        pdf.bullet_point(ejemplo)
-
-    pdf.body_text('ESTAR - Ubicación, estado temporal, emociones, condiciones:')
     estar_ejemplos = [
         'Estoy en casa.',
         'Estás cansado.',
@@ -1241,23 +975,6 @@ def create_verbos_irregulares_pdf():
         'Los niños están en la escuela.'
     ]
 
-    for ejemplo in estar_ejemplos:
-        pdf.bullet_point(ejemplo)
-
-    # Presente simple
-    pdf.add_page()
-    pdf.section_title('Presente Simple - Tiempos y Conjugaciones')
-
-    pdf.set_font('Arial', 'B', 12)
-    pdf.set_text_color(0, 51, 102)
-    pdf.cell(0, 8, 'Presente Indicativo (Acciones habituales)', 0, 1, 'L')
-    pdf.set_text_color(0, 0, 0)
-
-    # SER
-    pdf.set_font('Arial', 'B', 11)
-    pdf.cell(0, 8, 'SER:', 0, 1, 'L')
-    pdf.set_font('Arial', '', 11)
-
     ser_presente = [
         'Yo soy',
         'Tú eres',
@@ -1267,15 +984,6 @@ def create_verbos_irregulares_pdf():
         'Ellos/ellas/ustedes son'
     ]
 
-    for forma in ser_presente:
-        pdf.cell(80, 6, forma, 0, 1)
-
-    pdf.ln(5)
-    # ESTAR
-    pdf.set_font('Arial', 'B', 11)
-    pdf.cell(0, 8, 'ESTAR:', 0, 1, 'L')
-    pdf.set_font('Arial', '', 11)
-
     estar_presente = [
         'Yo estoy',
         'Tú estás',
@@ -1285,15 +993,6 @@ def create_verbos_irregulares_pdf():
         'Ellos/ellas/ustedes están'
     ]
 
-    for forma in estar_presente:
-        pdf.cell(80, 6, forma, 0, 1)
-
-    # TENER
-    pdf.ln(5)
-    pdf.set_font('Arial', 'B', 11)
-    pdf.cell(0, 8, 'TENER:', 0, 1, 'L')
-    pdf.set_font('Arial', '', 11)
-
     tener_presente = [
         'Yo tengo',
         'Tú tienes',
@@ -1303,13 +1002,6 @@ def create_verbos_irregulares_pdf():
         'Ellos/ellas/ustedes tienen'
     ]
 
-    for forma in tener_presente:
-        pdf.cell(80, 6, forma, 0, 1)
-
-    # Verbos irregulares principales
-    pdf.add_page()
-    pdf.section_title('Verbos Irregulares Principales - Presente')
-
     verbos_irregulares = [
         {
             'verbo': 'IR (To go)',
@@ -1403,40 +1095,17 @@ def create_verbos_irregulares_pdf():
         }
     ]
 
+    # Ficha de cada verbo: conjugacion, ejemplos y nota
+    fichas = []
     for verbo_info in verbos_irregulares:
-        pdf.set_font('Arial', 'B', 12)
-        pdf.set_text_color(0, 51, 102)
-        pdf.cell(0, 8, f'{verbo_info["verbo"]}:', 0, 1, 'L')
-        pdf.set_text_color(0, 0, 0)
-        pdf.set_font('Arial', '', 10)
-        pdf.set_text_color(102, 102, 102)
-
-        # Conjugaciones
-        conjugacion_text = ', '.join(verbo_info['presente'])
-        pdf.multi_cell(0, 6, f'Presente: {conjugacion_text}', 0, 1)
-
-        # Usos
-        pdf.set_font('Arial', 'I', 10)
-        pdf.set_text_color(0, 102, 0)
-        pdf.cell(0, 6, 'Ejemplos:', 0, 1, 'L')
-        pdf.set_text_color(0, 0, 0)
-        for uso in verbo_info['usos']:
-            pdf.bullet_point(uso)
-
-        # Nota
-        pdf.set_font('Arial', 'I', 9)
-        pdf.set_text_color(102, 102, 102)
-        pdf.set_x(20)
-        pdf.multi_cell(0, 5, f'Nota: {verbo_info["nota"]}', 0, 1)
-
-        pdf.ln(8)
-
-    pdf.add_page()
-    pdf.section_title('Participio Pasado y Participio Pasado')
-
-    pdf.set_font('Arial', 'B', 11)
-    pdf.cell(0, 8, 'Principales participios pasados:', 0, 1, 'L')
-    pdf.set_font('Arial', '', 10)
+        fichas += [
+            ('line', f'{verbo_info["verbo"]}:', 'heading'),
+            ('text', f'Presente: {", ".join(verbo_info["presente"])}', 'muted'),
+            ('line', 'Ejemplos:', 'caption'),
+            ('bullets', verbo_info['usos']),
+            ('text', f'Nota: {verbo_info["nota"]}', 'footnote'),
+            ('space', 8),
+        ]
 
     participios = [
         ('SER', 'Fui, fuiste, fue, fuimos, fuisteis, fueron'),
@@ -1454,14 +1123,6 @@ def create_verbos_irregulares_pdf():
         ('CONOCER', 'Conocí, conociste, conoció, conocimos, conocisteis, conocieron')
     ]
 
-    for verbo, participio in participios:
-        pdf.vocabulary_pair(verbo, participio)
-
-    pdf.add_page()
-    pdf.section_title('Futuro Simple')
-
-    pdf.body_text('El futuro simple se forma con el presente del IR + A + infinitivo:')
-
     futuro_ejemplos = [
         'Voy a estudiar mañana.',
         '¿Vas a venir a la fiesta?',
@@ -1475,12 +1136,6 @@ def create_verbos_irregulares_pdf():
         'Vamos a tener una reunión importante.'
     ]
 
-    for ejemplo in futuro_ejemplos:
-        pdf.bullet_point(ejemplo)
-
-    pdf.section_title('Condicional Simple')
-    pdf.body_text('Expresaría condicional con formas especiales:')
-
     condicional = [
         'Si tuviera dinero, compraría un coche.',
         'Si estuviera en casa, llamaría por teléfono.',
@@ -1493,12 +1148,6 @@ def create_verbos_irregulares_pdf():
         'Si supieras italiano, entenderíamos la conversación.'
     ]
 
-    for ejemplo in condicional:
-        pdf.bullet_point(ejemplo)
-
-    pdf.section_title('Verbos con cambio radical')
-    pdf.body_text('Verbos con cambios en la raíz en algunas formas:')
-
     cambios_radical = [
         ('EMPEZAR - empiezo, empiezas, empieza, empezamos, empiezan', 'Empezamos a las 9.'),
         ('ENTENDER - entiendo, entiendes, entiende, entendemos, entienden', '¿Entiendes la lección?'),
@@ -1510,17 +1159,6 @@ def create_verbos_irregulares_pdf():
         ('PREFERIR - prefiero, prefieres, prefiere, preferimos, prefieren', 'Prefiero el chocolate.')
     ]
 
-    for verbo, info in cambios_radical:
-        if isinstance(info, list):
-            pdf.vocabulary_pair(verbo, ', '.join(info))
-            pdf.bullet_point(f'Ejemplo: {info[0]}')
-        else:
-            pdf.vocabulary_pair(verbo, info)
-
-    pdf.add_page()
-    pdf.section_title('Verbos con cambio vocálico')
-    pdf.body_text('Verbos con cambios en la vocal en algunas personas:')
-
     cambios_vocalicos = [
         ('PODER - puedo, puedes, puede, podemos, pueden', 'Podemos ayudarte.'),
         ('DORMIR - duermo, duermes, duerme, dormimos, duermen', 'Duermo bien cada noche.'),
@@ -1531,13 +1169,6 @@ def create_verbos_irregulares_pdf():
         ('VOLVER - vuelvo, vuelves, vuelve, volvemos, vuelven', 'Vuelvo a mi país cada año.')
     ]
 
-    for verbo, info in cambios_vocalicos:
-        pdf.vocabulary_pair(verbo, info)
-
-    pdf.add_page()
-    pdf.section_title('Verbos con cambio consonántico')
-    pdf.body_text('Verbos con cambios en la consonante en algunas formas:')
-
     cambios_consonanticos = [
         ('CONOCER - conozco, conoces, conoce, conocemos, conocen', 'Conozco muy bien esta ciudad.'),
         ('CONDUCIR - conduzco, conduces, conduce, conducimos, conducen', 'Conduzco mi coche al trabajo.'),
@@ -1549,12 +1180,6 @@ def create_verbos_irregulares_pdf():
         ('ADQUIRIR - adquiero, adquieres, adquiere, adquirimos, adquieren', 'Adquirimos experiencia con el tiempo.')
     ]
 
-    for verbo, info in cambios_consonanticos:
-        pdf.vocabulary_pair(verbo, info)
-
-    pdf.section_title('Verbos con irregularidades múltiples')
-    pdf.body_text('Verbos con cambios irregulares en varias formas:')
-
     multiples = [
         ('TENER', 'tengo, tienes, tiene, tenemos, tienen; tuve, tuviste, tuvo, tuvimos, tuvieron'),
         ('ESTAR', 'estoy, estás, está, estamos, están; estuve, estuviste, estuvo, estuvimos, estuvieron'),
@@ -1563,36 +1188,89 @@ def create_verbos_irregulares_pdf():
         ('CABER', 'quepo, cabes, cabe, cabemos, caben; cupe, cupiste, cupo, cupimos, cupieron')
     ]
 
-    for verbo, info in multiples:
-        pdf.vocabulary_pair(verbo, info)
-
-    pdf.set_y(pdf.get_y() + 20)
-    pdf.set_font('Arial', 'I', 11)
-    pdf.set_text_color(102, 102, 102)
-    pdf.cell(0, 8, 'Esta guía cubre los verbos irregulares mas importantes del espanol.', 0, 1, 'C')
-    pdf.cell(0, 6, 'Practica las conjugaciones regularmente para dominarlos.', 0, 0, 'C')
+    return {
+        'title': 'Verbos Irregulares',
+        'blocks': [
+            ('chapter', 'Verbos Irregulares Espanoles'),
+            ('box', 'Objetivo', [
+                'Guía completa de los verbos irregulares mas importantes '
+                'del espanol con conjugaciones, usos y ejemplos prácticos.',
+            ]),
+
+            ('section', 'SER vs ESTAR'),
+            ('text', 'Los dos verbos para "to be" en espanol:'),
+            ('text', 'SER - Características permanentes, identidad, profesión, nacionalidad:'),
+            ('bullets', ser_ejemplos),
+            ('text', 'ESTAR - Ubicación, estado temporal, emociones, condiciones:'),
+            ('bullets', estar_ejemplos),
+
+            ('page',),
+            ('section', 'Presente Simple - Tiempos y Conjugaciones'),
+            ('line', 'Presente Indicativo (Acciones habituales)', 'heading'),
+            ('line', 'SER:', 'label'),
+            ('lines', ser_presente),
+            ('space', 5),
+            ('line', 'ESTAR:', 'label'),
+            ('lines', estar_presente),
+            ('space', 5),
+            ('line', 'TENER:', 'label'),
+            ('lines', tener_presente),
+
+            ('page',),
+            ('section', 'Verbos Irregulares Principales - Presente'),
+            *fichas,
+
+            ('page',),
+            ('section', 'Participio Pasado y Participio Pasado'),
+            ('line', 'Principales participios pasados:', 'label'),
+            ('pairs', participios),
+
+            ('page',),
+            ('section', 'Futuro Simple'),
+            ('text', 'El futuro simple se forma con el presente del IR + A + infinitivo:'),
+            ('bullets', futuro_ejemplos),
+            ('section', 'Condicional Simple'),
+            ('text', 'Expresaría condicional con formas especiales:'),
+            ('bullets', condicional),
+            ('section', 'Verbos con cambio radical'),
+            ('text', 'Verbos con cambios en la raíz en algunas formas:'),
+            ('pairs', cambios_radical),
+
+            ('page',),
+            ('section', 'Verbos con cambio vocálico'),
+            ('text', 'Verbos con cambios en la vocal en algunas personas:'),
+            ('pairs', cambios_vocalicos),
+
+            ('page',),
+            ('section', 'Verbos con cambio consonántico'),
+            ('text', 'Verbos con cambios en la consonante en algunas formas:'),
+            ('pairs', cambios_consonanticos),
+            ('section', 'Verbos con irregularidades múltiples'),
+            ('text', 'Verbos con cambios irregulares en varias formas:'),
+            ('pairs', multiples),
+
+            ('note', ['Esta guía cubre los verbos irregulares mas importantes del espanol.',
+                      'Practica las conjugaciones regularmente para dominarlos.']),
+        ],
+    }
 
-    pdf.output('materials/verbos.pdf')
-    print("✅ Created professional verbos.pdf")
 
-def create_ejercicios_practicos_pdf():
-    """Crear ejercicios prácticos profesional"""
+def respuesta(valor):
+    """Texto de la solución; una tupla son respuestas alternativas"""
+    return ' o '.join(valor) if isinstance(valor, tuple) else valor
 
-    pdf = ProfessionalPDF()
-    pdf.title = 'Ejercicios Practicos'
-    pdf.alias_nb_pages()
-    pdf.add_page()
 
-    pdf.chapter_title('Ejercicios Practicos de Espanol')
+def con_respuestas(ejercicios):
+    """Cada enunciado seguido de su respuesta en rojo"""
+    blocks = []
+    for ejercicio, solucion in ejercicios:
+        blocks += [('line', ejercicio), ('line', f'Respuesta: {respuesta(solucion)}', 'answer')]
+    return blocks
 
-    pdf.highlight_box('Objetivo',
-                     'Colección de ejercicios practicos para practicar y reforzar '
-                     'los conceptos aprendidos en clase. Incluye respuestas para '
-                     'autoevaluación.')
 
-    # Ejercicio 1
-    pdf.section_title('EJERCICIO 1: Ser o Estar')
-    pdf.body_text('Completa con SER o ESTAR la forma correcta:')
+@target('ejercicios-practicos', 'materials/ejercicios-practicos.pdf', group='materiales')
+def ejercicios_practicos():
+    """Ejercicios prácticos profesional"""
 
     ser_estar_ejercicios = [
         ('1. Yo _____ estudiante de espanol.', 'soy'),
@@ -1607,25 +1285,6 @@ def create_ejercicios_practicos_pdf():
         ('10. Los estudiantes _____ muy aplicados.', ('están', 'son'))
     ]
 
-    for i, (ejercicio, respuesta) in enumerate(ser_estar_ejercicios, 1):
-        pdf.set_x(10)
-        pdf.cell(0, 6, ejercicio, 0, 1)
-        if isinstance(respuesta, tuple):
-            pdf.set_text_color(153, 0, 0)
-            pdf.cell(0, 6, f'Respuesta: {respuesta[0]} o {respuesta[1]}', 0, 1)
-        else:
-            pdf.set_text_color(153, 0, 0)
-            pdf.cell(0, 6, f'Respuesta: {respuesta}', 0, 1)
-        pdf.set_text_color(0, 0, 0)
-
-    pdf.add_page()
-    pdf.section_title('EJERCICIO 2: Presente de Indicativo')
-    pdf.body_text('Completa las conjugaciones en presente:')
-
-    pdf.set_font('Arial', 'B', 12)
-    pdf.cell(0, 8, 'Verbos terminados en -AR:', 0, 1, 'L')
-    pdf.set_font('Arial', '', 11)
-
     ar_verbos = [
         ('HABLAR', 'hablo, hablas, habla, hablamos, hablan'),
         ('COMPRAR', 'compro, compras, compra, compramos, compran'),
@@ -1633,20 +1292,6 @@ def create_ejercicios_practicos_pdf():
         ('VIVIR', 'vivo, vives, vive, vivimos, viven')
     ]
 
-    for verbo, conjugacion in ar_verbos:
-        pdf.set_font('Arial', 'B', 11)
-        pdf.cell(50, 6, f'{verbo}:', 0, 0)
-        pdf.set_font('Arial', '', 10)
-        pdf.set_text_color(102, 102, 102)
-        pdf.cell(0, 6, conjugacion, 0, 1)
-        pdf.set_text_color(0, 0, 0)
-
-    pdf.ln(8)
-
-    pdf.set_font('Arial', 'B', 12)
-    pdf.cell(0, 8, 'Verbos terminados en -ER:', 0, 1, 'L')
-    pdf.set_font('Arial', '', 11)
-
     er_verbos = [
         ('COMER', 'como, comes, come, comemos, comen'),
         ('BEBER', 'bebo, bebes, bebe, bebemos, beben'),
@@ -1655,20 +1300,6 @@ def create_ejercicios_practicos_pdf():
         ('ESCRIBIR', 'escribo, escribes, escribe, escribimos, escriben')
     ]
 
-    for verbo, conjugacion in er_verbos:
-        pdf.set_font('Arial', 'B', 11)
-        pdf.cell(50, 6, f'{verbo}:', 0, 0)
-        pdf.set_font('Arial', '', 10)
-        pdf.set_text_color(102, 102, 102)
-        pdf.cell(0, 6, conjugacion, 0, 1)
-        pdf.set_text_color(0, 0, 0)
-
-    pdf.ln(8)
-
-    pdf.set_font('Arial', 'B', 12)
-    pdf.cell(0, 8, 'Verbos terminados en -IR:', 0, 1, 'L')
-    pdf.set_font('Arial', '', 11)
-
     ir_verbos = [
         ('VIVIR', 'vivo, vives, vive, vivimos, viven'),
         ('ESCRIBIR', 'escribo, escribes, escribe, escribimos, escriben'),
@@ -1677,18 +1308,6 @@ def create_ejercicios_practicos_pdf():
         ('RECIBIR', 'recibo, recibes, recibe, recibimos, reciben')
     ]
 
-    for verbo, conjugacion in ir_verbos:
-        pdf.set_font('Arial', 'B', 11)
-        pdf.cell(50, 6, f'{verbo}:', 0, 0)
-        pdf.set_font('Arial', '', 10)
-        pdf.set_text_color(102, 102, 102)
-        pdf.cell(0, 6, conjugacion, 0, 1)
-        pdf.set_text_color(0, 0, 0)
-
-    pdf.add_page()
-    pdf.section_title('EJERCICIO 3: Numeros y Fechas')
-    pdf.body_text('Escribe los siguientes numeros en espanol:')
-
     numeros_escribir = [
         ('15', 'quince'),
         ('23', 'veintitres'),
@@ -1702,25 +1321,7 @@ def create_ejercicios_practicos_pdf():
         ('100', 'cien')
     ]
 
-    for numero, respuesta in numeros_escribir:
-        pdf.set_x(10)
-        pdf.cell(0, 6, f'{numero} = ____________________', 0, 1)
-        pdf.set_text_color(153, 0, 0)
-        if isinstance(respuesta, tuple):
-            pdf.cell(0, 6, f'Respuesta: {respuesta[0]} o {respuesta[1]}', 0, 1)
-        else:
-            pdf.cell(0, 6, f'Respuesta: {respuesta}', 0, 1)
-        pdf.set_text_color(0, 0, 0)
-
-    pdf.ln(10)
-    pdf.body_text('Escribe la fecha completa de hoy:')
-    pdf.set_x(10)
-    pdf.cell(0, 6, 'Hoy es ____________________ de ____________________ de ________', 0, 1)
-
-    pdf.add_page()
-    pdf.section_title('EJERCICIO 4: Vocabulario de Familia')
-    pdf.body_text('Completa las palabras que faltan:')
-
+    # Las preguntas 8 y 9 son de opcion multiple: (enunciado, respuesta, opciones, correcta)
     familia_ejercicio = [
         ('1. El padre de mi padre es mi _____.', 'abuelo'),
         ('2. La hermana de mi madre es mi _____.', 'tia'),
@@ -1734,122 +1335,56 @@ def create_ejercicios_practicos_pdf():
         ('10. El hermano de mi esposa es mi _____.', 'cuñado')
     ]
 
-    for i, item in enumerate(familia_ejercicio, 1):
-        ejercicio = item[0]
-        respuesta = item[1]
-
-        pdf.set_x(10)
-        pdf.cell(0, 6, ejercicio, 0, 1)
-
-        if len(item) > 2:  # Multiple choice question
-            opciones = item[2]
-            respuesta_correcta = item[3]
-
-            for opcion in opciones:
-                pdf.set_x(25)
-                pdf.set_text_color(102, 102, 102)
-                pdf.cell(0, 6, opcion, 0, 1)
-                pdf.set_text_color(0, 0, 0)
-
-            pdf.set_text_color(153, 0, 0)
-            pdf.cell(0, 6, f'Respuesta correcta: {respuesta_correcta}', 0, 1)
-            pdf.set_text_color(0, 0, 0)
+    familia = []
+    for item in familia_ejercicio:
+        familia.append(('line', item[0]))
+        if len(item) > 2:
+            familia += [('lines', item[2], 'option'),
+                        ('line', f'Respuesta correcta: {item[3]}', 'answer')]
         else:
-            pdf.set_text_color(153, 0, 0)
-            pdf.cell(0, 6, f'Respuesta: {respuesta}', 0, 1)
-            pdf.set_text_color(0, 0, 0)
-
-    pdf.add_page()
-    pdf.section_title('EJERCICIO 5: Preposiciones')
-    pdf.body_text('Completa con las preposiciones correctas (a, en, de, con, por, para):')
+            familia.append(('line', f'Respuesta: {item[1]}', 'answer'))
 
     preposiciones_ejercicios = [
         ('1. Voy ____ la escuela.', 'a'),
         ('2. Mi libro está ____ la mesa.', ('en', 'sobre')),
         ('3. Soy ____ España.', 'de'),
-        ('4) ' + str(3), 'Hay ____ personas en la clase.', 'hay'),
-        ('5) ' + str(5), 'Estudio español ____ 2 años.', ('desde', 'hace')),
+        ('4. Hay ____ personas en la clase.', 'hay'),
+        ('5. Estudio español ____ 2 años.', ('desde', 'hace')),
         ('6. Comprocho leche ____ 2 euros.', 'por'),
         ('7. Este regalo es ____ ti.', 'para'),
-        ('8) ' + str(8), 'Salgo ____ compras ____ mis amigos.', ('de', 'con')),
-        ('9) ' + str(9), 'Pido ayuda ____ mis compañeros.', 'a'),
-        ('10) ' + str(10), 'Hago la tarea ____ la tarde.', ('en', 'por'))
+        ('8. Salgo ____ compras ____ mis amigos.', ('de', 'con')),
+        ('9. Pido ayuda ____ mis compañeros.', 'a'),
+        ('10. Hago la tarea ____ la tarde.', ('en', 'por'))
     ]
 
-    for i, item in enumerate(preposiciones_ejercicios, 1):
-        ejercicio = item[0]
-        respuesta = item[1]
-
-        pdf.set_x(10)
-        pdf.cell(0, 6, ejercicio, 0, 1)
-
-        if isinstance(respuesta, tuple):
-            respuesta_text = ' o '.join(respuesta)
-        else:
-            respuesta_text = respuesta
-
-        pdf.set_text_color(153, 0, 0)
-        pdf.cell(0, 6, f'Respuesta: {respuesta_text}', 0, 1)
-        pdf.set_text_color(0, 0, 0)
-
-    pdf.add_page()
-    pdf.section_title('EJERCICIO 6: Artículos Definidos e Indefinidos')
-    pdf.body_text('Completa con EL, LA, LOS, LAS o UN, UNA, UNOS, UNAS:')
-
     articulos_ejercicios = [
         ('1. He comprado ____ coche nuevo.', 'un'),
         ('2. ____ clase es muy interesante.', 'La'),
-        ('3. ____ niños juegan en el parque.', ('Los', 'Los niños')),
-        ('4) ' + str(4), 'Necesito ____ diccionario.', ('un', 'el')),
-        ('5) ' + str(5), '¿Dónde está ____ biblioteca?', ('la', 'la biblioteca')),
-        ('6) ' + str(6), 'Leí ____ libro interesante.', ('un', 'un libro')),
-        ('7) ' + str(7), 'Hace ____ día muy soleado.', ('un', 'el día')),
-        ('8) ' + str(8), 'Quiero _____ café por favor.', ('un', 'un café')),
-        ('9) ' + str(9), 'Me gustan ____ películas españolas.', ('las', 'las películas')),
-        ('10) ' + str(10), 'Tengo ____ pregunta importante.', ('una', 'una pregunta'))
-    ]
-
-    for i, item in enumerate(articulos_ejercicios, 1):
-        ejercicio = item[0]
-        respuesta = item[1]
-
-        pdf.set_x(10)
-        pdf.cell(0, 6, ejercicio, 0, 1)
-        if isinstance(respuesta, tuple):
-            pdf.set_text_color(153, 0, 0)
-            pdf.cell(0, 6, f'Respuesta: {respuesta[0]}', 0, 1)
-        else:
-            pdf.set_text_color(153, 0, 0)
-            pdf.cell(0, 6, f'Respuesta: {respuesta}', 0, 1)
-        pdf.set_text_color(0, 0, 0)
-
-    pdf.add_page()
-    pdf.section_title('EJERCICIO 7: Comparativos')
-    pdf.body_text("Usa más que (más ... que), menos que (menos ... que) o tan ... como (tan ... como):")
+        ('3. ____ niños juegan en el parque.', 'Los'),
+        ('4. Necesito ____ diccionario.', 'un'),
+        ('5. ¿Dónde está ____ biblioteca?', 'la'),
+        ('6. Leí ____ libro interesante.', 'un'),
+        ('7. Hace ____ día muy soleado.', 'un'),
+        ('8. Quiero _____ café por favor.', 'un'),
+        ('9. Me gustan ____ películas españolas.', 'las'),
+        ('10. Tengo ____ pregunta importante.', 'una')
+    ]
 
     comparativos_ejercicios = [
         ('El elefante es ____ grande que el ratón.', 'más'),
         ('Esta calle es ____ larga que la anterior.', 'más'),
         ('Mi casa es ____ pequeña que tu casa.', 'más'),
         ('El español es ____ fácil que el chino.', 'más'),
-        ('Este libro es ____ interesante que la película.', ('más', 'más')),
+        ('Este libro es ____ interesante que la película.', 'más'),
         ('El café está ____ caliente que el té.', 'más'),
         ('María es ____ alta que Ana.', 'más'),
         ('Este hotel es ____ caro que aquel.', 'más'),
         ('La vida en la ciudad es ____ rápida que en el pueblo.', 'más'),
         ('Este coche es ____ rápido que el autobús.', 'más'),
-        ('La explicación es ____ clara que la del libro.', ('más', 'más')),
+        ('La explicación es ____ clara que la del libro.', 'más'),
         ('El examen es ____ fácil que la práctica.', 'más')
     ]
 
-    for i, (ejercicio, respuesta) in enumerate(comparativos_ejercicios, 1):
-        pdf.set_x(10)
-        pdf.multi_cell(0, 6, f'{i}. {ejercicio} {respuesta} [RESPUESTA]', 0, 1)
-        pdf.ln(2)
-
-    pdf.ln(5)
-    pdf.body_text("Usa menos que (menos ... que):")
-
     menos_ejercicios = [
         ('Esta tarea es ____ fácil que la anterior.', 'menos'),
         ('Mi español es ____ bueno que el tuyo.', 'menos'),
@@ -1858,14 +1393,6 @@ def create_ejercicios_practicos_pdf():
         ('Este trabajo es ____ aburrido que el anterior.', 'menos')
     ]
 
-    for i, (ejercicio, respuesta) in enumerate(menos_ejercicios, len(comparativos_ejercicios) + 1):
-        pdf.set_x(10)
-        pdf.multi_cell(0, 6, f'{i}. {ejercicio} {respuesta} [RESPUESTA]', 0, 1)
-        pdf.ln(2)
-
-    pdf.ln(5)
-    pdf.body_text("Usa tan ... como: (tan ... como):")
-
     tan_ejercicios = [
         ('Juan es ____ alto como Pedro.', 'tan'),
         ('María es ____ inteligente como su hermana.', 'tan'),
@@ -1874,14 +1401,12 @@ def create_ejercicios_practicos_pdf():
         ('El problema es ____ difícil como la solución.', 'tan')
     ]
 
-    for i, (ejercicio, respuesta) in enumerate(tan_ejercicios, len(comparativos_ejercicios) + len(menos_ejercicios) + 1):
-        pdf.set_x(10)
-        pdf.multi_cell(0, 6, f'{i}. {ejercicio} {respuesta} [RESPUESTA]', 0, 1)
-        pdf.ln(2)
-
-    pdf.add_page()
-    pdf.section_title('EJERCICIO 8: Diálogo Corto')
-    pdf.body_text('Completa el siguiente diálogo:')
+    # Numeracion continua en los tres bloques de comparativos
+    numerados = list(enumerate(comparativos_ejercicios + menos_ejercicios + tan_ejercicios, 1))
+    comparativos = [('text', f'{i}. {ejercicio} {solucion} [RESPUESTA]', 'exercise')
+                    for i, (ejercicio, solucion) in numerados]
+    primero_menos = len(comparativos_ejercicios)
+    primero_tan = primero_menos + len(menos_ejercicios)
 
     dialogo = [
         'A: Hola, buenos días.',
@@ -1900,21 +1425,6 @@ def create_ejercicios_practicos_pdf():
         'B: Yo estudio _____.'
     ]
 
-    for i, linea in enumerate(dialogo, 1):
-        pdf.set_x(10)
-        if '________________' in linea or '_____' in linea:
-            pdf.set_font('Arial', '', 11)
-            pdf.set_text_color(100, 100, 100)
-            pdf.cell(0, 6, linea, 0, 1)
-            pdf.set_text_color(0, 0, 0)
-        else:
-            pdf.set_font('Arial', '', 11)
-            pdf.cell(0, 6, linea, 0, 1)
-
-    pdf.set_y(pdf.get_y() + 10)
-    pdf.section_title('Posibles Respuestas')
-    pdf.set_text_color(153, 0, 0)
-
     dialogo_respuestas = [
         'A: Hola, buenos días.',
         'B: Estoy bien. Como estás?',
@@ -1932,16 +1442,6 @@ def create_ejercicios_practicos_pdf():
         'B: Yo estudio [materia].'
     ]
 
-    pdf.set_font('Arial', '', 11)
-    for i, linea in enumerate(dialogo_respuestas, 1):
-        pdf.set_x(10)
-        pdf.cell(0, 6, linea, 0, 1)
-        pdf.set_text_color(0, 0, 0)
-
-    pdf.set_y(pdf.get_y() + 15)
-    pdf.section_title('EJERCICIO 9: Descripciones')
-    pdf.body_text('Describe las siguientes imágenes (imagina que ves estas imágenes):')
-
     descripciones = [
         ('Imagen 1: Una persona sonriendo en la playa', 'Uso de ser/estar, adjetivos de personalidad'),
         ('Imagen 2: Una habitación moderna y ordenada', 'Uso de preposiciones, vocabulario de hogar'),
@@ -1950,52 +1450,29 @@ def create_ejercicios_practicos_pdf():
         ('Imagen 5: Una clase de idiomas con estudiantes', 'Educación, actividades de clase')
     ]
 
+    fotos = []
     for i, (descripcion, nota) in enumerate(descripciones, 1):
-        pdf.set_x(10)
-        pdf.set_font('Arial', 'B', 11)
-        pdf.cell(0, 6, f'Foto {i}: {descripcion}', 0, 1)
-        pdf.set_font('Arial', 'I', 10)
-        pdf.set_text_color(102, 102, 102)
-        pdf.cell(0, 5, f'Nota: {nota}', 0, 1)
-        pdf.set_font('Arial', '', 11)
-        pdf.set_x(15)
-        pdf.multi_cell(0, 4, 'Descripción:', 0, 1)
-        pdf.ln(2)
-
-    pdf.set_y(pdf.get_y() + 20)
-    pdf.section_title('EJERCICIO 10: Comprensión Lectura')
-    pdf.body_text('Lee el siguiente texto y responde las preguntas:')
-
-    texto_comprension = '''
-    Texto:
-    María es estudiante del Centro de Lenguas Modernas de la Universidad de Granada. Ella viene de Estados Unidos y
-    está aprendiendo español en un curso intensivo. Su clase es el nivel 3 CLM (A1.2-A2.1) y tiene clases
-    todos los días excepto los fines de semana.
-
-    María vive en un apartamento cerca del centro. Por las mañanas toma el autobús a la universidad.
-    Le gusta el café español con leche y las tapas de Andalucía. Después de clase, generalmente almuerza
-    en un bar tradicional con sus compañeros de clase.
-
-    Por las tardes, María visita diferentes lugares turísticos de Granada como la Alhambra
-    y los jardines del Generalife. Ella piensa que Granada es una ciudad muy bonita y segura.
-    El tiempo es generalmente soleado y cálido, lo cual le permite disfrutar de las terrazas
-    y plazas.
-
-    Los fines de semana, María practica su español con amigos españoles. A veces preparan
-    comida internacional donde cada uno trae platos de su país. María siempre lleva postres
-    de manzana para compartir.
-
-    A pesar de que su español no es perfecto, María puede mantener conversaciones básicas y
-    entender la mayoría de las conversaciones cotidianas. Su meta es poder comunicarse
-    eficazmente en español dentro de seis meses.
-    '''
-
-    pdf.multi_cell(0, 6, texto_comprension, 0, 1)
-
-    pdf.ln(10)
-    pdf.set_font('Arial', 'B', 12)
-    pdf.cell(0, 8, 'Preguntas:', 0, 1, 'L')
-    pdf.set_font('Arial', '', 11)
+        fotos += [('line', f'Foto {i}: {descripcion}', 'label'),
+                  ('line', f'Nota: {nota}', 'aside'),
+                  ('text', 'Descripción:', 'prompt')]
+
+    texto_comprension = [
+        'María es estudiante del Centro de Lenguas Modernas de la Universidad de Granada. Ella viene de '
+        'Estados Unidos y está aprendiendo español en un curso intensivo. Su clase es el nivel 3 CLM '
+        '(A1.2-A2.1) y tiene clases todos los días excepto los fines de semana.',
+        'María vive en un apartamento cerca del centro. Por las mañanas toma el autobús a la universidad. '
+        'Le gusta el café español con leche y las tapas de Andalucía. Después de clase, generalmente '
+        'almuerza en un bar tradicional con sus compañeros de clase.',
+        'Por las tardes, María visita diferentes lugares turísticos de Granada como la Alhambra y los '
+        'jardines del Generalife. Ella piensa que Granada es una ciudad muy bonita y segura. El tiempo es '
+        'generalmente soleado y cálido, lo cual le permite disfrutar de las terrazas y plazas.',
+        'Los fines de semana, María practica su español con amigos españoles. A veces preparan comida '
+        'internacional donde cada uno trae platos de su país. María siempre lleva postres de manzana para '
+        'compartir.',
+        'A pesar de que su español no es perfecto, María puede mantener conversaciones básicas y entender '
+        'la mayoría de las conversaciones cotidianas. Su meta es poder comunicarse eficazmente en español '
+        'dentro de seis meses.',
+    ]
 
     preguntas_comprension = [
         '1. ¿De dónde es María?',
@@ -2007,106 +1484,117 @@ def create_ejercicios_practicos_pdf():
         '7. ¿Cómo es su español según el texto?'
     ]
 
-    for i, pregunta in enumerate(preguntas_comprension, 1):
-        pdf.set_x(20)
-        pdf.cell(0, 6, pregunta, 0, 1)
-
-    pdf.set_y(pdf.get_y() + 15)
-    pdf.set_font('Arial', 'I', 11)
-    pdf.set_text_color(102, 102, 102)
-    pdf.cell(0, 8, 'Espacio para respuestas:', 0, 1)
-    pdf.set_text_color(0, 0, 0)
-    pdf.set_x(20)
-    pdf.multi_cell(0, 4, '________________________________________________________________', 0, 1)
-    pdf.ln(2)
-    pdf.set_x(20)
-    pdf.multi_cell(0, 4, '________________________________________________________________', 0, 1)
-    pdf.ln(2)
-    pdf.set_x(20)
-    pdf.multi_cell(0, 4, '________________________________________________________________', 0, 1)
-    pdf.ln(2)
-    pdf.set_x(20)
-    pdf.multi_cell(0, 4, '________________________________________________________________', 0, 1)
-
-    pdf.set_y(pdf.get_y() + 20)
-    pdf.section_title('CLAVE DE RESPUESTAS')
-
-    pdf.set_text_color(0, 153, 0)
-    pdf.cell(0, 6, '1. Respuesta: Estados Unidos', 0, 1)
-    pdf.set_text_color(0, 0, 0)
-    pdf.cell(0, 6, '2. Respuesta: Nivel 3 CLM (A1.2-A2.1)', 0, 1)
-    pdf.set_text_color(0, 153, 0)
-    pdf.cell(0, 6, '3. Respuesta: Todos los días excepto fines de semana', 0, 1)
-    pdf.set_text_color(0, 0, 0)
-    pdf.cell(0, 6, '4. Respuesta: Soleado y cálido', 0, 1)
-    pdf.set_text_color(0, 153, 0)
-    pdf.cell(0, 6, '5. Respuesta: Practica español con amigos españoles', 0, 1)
-    pdf.set_text_color(0, 0, 0)
-    pdf.cell(0, 6, '6. Respuesta: Comunicarse eficazmente en español en seis meses', 0, 1)
-    pdf.set_text_color(0, 153, 0)
-    pdf.set_text_color(0, 0, 0)
-    pdf.cell(0, 6, '7. Respuesta: Puede mantener conversaciones básicas y entender la mayoría', 0, 1)
-
-    pdf.set_y(pdf.get_y() + 20)
-    pdf.set_font('Arial', 'I', 11)
-    pdf.set_text_color(102, 102, 102)
-    pdf.cell(0, 8, '¡Buen trabajo con estos ejercicios! Practica regularmente para mejorar.', 0, 1, 'C')
-    pdf.cell(0, 6, 'Recuerda que la práctica constante es clave para aprender español.', 0, 0, 'C')
-
-    pdf.output('materials/ejercicios-practicos.pdf')
-    print("✅ Created professional ejercicios-practicos.pdf")
-
-def create_hoja_asistencia_pdf():
-    """Crear hoja de asistencia para el curso"""
-
-    pdf = ProfessionalPDF()
-    pdf.title = 'Hoja de Asistencia'
-    pdf.alias_nb_pages()
-    pdf.add_page()
-
-    # Título principal
-    pdf.chapter_title('Hoja de Asistencia')
-    pdf.chapter_title('Curso Intensivo de Espanol - Nivel 3 CLM')
-
-    # Información del curso
-    pdf.highlight_box('Informacion del Curso',
-                     'Profesor: Javier Benitez Lainez\n'
-                     'Periodo: 6 - 27 de noviembre de 2025\n'
-                     'Duracion: 40 horas (8 horas semanales)\n'
-                     'Asistencia minima requerida: 85%\n'
-                     'Total de sesiones: 20 clases')
-
-    # Instrucciones
-    pdf.section_title('Instrucciones de Uso')
-    pdf.body_text('Esta hoja de asistencia debe ser completada por el profesor en cada sesion. '
-                 'Los estudiantes deben firmar para confirmar su presencia. '
-                 'La asistencia se registra diariamente y se calcula el porcentaje acumulado.')
-
-    # Tabla de asistencia
-    pdf.section_title('Registro de Asistencia')
-    pdf.set_font('Arial', 'B', 10)
-    pdf.set_text_color(0, 0, 0)
-
-    # Encabezados de tabla
-    headers = ['Fecha', 'Dia', 'Hora Inicio', 'Hora Fin', 'Firma']
-    widths = [30, 20, 25, 25, 90]
-
-    y_pos = pdf.get_y()
-
-    # Línea de encabezado
-    pdf.set_draw_color(0, 0, 0)
-    pdf.line(10, y_pos, 200, y_pos)
-
-    for i, header in enumerate(headers):
-        x_pos = 10 + sum(widths[:i])
-        pdf.set_x(x_pos)
-        pdf.cell(widths[i], 8, header, 0, 0, 'C')
-
-    y_pos += 8
-    pdf.line(10, y_pos, 200, y_pos)
-
-    # Filas de asistencia (20 sesiones)
-    pdf.set_font('Arial', '', 10)
+    clave = [
+        '1. Respuesta: Estados Unidos',
+        '2. Respuesta: Nivel 3 CLM (A1.2-A2.1)',
+        '3. Respuesta: Todos los días excepto fines de semana',
+        '4. Respuesta: Soleado y cálido',
+        '5. Respuesta: Practica español con amigos españoles',
+        '6. Respuesta: Comunicarse eficazmente en español en seis meses',
+        '7. Respuesta: Puede mantener conversaciones básicas y entender la mayoría'
+    ]
+
+    return {
+        'title': 'Ejercicios Practicos',
+        'blocks': [
+            ('chapter', 'Ejercicios Practicos de Espanol'),
+            ('box', 'Objetivo', [
+                'Colección de ejercicios practicos para practicar y reforzar '
+                'los conceptos aprendidos en clase. Incluye respuestas para '
+                'autoevaluación.',
+            ]),
+
+            ('section', 'EJERCICIO 1: Ser o Estar'),
+            ('text', 'Completa con SER o ESTAR la forma correcta:'),
+            *con_respuestas(ser_estar_ejercicios),
+
+            ('page',),
+            ('section', 'EJERCICIO 2: Presente de Indicativo'),
+            ('text', 'Completa las conjugaciones en presente:'),
+            ('line', 'Verbos terminados en -AR:', 'label'),
+            ('pairs', [(f'{verbo}:', conjugacion) for verbo, conjugacion in ar_verbos], 'conjugation'),
+            ('space', 8),
+            ('line', 'Verbos terminados en -ER:', 'label'),
+            ('pairs', [(f'{verbo}:', conjugacion) for verbo, conjugacion in er_verbos], 'conjugation'),
+            ('space', 8),
+            ('line', 'Verbos terminados en -IR:', 'label'),
+            ('pairs', [(f'{verbo}:', conjugacion) for verbo, conjugacion in ir_verbos], 'conjugation'),
+
+            ('page',),
+            ('section', 'EJERCICIO 3: Numeros y Fechas'),
+            ('text', 'Escribe los siguientes numeros en espanol:'),
+            *con_respuestas([(f'{numero} = ____________________', solucion)
+                             for numero, solucion in numeros_escribir]),
+            ('space', 10),
+            ('text', 'Escribe la fecha completa de hoy:'),
+            ('line', 'Hoy es ____________________ de ____________________ de ________'),
+
+            ('page',),
+            ('section', 'EJERCICIO 4: Vocabulario de Familia'),
+            ('text', 'Completa las palabras que faltan:'),
+            *familia,
+
+            ('page',),
+            ('section', 'EJERCICIO 5: Preposiciones'),
+            ('text', 'Completa con las preposiciones correctas (a, en, de, con, por, para):'),
+            *con_respuestas(preposiciones_ejercicios),
+
+            ('page',),
+            ('section', 'EJERCICIO 6: Artículos Definidos e Indefinidos'),
+            ('text', 'Completa con EL, LA, LOS, LAS o UN, UNA, UNOS, UNAS:'),
+            *con_respuestas(articulos_ejercicios),
+
+            ('page',),
+            ('section', 'EJERCICIO 7: Comparativos'),
+            ('text', 'Usa más que (más ... que), menos que (menos ... que) o tan ... como (tan ... como):'),
+            *comparativos[:primero_menos],
+            ('space', 5),
+            ('text', 'Usa menos que (menos ... que):'),
+            *comparativos[primero_menos:primero_tan],
+            ('space', 5),
+            ('text', 'Usa tan ... como: (tan ... como):'),
+            *comparativos[primero_tan:],
+
+            ('page',),
+            ('section', 'EJERCICIO 8: Diálogo Corto'),
+            ('text', 'Completa el siguiente diálogo:'),
+            *[('line', linea, 'hint' if '_____' in linea else 'line') for linea in dialogo],
+            ('space', 10),
+            ('section', 'Posibles Respuestas'),
+            ('lines', dialogo_respuestas, 'answer'),
+
+            ('space', 15),
+            ('section', 'EJERCICIO 9: Descripciones'),
+            ('text', 'Describe las siguientes imágenes (imagina que ves estas imágenes):'),
+            *fotos,
+
+            ('space', 20),
+            ('section', 'EJERCICIO 10: Comprensión Lectura'),
+            ('text', 'Lee el siguiente texto y responde las preguntas:'),
+            ('line', 'Texto:', 'label'),
+            *[('text', parrafo) for parrafo in texto_comprension],
+            ('space', 7),
+            ('line', 'Preguntas:', 'label'),
+            ('lines', preguntas_comprension, 'indent'),
+            ('space', 15),
+            ('line', 'Espacio para respuestas:', 'italic'),
+            ('lines', ['_' * 64] * 4, 'blank'),
+
+            ('space', 20),
+            ('section', 'CLAVE DE RESPUESTAS'),
+            *[('line', linea, 'key' if i % 2 == 0 else 'line') for i, linea in enumerate(clave)],
+
+            ('note', ['¡Buen trabajo con estos ejercicios! Practica regularmente para mejorar.',
+                      'Recuerda que la práctica constante es clave para aprender español.']),
+        ],
+    }
+
+
+@target('hoja-asistencia', 'materials/hoja-asistencia.pdf', group='materiales')
+def hoja_asistencia():
+    """Hoja de asistencia para el curso"""
+
+    # Las 10 sesiones del periodo; la columna de firma queda en blanco
     sesiones = [
         ('6 nov', 'Jueves', '08:30', '12:30'),
         ('10 nov', 'Lunes', '08:30', '10:30'),
@@ -2120,36 +1608,6 @@ def create_hoja_asistencia_pdf():
         ('27 nov', 'Jueves', '08:30', '12:30')
     ]
 
-    for fecha, dia, inicio, fin in sesiones:
-        y_pos += 10
-        if y_pos > 260:  # Nueva página si es necesario
-            pdf.add_page()
-            y_pos = 50
-
-        # Línea de separación
-        pdf.line(10, y_pos - 1, 200, y_pos - 1)
-
-        # Datos de la fila
-        data = [fecha, dia, inicio, fin, '']
-        for i, item in enumerate(data):
-            x_pos = 10 + sum(widths[:i])
-            pdf.set_x(x_pos)
-            if i == 4:  # Columna de firma
-                pdf.line(x_pos + 5, y_pos + 5, x_pos + 85, y_pos + 5)
-                pdf.line(x_pos + 5, y_pos + 8, x_pos + 85, y_pos + 8)
-            else:
-                pdf.cell(widths[i], 8, item, 0, 0, 'C')
-
-    # Línea final
-    y_pos += 9
-    pdf.line(10, y_pos, 200, y_pos)
-
-    pdf.add_page()
-
-    # Resumen de asistencia
-    pdf.section_title('Resumen de Asistencia')
-    pdf.body_text('Calculo del porcentaje de asistencia:')
-
     resumen_data = [
         ('Total de sesiones:', '20 clases'),
         ('Asistencia minima para aprobar:', '17 clases (85%)'),
@@ -2157,66 +1615,59 @@ def create_hoja_asistencia_pdf():
         ('Horas minimas requeridas:', '34 horas')
     ]
 
-    for concepto, valor in resumen_data:
-        pdf.set_font('Arial', 'B', 11)
-        pdf.cell(100, 8, concepto, 0, 0)
-        pdf.set_font('Arial', '', 11)
-        pdf.cell(0, 8, valor, 0, 1)
-
-    pdf.ln(10)
-
-    # Sección de observaciones
-    pdf.section_title('Observaciones y Notas')
-    pdf.body_text('Espacio para registrar observaciones importantes sobre la asistencia:')
-
-    pdf.set_font('Arial', '', 11)
-    for i in range(8):
-        pdf.set_x(15)
-        pdf.cell(10, 6, f'{i+1}.', 0, 0)
-        pdf.multi_cell(0, 6, '_________________________________________________________', 0, 1)
-
-    # Firmas al final
-    pdf.set_y(pdf.get_y() + 20)
-    pdf.section_title('Firmas')
-
-    pdf.set_font('Arial', 'B', 11)
-    pdf.cell(90, 8, 'Firma del Profesor:', 0, 0)
-    pdf.cell(0, 8, 'Firma del Coordinador:', 0, 1)
-
-    pdf.ln(15)
-
-    pdf.set_font('Arial', '', 11)
-    pdf.cell(90, 6, '_______________________', 0, 0)
-    pdf.cell(0, 6, '_______________________', 0, 1)
-
-    pdf.cell(90, 6, 'Javier Benitez Lainez', 0, 0)
-    pdf.cell(0, 6, 'Nombre y Apellidos', 0, 1)
-
-    pdf.cell(90, 6, 'Profesor de Espanol', 0, 0)
-    pdf.cell(0, 6, 'Coordinador CLM', 0, 1)
+    return {
+        'title': 'Hoja de Asistencia',
+        'blocks': [
+            ('chapter', 'Hoja de Asistencia'),
+            ('chapter', 'Curso Intensivo de Espanol - Nivel 3 CLM'),
+            ('box', 'Informacion del Curso', [
+                'Profesor: Javier Benitez Lainez',
+                'Periodo: 6 - 27 de noviembre de 2025',
+                'Duracion: 40 horas (8 horas semanales)',
+                'Asistencia minima requerida: 85%',
+                'Total de sesiones: 20 clases',
+            ]),
+
+            ('section', 'Instrucciones de Uso'),
+            ('text', 'Esta hoja de asistencia debe ser completada por el profesor en cada sesion. '
+                     'Los estudiantes deben firmar para confirmar su presencia. '
+                     'La asistencia se registra diariamente y se calcula el porcentaje acumulado.'),
+
+            ('section', 'Registro de Asistencia'),
+            ('table', ['Fecha', 'Dia', 'Hora Inicio', 'Hora Fin', 'Firma'], [30, 20, 25, 25, 90],
+             [sesion + ('',) for sesion in sesiones]),
+
+            ('page',),
+            ('section', 'Resumen de Asistencia'),
+            ('text', 'Calculo del porcentaje de asistencia:'),
+            ('pairs', resumen_data, 'summary'),
+            ('space', 10),
+
+            ('section', 'Observaciones y Notas'),
+            ('text', 'Espacio para registrar observaciones importantes sobre la asistencia:'),
+            ('lines', [f'{i}.  {"_" * 57}' for i in range(1, 9)], 'indent'),
+
+            ('space', 20),
+            ('section', 'Firmas'),
+            ('row', [(90, 'Firma del Profesor:'), (0, 'Firma del Coordinador:')], 'label'),
+            ('space', 15),
+            ('row', [(90, '_______________________'), (0, '_______________________')]),
+            ('row', [(90, 'Javier Benitez Lainez'), (0, 'Nombre y Apellidos')]),
+            ('row', [(90, 'Profesor de Espanol'), (0, 'Coordinador CLM')]),
+        ],
+    }
 
-    pdf.output('materials/hoja-asistencia.pdf')
-    print("✅ Created professional hoja-asistencia.pdf")
 
 def main():
     """Crear todos los PDFs profesionales"""
 
     print("📚 Creating all professional PDFs for course materials...")
 
-    # Asegurar que los directorios existan
-    os.makedirs('materials', exist_ok=True)
-
-    # Crear todos los PDFs
-    create_guia_curso_pdf()
-    create_vocabulario_esencial_pdf()
-    create_frases_utiles_pdf()
-    create_verbos_irregulares_pdf()
-    create_ejercicios_practicos_pdf()
-    create_hoja_asistencia_pdf()
+    build_group('materiales')
 
     print("\n🎉 All professional PDFs created successfully!")
     print("📚 Course materials now have professional formatting and complete content")
     print("✨ Ready for students with educational value and beautiful presentation")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
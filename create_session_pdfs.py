@@ -1,35 +1,14 @@
 #!/usr/bin/env python3
 """
 Crear cuadernos de sesiones profesionales
-"""
-
-from fpdf import FPDF
-import os
 
-def clean_text(text):
-    """Limpiar caracteres especiales para PDF"""
-    replacements = {
-        'á': 'a', 'é': 'e', 'í': 'i', 'ó': 'o', 'ú': 'u',
-        'Á': 'A', 'É': 'E', 'Í': 'I', 'Ó': 'O', 'Ú': 'U',
-        'ñ': 'n', 'Ñ': 'N', 'ü': 'u', 'Ü': 'U',
-        '¿': '?', '¡': '!'
-    }
-    for old, new in replacements.items():
-        text = text.replace(old, new)
-    return text
+Cada sesión de la lista es un objetivo de pdf_engine.py (cuaderno-S1 ...
+cuaderno-S17): para rehacer un solo cuaderno basta con
 
-class SessionPDF(FPDF):
-    def header(self):
-        self.set_font('Helvetica', 'B', 18)
-        self.set_text_color(0, 51, 102)
-        self.cell(0, 10, self.title, border=0, align='C')
-        self.ln(12)
+    python pdf_engine.py cuaderno-S5
+"""
 
-    def footer(self):
-        self.set_y(-15)
-        self.set_font('Helvetica', 'I', 8)
-        self.set_text_color(128, 128, 128)
-        self.cell(0, 10, f'Pagina {self.page_no()}', border=0, align='C')
+from pdf_engine import build_group, register
 
 sessions = [
     {
@@ -485,103 +464,43 @@ sessions = [
     }
 ]
 
-def create_session_pdf(session):
-    pdf = SessionPDF()
-    pdf.title = session['title']
-    pdf.add_page()
-
-    # Info box
-    pdf.set_fill_color(240, 248, 255)
-    pdf.set_draw_color(100, 149, 237)
-    pdf.rect(10, pdf.get_y(), 190, 30, 'FD')
-
-    pdf.set_font('Helvetica', 'B', 11)
-    pdf.set_text_color(0, 51, 102)
-    pdf.cell(0, 7, 'Curso Intensivo de Espanol - Nivel 3 CLM', border=0, align='L')
-    pdf.ln()
-
-    pdf.set_font('Helvetica', '', 10)
-    pdf.set_text_color(51, 51, 51)
-    pdf.cell(0, 6, 'Periodo: 6 - 27 de noviembre de 2025', border=0)
-    pdf.ln()
-    pdf.cell(0, 6, 'Profesor: Javier Benitez Lainez | Aula: 24', border=0)
-    pdf.ln()
-    pdf.cell(0, 6, f'Duracion: {session["duracion"]}', border=0)
-    pdf.ln(12)
-
-    # Objetivos
-    pdf.set_font('Helvetica', 'B', 13)
-    pdf.set_text_color(51, 102, 153)
-    pdf.cell(0, 8, 'OBJETIVOS DE LA SESION:', border=0)
-    pdf.ln()
-
-    pdf.set_font('Helvetica', '', 11)
-    pdf.set_text_color(0, 0, 0)
-    for obj in session['objetivos']:
-        pdf.cell(0, 6, '- ' + clean_text(obj), border=0)
-        pdf.ln()
-    pdf.ln(3)
-
-    # Vocabulario
-    pdf.set_font('Helvetica', 'B', 13)
-    pdf.set_text_color(51, 102, 153)
-    pdf.cell(0, 8, 'VOCABULARIO CLAVE:', border=0)
-    pdf.ln()
-
-    pdf.set_font('Helvetica', '', 11)
-    pdf.set_text_color(0, 0, 0)
-    for key, value in session['vocab'].items():
-        pdf.set_font('Helvetica', 'B', 11)
-        pdf.cell(0, 6, clean_text(key + ':'), border=0)
-        pdf.ln()
-        pdf.set_font('Helvetica', '', 10)
-        pdf.multi_cell(0, 5, clean_text(value))
-        pdf.ln(2)
-
-    # Actividades
-    pdf.set_font('Helvetica', 'B', 13)
-    pdf.set_text_color(51, 102, 153)
-    pdf.cell(0, 8, 'ACTIVIDADES DE CLASE:', border=0)
-    pdf.ln()
-
-    pdf.set_font('Helvetica', '', 11)
-    pdf.set_text_color(0, 0, 0)
-    for i, act in enumerate(session['actividades'], 1):
-        pdf.cell(0, 6, f'{i}. {clean_text(act)}', border=0)
-        pdf.ln()
-    pdf.ln(3)
-
-    # Tarea
-    pdf.set_font('Helvetica', 'B', 13)
-    pdf.set_text_color(51, 102, 153)
-    pdf.cell(0, 8, 'TAREA PARA CASA:', border=0)
-    pdf.ln()
-
-    pdf.set_font('Helvetica', '', 11)
-    pdf.set_text_color(0, 0, 0)
-    for tarea in session['tarea']:
-        pdf.cell(0, 6, '- ' + clean_text(tarea), border=0)
-        pdf.ln()
-
-    # Footer
-    pdf.ln(10)
-    pdf.set_draw_color(100, 149, 237)
-    pdf.line(10, pdf.get_y(), 200, pdf.get_y())
-    pdf.ln(5)
-    pdf.set_font('Helvetica', 'I', 9)
-    pdf.set_text_color(102, 102, 102)
-    pdf.cell(0, 4, 'Universidad de Granada - Centro de Lenguas Modernas', border=0, align='C')
+def session_spec(session):
+    """Cuaderno de una sesión con el tema 'cuaderno'"""
+    return {
+        'title': session['title'],
+        'theme': 'cuaderno',
+        'blocks': [
+            ('box', 'Curso Intensivo de Espanol - Nivel 3 CLM', [
+                'Periodo: 6 - 27 de noviembre de 2025',
+                'Profesor: Javier Benitez Lainez | Aula: 24',
+                f'Duracion: {session["duracion"]}',
+            ]),
+            ('section', 'OBJETIVOS DE LA SESION:'),
+            ('bullets', session['objetivos']),
+            ('space', 3),
+            ('section', 'VOCABULARIO CLAVE:'),
+            *[block for key, value in session['vocab'].items()
+              for block in (('line', key + ':', 'label'), ('text', value))],
+            ('section', 'ACTIVIDADES DE CLASE:'),
+            ('bullets', [f'{i}. {act}' for i, act in enumerate(session['actividades'], 1)], 'item'),
+            ('space', 3),
+            ('section', 'TAREA PARA CASA:'),
+            ('bullets', session['tarea']),
+            ('space', 10),
+            ('rule',),
+            ('space', 5),
+            ('line', 'Universidad de Granada - Centro de Lenguas Modernas', 'note'),
+        ],
+    }
 
-    # Save
-    os.makedirs('materials/cuadernos', exist_ok=True)
-    filename = f'materials/cuadernos/S{session["num"]}_Espanol_Intensivo.pdf'
-    pdf.output(filename)
-    print(f"✅ Created {filename}")
 
-# Generate all sessions
-print("📚 Creating session notebooks...")
 for session in sessions:
-    create_session_pdf(session)
+    register(f'cuaderno-S{session["num"]}', f'materials/cuadernos/S{session["num"]}_Espanol_Intensivo.pdf',
+             lambda session=session: session_spec(session), group='cuadernos')
+
+if __name__ == "__main__":
+    print("📚 Creating session notebooks...")
+    build_group('cuadernos')
 
-print("\n🎉 All session notebooks created successfully!")
-print("✨ Check materials/cuadernos/ for the new PDFs")
+    print("\n🎉 All session notebooks created successfully!")
+    print("✨ Check materials/cuadernos/ for the new PDFs")
@@ -0,0 +1,335 @@
+#!/usr/bin/env python3
+"""
+Prueba de carga reproducible del API de user_system.py
+
+Crea N usuarios sintéticos con UserSystem.create_user en un directorio
+temporal, inicia sesión con todos y lanza cargas de trabajo como las de una
+clase real:
+
+- burst: ráfaga de registros de asistencia (POST /api/attendance) al mostrar el QR;
+  se envían con la clave de administración, que admite fechas distintas de hoy
+- polling: el panel de index.html consultando GET /api/progress con If-None-Match
+- quiz: envío de resultados de quiz (POST /api/quiz)
+- mixed: las tres a la vez (50 % asistencia, 35 % panel, 15 % quiz)
+
+Se puede atacar la app Flask con su cliente de pruebas (--target testclient,
+sin red: mide el manejador y la persistencia) o un servidor real (flask, asgi o
+production). Para cada carga informa de peticiones/s, latencias p50/p95/p99,
+errores, bytes de respuesta y bytes escritos a disco por petición. La secuencia
+de operaciones sale de una semilla fija, así que dos ejecuciones son comparables.
+
+    python loadtest_user_system.py --target testclient --backend json
+    python loadtest_user_system.py --target production --workers 4 --output resultados.json
+"""
+
+import argparse
+import http.client
+import itertools
+import json
+import os
+import random
+import secrets
+import shutil
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
+
+SCENARIOS = {
+    'burst': {'checkin': 100},
+    'polling': {'progress': 100},
+    'quiz': {'quiz': 100},
+    'mixed': {'checkin': 50, 'progress': 35, 'quiz': 15},
+}
+# Los mismos campos que pide el panel de index.html
+PROGRESS_FIELDS = ('attendance.attended_classes,attendance.attendance_rate,'
+                   'materials.exercises_completed,materials.completion_rate,'
+                   'quiz_scores.total_quizzes,quiz_scores.accuracy_rate')
+FIRST_CLASS_DATE = date(2025, 1, 6)
+# Igual que en benchmark_user_system.py: la prueba mide la persistencia, no el hash
+SEED_HASH_ITERATIONS = 1000
+
+
+def load_api(directory, backend):
+    """Importar user_system dentro del directorio de la prueba
+
+    user_system crea su almacenamiento por defecto al importarse, en el
+    directorio actual: así los datos de la prueba no acaban en el repositorio.
+    """
+    os.environ['USER_STORAGE'] = backend
+    os.environ['PASSWORD_HASH_ITERATIONS'] = str(SEED_HASH_ITERATIONS)
+    # La hereda también el servidor de HttpDriver
+    os.environ.setdefault('ADMIN_API_KEY', secrets.token_hex(16))
+    os.chdir(directory)
+    import user_system
+    return user_system
+
+
+def seed_users(api, count):
+    """Crear usuarios con UserSystem.create_user; devuelve [(user_id, contraseña)]"""
+    credentials = []
+    for i in range(count):
+        user = api.user_system.create_user(f'Estudiante {i}', f'estudiante{i}@ejemplo.com', f'2025{i:05d}')
+        credentials.append((user['id'], user['password']))
+    return credentials
+
+
+class TestClientDriver:
+    """Peticiones a la app Flask con su cliente de pruebas, en este mismo proceso"""
+
+    def __init__(self, api):
+        self.api = api
+        self.local = threading.local()
+        self.pids = [os.getpid()]
+
+    def request(self, method, path, body=None, headers=None):
+        client = getattr(self.local, 'client', None)
+        if client is None:
+            client = self.local.client = self.api.app.test_client()
+        response = client.open(path, method=method, json=body, headers=headers or {})
+        return response.status_code, response.get_data(), response.headers
+
+    def close(self):
+        self.api.user_system.storage.close()
+
+
+class HttpDriver:
+    """Peticiones a un servidor real, con una conexión HTTP por hilo"""
+
+    def __init__(self, directory, backend, kind, workers):
+        from benchmark_user_system import free_port, start_http_server
+        self.port = free_port()
+        self.process = start_http_server(kind, directory, self.port, workers, backend)
+        self.pids = [self.process.pid]
+        self.local = threading.local()
+
+    def request(self, method, path, body=None, headers=None):
+        headers = dict(headers or {})
+        payload = None
+        if body is not None:
+            payload = json.dumps(body).encode('utf-8')
+            headers['Content-Type'] = 'application/json'
+        for attempt in range(2):
+            connection = getattr(self.local, 'connection', None)
+            if connection is None:
+                connection = self.local.connection = http.client.HTTPConnection(
+                    '127.0.0.1', self.port, timeout=30)
+            try:
+                connection.request(method, path, body=payload, headers=headers)
+                response = connection.getresponse()
+                return response.status, response.read(), response.headers
+            except (http.client.HTTPException, OSError):
+                # El servidor cerró una conexión reutilizada: se reintenta una vez con otra
+                connection.close()
+                self.local.connection = None
+        return 0, b'', {}
+
+    def close(self):
+        from benchmark_user_system import stop_http_server
+        stop_http_server(self.process)
+
+
+def process_tree(pids):
+    """pids más todos sus descendientes (p. ej. los workers de uvicorn o de --production)"""
+    found, pending = [], list(pids)
+    while pending:
+        pid = pending.pop()
+        found.append(pid)
+        try:
+            for task in os.listdir(f'/proc/{pid}/task'):
+                with open(f'/proc/{pid}/task/{task}/children') as f:
+                    pending.extend(int(child) for child in f.read().split())
+        except OSError:
+            pass
+    return found
+
+
+def disk_bytes(pids, directory):
+    """Bytes enviados a disco por los procesos (Linux); si no, tamaño de los datos"""
+    total = 0
+    try:
+        for pid in process_tree(pids):
+            with open(f'/proc/{pid}/io') as f:
+                fields = dict(line.split(': ') for line in f.read().splitlines())
+            total += int(fields['write_bytes'])
+        return total
+    except (OSError, KeyError):
+        return sum(entry.stat().st_size for entry in os.scandir(directory) if entry.is_file())
+
+
+def percentile(values, fraction):
+    return values[min(int(len(values) * fraction), len(values) - 1)]
+
+
+class Workload:
+    """Operaciones del API; los contadores compartidos evitan repetir una asistencia"""
+
+    def __init__(self, driver, user_ids, tokens, seed):
+        self.driver = driver
+        self.user_ids = user_ids
+        self.tokens = tokens
+        self.random = random.Random(seed)
+        self.checkins = itertools.count()
+        self.etags = {}
+
+    def auth(self, index):
+        return {'Authorization': f'Bearer {self.tokens[index]}'}
+
+    def checkin(self, index):
+        # Cada (usuario, día) sale una sola vez: una asistencia repetida sería un 400
+        number = next(self.checkins)
+        user = number % len(self.user_ids)
+        class_date = (FIRST_CLASS_DATE + timedelta(days=number // len(self.user_ids))).isoformat()
+        return self.driver.request('POST', '/api/attendance', {
+            'user_id': self.user_ids[user], 'class_date': class_date
+        }, {'X-Admin-Key': os.environ['ADMIN_API_KEY']})
+
+    def progress(self, index):
+        user = index % len(self.user_ids)
+        headers = self.auth(user)
+        if user in self.etags:
+            headers['If-None-Match'] = self.etags[user]
+        result = self.driver.request('GET', f'/api/progress/{self.user_ids[user]}?fields={PROGRESS_FIELDS}',
+                                     None, headers)
+        if result[0] == 200 and result[2].get('ETag'):
+            self.etags[user] = result[2]['ETag']
+        return result
+
+    def quiz(self, index):
+        user = index % len(self.user_ids)
+        return self.driver.request('POST', '/api/quiz', {
+            'quiz_id': f'quiz_{index % 8 + 1}',
+            'correct_answers': index % 11,
+            'total_questions': 10
+        }, self.auth(user))
+
+    def schedule(self, mix, requests):
+        """Secuencia reproducible de (operación, índice) con las proporciones de mix"""
+        operations, weights = zip(*mix.items())
+        return [(operation, self.random.randrange(len(self.user_ids)))
+                for operation in self.random.choices(operations, weights, k=requests)]
+
+
+def run_scenario(workload, name, requests, concurrency, directory):
+    """Ejecutar una carga; devuelve sus métricas globales y por operación"""
+    plan = workload.schedule(SCENARIOS[name], requests)
+    ok_status = {'checkin': (200,), 'progress': (200, 304), 'quiz': (200,)}
+
+    def run(step):
+        operation, index = step
+        start = time.perf_counter()
+        status, body, _ = getattr(workload, operation)(index)
+        return operation, time.perf_counter() - start, status, len(body)
+
+    disk_before = disk_bytes(workload.driver.pids, directory)
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        results = list(pool.map(run, plan))
+    elapsed = time.perf_counter() - start
+    # Dar tiempo a que el diario agrupado termine de escribir lo pendiente
+    time.sleep(0.2)
+    written = disk_bytes(workload.driver.pids, directory) - disk_before
+
+    def summary(rows):
+        latencies = sorted(latency for _, latency, _, _ in rows)
+        return {
+            'requests': len(rows),
+            'p50_ms': round(percentile(latencies, 0.50) * 1000, 2),
+            'p95_ms': round(percentile(latencies, 0.95) * 1000, 2),
+            'p99_ms': round(percentile(latencies, 0.99) * 1000, 2),
+            'errors': sum(1 for operation, _, status, _ in rows if status not in ok_status[operation]),
+            'not_modified': sum(1 for _, _, status, _ in rows if status == 304),
+            'response_bytes': round(sum(size for _, _, _, size in rows) / len(rows), 1),
+        }
+
+    report = summary(results)
+    report.update(throughput=round(len(results) / elapsed, 1),
+                  disk_bytes_per_request=round(written / len(results), 1))
+    report['operations'] = {operation: summary([row for row in results if row[0] == operation])
+                            for operation in SCENARIOS[name]}
+    return report
+
+
+def print_report(name, report):
+    print(f"\n   {name}: {report['throughput']:.0f} peticiones/s, "
+          f"{report['disk_bytes_per_request']:.0f} bytes a disco por petición, {report['errors']} errores")
+    for operation, row in report['operations'].items():
+        extra = f", {row['not_modified']} sin cambios (304)" if row['not_modified'] else ''
+        print(f"      {operation:>8}: {row['requests']:>6} peticiones  p50 {row['p50_ms']:>7.2f} ms  "
+              f"p95 {row['p95_ms']:>7.2f} ms  p99 {row['p99_ms']:>7.2f} ms  "
+              f"{row['response_bytes']:>6.0f} B/respuesta, {row['errors']} errores{extra}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Prueba de carga del API del sistema de usuarios')
+    parser.add_argument('--target', choices=['testclient', 'flask', 'asgi', 'production'],
+                        default='testclient')
+    parser.add_argument('--backend', choices=['json', 'sqlite'], default='json')
+    parser.add_argument('--users', type=int, default=500)
+    parser.add_argument('--requests', type=int, default=5000, help='Peticiones por carga de trabajo')
+    parser.add_argument('--concurrency', type=int, default=32)
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1)
+    parser.add_argument('--scenarios', default='burst,polling,quiz,mixed')
+    parser.add_argument('--seed', type=int, default=2025)
+    parser.add_argument('--output', help='Guardar las métricas en un archivo JSON')
+    args = parser.parse_args()
+
+    scenarios = args.scenarios.split(',')
+    unknown = [name for name in scenarios if name not in SCENARIOS]
+    if unknown:
+        parser.error(f"Cargas desconocidas: {', '.join(unknown)}")
+
+    workers = 1 if args.target in ('testclient', 'flask') else args.workers
+    # Varios procesos solo pueden compartir SQLite
+    backend = 'sqlite' if args.target == 'production' or workers > 1 else args.backend
+    output = os.path.abspath(args.output) if args.output else None
+    directory = tempfile.mkdtemp(prefix='loadtest_users_')
+    cwd = os.getcwd()
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    try:
+        api = load_api(directory, backend)
+        start = time.perf_counter()
+        credentials = seed_users(api, args.users)
+        print(f"📊 Prueba de carga: {args.target} ({workers} workers, {backend}), "
+              f"{args.users} usuarios creados en {time.perf_counter() - start:.1f} s, "
+              f"{args.requests} peticiones por carga, {args.concurrency} clientes")
+
+        if args.target == 'testclient':
+            driver = TestClientDriver(api)
+        else:
+            # El servidor abre los mismos archivos: se vuelca y se cierra el almacenamiento local
+            api.user_system.storage.close()
+            driver = HttpDriver(directory, backend, args.target, workers)
+        try:
+            with ThreadPoolExecutor(max_workers=args.concurrency) as pool:
+                logins = list(pool.map(lambda credential: driver.request('POST', '/api/login', {
+                    'user_id': credential[0], 'password': credential[1]}), credentials))
+            if any(status != 200 for status, _, _ in logins):
+                print("❌ No se pudo iniciar sesión con todos los usuarios")
+                sys.exit(1)
+            tokens = [json.loads(body)['token'] for _, body, _ in logins]
+
+            workload = Workload(driver, [user_id for user_id, _ in credentials], tokens, args.seed)
+            results = {}
+            for name in scenarios:
+                results[name] = run_scenario(workload, name, args.requests, args.concurrency, directory)
+                print_report(name, results[name])
+        finally:
+            driver.close()
+    finally:
+        os.chdir(cwd)
+        shutil.rmtree(directory, ignore_errors=True)
+
+    if output:
+        with open(output, 'w', encoding='utf-8') as f:
+            json.dump({'target': args.target, 'backend': backend, 'workers': workers,
+                       'users': args.users, 'requests': args.requests,
+                       'concurrency': args.concurrency, 'seed': args.seed,
+                       'scenarios': results}, f, ensure_ascii=False, indent=2)
+        print(f"\n💾 Métricas guardadas en {output}")
+
+
+if __name__ == "__main__":
+    main()
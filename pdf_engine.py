@@ -0,0 +1,743 @@
+#!/usr/bin/env python3
+"""
+Motor de generación de los PDFs del curso
+
+Cada documento se describe con una especificación de datos:
+
+    {'title': 'Frases Útiles', 'theme': 'profesional', 'subtitle': '...',
+     'blocks': [('chapter', 'Frases Útiles en Español'),
+                ('box', 'Objetivo', ['Colección de frases...']),
+                ('section', '1. Presentaciones'),
+                ('bullets', ['Hola, me llamo [nombre].', ...]),
+                ('page',), ...]}
+
+La capa de maquetación (CoursePDF) es común a todos: el tema fija encabezado,
+pie, márgenes, tipografía y los estilos con los que se pinta cada bloque. Los
+scripts de contenido registran sus documentos como objetivos de construcción
+con @target; la función de cada objetivo solo devuelve la especificación y solo
+se ejecuta cuando se construye ese objetivo:
+
+    python pdf_engine.py --list
+    python pdf_engine.py guia-curso cuaderno-S3
+    python pdf_engine.py --group cuadernos
+    python pdf_engine.py --all
+
+Las construcciones son incrementales: el manifiesto (MANIFEST_PATH) guarda por
+objetivo el hash de su especificación, del tema, de TEMPLATE_VERSION y de las
+fuentes. Si el hash no cambia y el PDF sigue en su sitio, el objetivo se salta
+sin maquetarlo; --force reconstruye igualmente. Los objetivos pendientes se
+maquetan en paralelo en un ProcessPoolExecutor (BUILD_WORKERS procesos, -j en
+la línea de órdenes); los mensajes salen siempre en el orden de registro.
+
+Los documentos se pintan con las fuentes DejaVu de fonts/ (o de PDF_FONT_DIR y
+los demás FONT_DIRS) en TrueType Unicode: tildes, ñ y ¿ ¡ salen tal cual y cada
+PDF incrusta solo los glifos que usa. Sin ellas (o con PDF_UNICODE_FONTS=0) se
+usan las fuentes estándar con el perfil de texto del tema; si solo falta alguna
+cara (negrita o cursiva) la construcción falla con FileNotFoundError.
+"""
+
+import argparse
+import functools
+import hashlib
+import importlib
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import fpdf
+from fpdf import FPDF
+
+from text_normalizer import normalize
+
+# Subir al cambiar CoursePDF o text_normalizer de forma que altere los PDFs ya
+# generados (los temas y estilos ya forman parte del hash de cada objetivo)
+TEMPLATE_VERSION = 5
+MANIFEST_PATH = 'materials/.build-manifest.json'
+# Procesos para maquetar en paralelo (1 = en el propio proceso)
+BUILD_WORKERS = int(os.environ.get('PDF_BUILD_WORKERS', os.cpu_count() or 1))
+# Fuentes TrueType Unicode: familia estándar -> archivo base y dónde buscarlo
+USE_UNICODE_FONTS = os.environ.get('PDF_UNICODE_FONTS', '1') != '0'
+UNICODE_FONTS = {'Arial': 'DejaVuSans', 'Helvetica': 'DejaVuSans', 'Courier': 'DejaVuSansMono'}
+FONT_DIRS = (
+    os.environ.get('PDF_FONT_DIR', ''),
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fonts'),
+    '/usr/share/fonts/truetype/dejavu',
+    '/usr/share/fonts/dejavu',
+    '/usr/share/fonts/TTF',
+    '/Library/Fonts',
+    'C:\\Windows\\Fonts',
+)
+
+# Scripts de contenido: cada uno registra sus objetivos al importarse
+CONTENT_MODULES = (
+    'create_professional_materials',
+    'session_generator',
+    'create_session_pdfs',
+    'conversation_generator',
+    'create_rutina_cultural_v2',
+)
+
+def style(emphasis='', size=11, color=(0, 0, 0), height=6, **options):
+    """Estilo de texto: énfasis ('', 'B', 'I'), tamaño, color RGB, alto de línea
+
+    Opciones: family, align, x (sangría absoluta), after (espacio posterior) y
+    las propias de cada bloque (viñetas, pares, cajas).
+    """
+    return dict(emphasis=emphasis, size=size, color=color, height=height, **options)
+
+
+NAVY = (0, 51, 102)
+STEEL = (51, 102, 153)
+GREEN = (0, 153, 51)
+GREY = (102, 102, 102)
+LIGHT_GREY = (128, 128, 128)
+DARK_GREY = (51, 51, 51)
+BROWN = (139, 69, 19)
+BLUE = (0, 102, 204)
+OCEAN = (0, 96, 150)
+BOX_FILL = (240, 248, 255)
+BOX_BORDER = (100, 149, 237)
+
+# Materiales del curso (create_professional_materials.py)
+PROFESSIONAL_STYLES = {
+    'header_title': style('B', 20, NAVY, 15, align='C'),
+    'header_course': style('I', 12, GREY, 8, align='C'),
+    'header_period': style('B', 14, GREEN, 10, align='C'),
+    'footer': style('I', 9, LIGHT_GREY, 6, align='C'),
+    'chapter': style('B', 16, NAVY, 10, after=3),
+    'section': style('B', 13, STEEL, 8, after=2),
+    'body': style('', 11, height=5, after=3),
+    'line': style('', 11),
+    'label': style('B', 11, height=8),
+    'heading': style('B', 12, NAVY, 8),
+    'muted': style('', 10, GREY),
+    'caption': style('I', 10, (0, 102, 0)),
+    'footnote': style('I', 9, GREY, 5, x=20),
+    'answer': style('', 11, (153, 0, 0)),
+    'key': style('', 11, (0, 153, 0)),
+    'option': style('', 11, GREY, x=25),
+    'hint': style('', 11, (100, 100, 100)),
+    'indent': style('', 11, x=20),
+    'italic': style('I', 11, GREY, 8),
+    'aside': style('I', 10, GREY, 5),
+    'exercise': style('', 11, after=2),
+    'prompt': style('', 11, height=4, x=15, after=2),
+    'blank': style('', 11, height=4, x=20, after=2),
+    'note': style('I', 11, GREY, 7, align='C'),
+    'bullet': style('', 11, height=5, indent=10, marker='-', after=1),
+    'pair': style('B', 11, width=80, value='pair_value', prefix='- '),
+    'pair_value': style('', 10, GREY),
+    'summary': style('B', 11, height=8, width=100, value='summary_value'),
+    'summary_value': style('', 11, height=8),
+    'conjugation': style('B', 11, width=50, value='pair_value'),
+    'box': dict(x=10, width=190, inset=3, pad=3, gap=0, after=5, fill=BOX_FILL, draw=BOX_BORDER,
+                title='box_title', text='box_text'),
+    'box_title': style('B', 12, NAVY, 6),
+    'box_text': style('', 11, DARK_GREY, 5),
+    'table_head': style('B', 10, height=8),
+    'table_cell': style('', 10, height=10),
+}
+
+# Fichas de sesión (session_generator.py)
+SESSION_STYLES = {
+    'header_title': style('B', 14, NAVY, 10, align='C'),
+    'header_course': style('I', 10, GREY, 5, align='C'),
+    'header_session': style('B', 9, GREEN, 5, align='C'),
+    'footer': style('I', 8, LIGHT_GREY, 5, align='C'),
+    'section': style('B', 12, BROWN, 8, after=3),
+    'bullet': style('', 10, height=5, prefix='- ', after=3),
+    'item': style('', 10, height=5, after=3),
+}
+
+# Cuadernos de sesión (create_session_pdfs.py)
+NOTEBOOK_STYLES = {
+    'header_title': style('B', 18, NAVY, 10, align='C'),
+    'footer': style('I', 8, LIGHT_GREY, 10, align='C'),
+    'section': style('B', 13, STEEL, 8),
+    'label': style('B', 11),
+    'body': style('', 10, height=5, after=2),
+    'bullet': style('', 11, prefix='- '),
+    'item': style('', 11),
+    'note': style('I', 9, GREY, 4, align='C'),
+    'rule': dict(draw=BOX_BORDER),
+    'box': dict(x=10, width=190, inset=2, pad=2, gap=0, after=6, fill=BOX_FILL, draw=BOX_BORDER,
+                title='box_title', text='box_text'),
+    'box_title': style('B', 11, NAVY, 7),
+    'box_text': style('', 10, DARK_GREY),
+}
+
+# Prácticas de conversación y guía cultural (conversation_generator.py)
+CONVERSATION_STYLES = {
+    'header_title': style('B', 16, NAVY, 10, align='C'),
+    'header_course': style('I', 10, GREY, 6, align='C'),
+    'footer': style('I', 9, LIGHT_GREY, 6, align='C'),
+    'title': style('B', 16, NAVY, 10, align='C'),
+    'subtitle': style('I', 10, GREY, 6, align='C'),
+    'chapter': style('B', 14, NAVY, 10, align='C', after=5),
+    'section': style('B', 12, BROWN, 8, after=3),
+    'label': style('B', 11, height=8, after=3),
+    'body': style('', 11, after=8),
+    'small': style('', 10, after=3),
+    'category': style('B', 10, BLUE),
+    'item': style('', 10, after=2),
+    'dialogue': style('B', 10, BLUE, width=30, value='dialogue_text', wrap=True, after=2),
+    'dialogue_text': style('', 10),
+    'spanish': style('B', 10, BLUE),
+    'english': style('I', 10, GREY, after=4),
+}
+
+# Presentaciones de clase (create_rutina_cultural_v2.py)
+PRESENTATION_STYLES = {
+    'header_title': style('B', 16, NAVY, 10, align='C'),
+    'footer': style('I', 8, LIGHT_GREY, 10, align='C'),
+    'cover': style('B', 20, NAVY, 15, align='C'),
+    'cover_subtitle': style('', 12, DARK_GREY, 8, align='C'),
+    'intro': style('I', 11, DARK_GREY),
+    'chapter': style('B', 14, OCEAN, 10, after=3),
+    'section': style('B', 12, STEEL, 8, after=2),
+    'body': style('', 11, after=2),
+    'small': style('', 10, height=5, after=2),
+    'label': style('B', 11),
+    'case_label': style('B', 10),
+    'alert': style('B', 10, (180, 0, 0)),
+    'ok': style('B', 10, (0, 128, 0)),
+    'emphasis': style('B', 11, OCEAN),
+    'mono': style('', 10, family='Courier'),
+    'mono_small': style('', 10, height=5, family='Courier'),
+    'closing': style('B', 12, OCEAN, 8, align='C'),
+    'closing_note': style('I', 10, (100, 100, 100), align='C'),
+    'bullet': style('', 11, indent=10, prefix='- '),
+    'box': dict(x=15, width=180, inset=5, pad=3, gap=2, after=3, fill=BOX_FILL, draw=BOX_BORDER,
+                title='box_title', text='box_text'),
+    'box_title': style('B', 11, NAVY),
+    'box_text': style('', 10, height=5),
+}
+
+# Tema: tipografía, perfil de texto (ver text_normalizer), márgenes (izq., arriba,
+# der.), salto de página automático, líneas de encabezado y pie ({title},
+# {subtitle}, {page} y {nb} se sustituyen)
+THEMES = {
+    'profesional': {
+        'family': 'Arial', 'text': 'ascii', 'margins': (10, 10, 10), 'break_margin': 25,
+        'header': [('header_title', '{title}'),
+                   ('header_course', 'Curso Intensivo de Español - Nivel 3 CLM'),
+                   ('header_period', 'Periodo: 6 - 27 de noviembre de 2025')],
+        'header_space': 10,
+        'footer_y': -25,
+        'footer': [('footer', 'Página {page} de {nb}'),
+                   ('footer', 'Profesor: Javier Benítez Laínez | Aula: A2'),
+                   ('footer', 'Universidad de Granada - Centro de Lenguas Modernas')],
+        'styles': PROFESSIONAL_STYLES,
+    },
+    'sesion': {
+        'family': 'Arial', 'text': 'ascii', 'margins': (15, 25, 15), 'break_margin': 20,
+        'header': [('header_title', '{title}'),
+                   ('header_course', 'Curso Intensivo de Español - Nivel 3 CLM (A1.2-A2.1)'),
+                   ('header_session', '{subtitle}')],
+        'header_space': 8,
+        'footer_y': -20,
+        'footer': [('footer', 'Página {page}'),
+                   ('footer', 'Profesor: Javier Benítez Laínez | Lunes-Jueves 8:30-10:30')],
+        'styles': SESSION_STYLES,
+    },
+    'cuaderno': {
+        'family': 'Helvetica', 'text': 'ascii', 'margins': (10, 10, 10), 'break_margin': 20,
+        'header': [('header_title', '{title}')],
+        'header_space': 2,
+        'footer_y': -15,
+        'footer': [('footer', 'Página {page}')],
+        'styles': NOTEBOOK_STYLES,
+    },
+    'conversacion': {
+        'family': 'Arial', 'text': 'latin1', 'margins': (10, 10, 10), 'break_margin': 20,
+        'header': [('header_title', 'Práctica de Conversación - Curso Intensivo de Español'),
+                   ('header_course', 'Nivel 3 CLM (A1.2-A2.1) - Universidad de Granada')],
+        'header_space': 8,
+        'footer_y': -20,
+        'footer': [('footer', 'Página {page} de {nb}'),
+                   ('footer', 'Profesor: Javier Benítez Laínez | Centro de Lenguas Modernas')],
+        'styles': CONVERSATION_STYLES,
+    },
+    'guia': {
+        'family': 'Arial', 'text': 'latin1', 'margins': (10, 10, 10), 'break_margin': 20,
+        'header': [], 'header_space': 0, 'footer_y': -15, 'footer': [],
+        'styles': CONVERSATION_STYLES,
+    },
+    'presentacion': {
+        'family': 'Helvetica', 'text': 'ascii', 'margins': (10, 10, 10), 'break_margin': 15,
+        'header': [('header_title', '{title}')],
+        'header_space': 5,
+        'footer_y': -15,
+        'footer': [('footer', 'Universidad de Granada - CLM | Página {page}')],
+        'styles': PRESENTATION_STYLES,
+    },
+}
+
+
+# Fuentes TrueType: cada documento las registra con add_font(..., uni=True) y
+# fpdf incrusta solo los glifos que se escriben (y los dígitos del alias {nb})
+FACE_SUFFIXES = {'': '', 'B': '-Bold', 'I': '-Oblique', 'BI': '-BoldOblique'}
+
+
+@functools.lru_cache(maxsize=None)
+def find_font(filename):
+    for directory in FONT_DIRS:
+        if directory and os.path.isfile(os.path.join(directory, filename)):
+            return os.path.join(directory, filename)
+    return None
+
+
+@functools.lru_cache(maxsize=None)
+def unicode_faces(family):
+    """Archivo TTF por énfasis de una familia estándar, o None si no hay fuente
+
+    Si está la recta pero falta otro énfasis es un error: no se pinta en
+    silencio la cursiva con la recta.
+    """
+    base = UNICODE_FONTS.get(family)
+    regular = base and find_font(f'{base}.ttf')
+    if not regular:
+        return None
+    faces = {emphasis: find_font(f'{base}{suffix}.ttf') for emphasis, suffix in FACE_SUFFIXES.items()}
+    missing = [f'{base}{FACE_SUFFIXES[emphasis]}.ttf' for emphasis, path in faces.items() if not path]
+    if missing:
+        raise FileNotFoundError(f"Faltan fuentes de {base}: {', '.join(missing)} (ver FONT_DIRS)")
+    return faces
+
+
+def theme_families(theme):
+    """Familias tipográficas que usa un tema"""
+    return sorted({theme['family']} | {current['family'] for current in theme['styles'].values()
+                                       if 'family' in current})
+
+
+def theme_unicode(theme):
+    return USE_UNICODE_FONTS and all(unicode_faces(family) for family in theme_families(theme))
+
+
+def font_set(theme):
+    """Fuentes con las que se pinta un tema: archivos TTF (con tamaño) o familias estándar"""
+    if not theme_unicode(theme):
+        return theme_families(theme)
+    paths = {path for family in theme_families(theme) for path in unicode_faces(family).values()}
+    return sorted(f'{path}:{os.path.getsize(path)}' for path in paths)
+
+
+def preload_fonts(themes):
+    """Registrar y escribir una vez cada fuente antes de repartir el trabajo
+
+    pyfpdf guarda junto a cada TTF sus métricas y su tabla de anchos (.pkl) la
+    primera vez que la usa: así no las escriben varios workers a la vez.
+    """
+    pdf = FPDF()
+    pdf.add_page()
+    # Varias familias del tema pueden compartir el mismo TTF
+    fonts = {UNICODE_FONTS[family]: family
+             for theme in themes if theme_unicode(theme) for family in theme_families(theme)}
+    for name, family in sorted(fonts.items()):
+        for emphasis, path in unicode_faces(family).items():
+            pdf.add_font(name, emphasis, path, uni=True)
+            pdf.set_font(name, emphasis, 10)
+            pdf.cell(0, 5, 'ñ', 0, 1)
+    pdf.output(os.devnull)
+
+
+class CoursePDF(FPDF):
+    """Capa de maquetación común: pinta una especificación con su tema"""
+
+    def __init__(self, spec):
+        super().__init__()
+        self.spec = spec
+        self.theme = THEMES[spec.get('theme', 'profesional')]
+        self.styles = self.theme['styles']
+        self.unicode = theme_unicode(self.theme)
+        self.unicode_registered = set()
+        self.profile = 'spanish' if self.unicode else self.theme['text']
+        left, top, right = self.theme['margins']
+        self.set_margins(left, top, right)
+        self.set_auto_page_break(auto=True, margin=self.theme['break_margin'])
+        # Los metadatos del PDF van en latin-1 sea cual sea la fuente
+        self.set_title(normalize(spec['title'], 'latin1'))
+        self.set_author('Centro de Lenguas Modernas - Universidad de Granada')
+        self.alias_nb_pages()
+
+    def clean(self, text):
+        return normalize(text, self.profile)
+
+    def unicode_font(self, family, emphasis):
+        """Registrar (una vez por documento) el TTF de ese énfasis; devuelve la familia"""
+        name = UNICODE_FONTS[family]
+        if (name, emphasis) not in self.unicode_registered:
+            self.add_font(name, emphasis, unicode_faces(family)[emphasis], uni=True)
+            self.unicode_registered.add((name, emphasis))
+        return name
+
+    def multi_cell(self, *args, **kwargs):
+        """multi_cell que deja el cursor en el margen izquierdo, como pyfpdf (fpdf2 lo deja a la derecha)"""
+        result = super().multi_cell(*args, **kwargs)
+        self.set_x(self.l_margin)
+        return result
+
+    def use(self, name):
+        """Activar el estilo indicado y devolverlo"""
+        current = self.styles[name]
+        family, emphasis = current.get('family', self.theme['family']), current['emphasis']
+        if self.unicode:
+            family = self.unicode_font(family, emphasis)
+        self.set_font(family, emphasis, current['size'])
+        self.set_text_color(*current['color'])
+        return current
+
+    def fill(self, template):
+        return (template.replace('{title}', self.spec['title'])
+                .replace('{subtitle}', self.spec.get('subtitle', ''))
+                .replace('{page}', str(self.page_no())))
+
+    def header(self):
+        for name, template in self.theme['header']:
+            current = self.use(name)
+            self.cell(0, current['height'], self.clean(self.fill(template)), 0, 1, current.get('align', 'L'))
+        if self.theme['header_space']:
+            self.ln(self.theme['header_space'])
+
+    def footer(self):
+        if not self.theme['footer']:
+            return
+        self.set_y(self.theme['footer_y'])
+        for name, template in self.theme['footer']:
+            current = self.use(name)
+            self.cell(0, current['height'], self.clean(self.fill(template)), 0, 1, current.get('align', 'L'))
+
+    def wrapped_lines(self, text, width):
+        """Líneas que ocupa el texto en una multi_cell de ese ancho con la fuente actual"""
+        usable = width - 2 * self.c_margin
+        total = 0
+        for paragraph in text.split('\n'):
+            lines, current = 1, ''
+            for word in paragraph.split(' '):
+                candidate = f'{current} {word}' if current else word
+                if current and self.get_string_width(candidate) > usable:
+                    lines += 1
+                    current = word
+                else:
+                    current = candidate
+            total += lines
+        return total
+
+    def spaced(self, current):
+        if current.get('after'):
+            self.ln(current['after'])
+
+    def render(self, blocks):
+        self.add_page()
+        for kind, *args in blocks:
+            renderer = getattr(self, f'block_{kind}', None)
+            if renderer is None:
+                raise ValueError(f'Bloque desconocido: {kind}')
+            renderer(*args)
+
+    # Bloques de la especificación
+
+    def block_chapter(self, title):
+        current = self.use('chapter')
+        self.cell(0, current['height'], self.clean(title), 0, 1, current.get('align', 'L'))
+        self.spaced(current)
+
+    def block_section(self, title):
+        current = self.use('section')
+        self.cell(0, current['height'], self.clean(title), 0, 1, current.get('align', 'L'))
+        self.spaced(current)
+
+    def block_text(self, text, name='body'):
+        current = self.use(name)
+        if 'x' in current:
+            self.set_x(current['x'])
+        self.multi_cell(0, current['height'], self.clean(text), 0, current.get('align', 'L'))
+        self.spaced(current)
+
+    def block_line(self, text, name='line'):
+        current = self.use(name)
+        if 'x' in current:
+            self.set_x(current['x'])
+        self.cell(0, current['height'], self.clean(text), 0, 1, current.get('align', 'L'))
+        self.spaced(current)
+
+    def block_lines(self, lines, name='line'):
+        for line in lines:
+            self.block_line(line, name)
+
+    def block_bullets(self, items, name='bullet'):
+        current = self.use(name)
+        for item in items:
+            if current.get('indent'):
+                self.cell(current['indent'], current['height'], current.get('marker', ''), 0, 0)
+            self.multi_cell(0, current['height'], self.clean(current.get('prefix', '') + item))
+            self.spaced(current)
+
+    def block_pairs(self, pairs, name='pair'):
+        key = self.styles[name]
+        for term, meaning in pairs:
+            self.use(name)
+            self.cell(key['width'], key['height'], self.clean(term), 0, 0)
+            self.use(key['value'])
+            text = self.clean(key.get('prefix', '') + meaning)
+            if key.get('wrap'):
+                self.multi_cell(0, key['height'], text)
+            else:
+                self.cell(0, key['height'], text, 0, 1)
+            self.spaced(key)
+
+    def block_row(self, cells, name='line'):
+        current = self.use(name)
+        for position, (width, text) in enumerate(cells):
+            last = position == len(cells) - 1
+            self.cell(width, current['height'], self.clean(text), 0, 1 if last else 0)
+
+    def block_box(self, title, lines, name='box'):
+        box = self.styles[name]
+        head, body = self.styles[box['title']], self.styles[box['text']]
+        inner = box['width'] - 2 * box['inset']
+        texts = [self.clean(line) for line in lines]
+        self.use(box['text'])
+        rows = sum(self.wrapped_lines(text, inner) for text in texts)
+        height = 2 * box['pad'] + head['height'] + box['gap'] + rows * body['height']
+        if self.get_y() + height > self.page_break_trigger:
+            self.add_page()
+        self.set_fill_color(*box['fill'])
+        self.set_draw_color(*box['draw'])
+        self.rect(box['x'], self.get_y(), box['width'], height, 'FD')
+        self.set_y(self.get_y() + box['pad'])
+        self.use(box['title'])
+        self.set_x(box['x'] + box['inset'])
+        self.cell(inner, head['height'], self.clean(title), 0, 1)
+        if box['gap']:
+            self.ln(box['gap'])
+        self.use(box['text'])
+        for text in texts:
+            self.set_x(box['x'] + box['inset'])
+            self.multi_cell(inner, body['height'], text)
+        self.set_y(self.get_y() + box['pad'] + box['after'])
+
+    def block_table(self, columns, widths, rows):
+        head = self.use('table_head')
+        left = self.l_margin
+        right = left + sum(widths)
+        self.set_draw_color(0, 0, 0)
+        self.line(left, self.get_y(), right, self.get_y())
+        for column, width in zip(columns, widths):
+            self.cell(width, head['height'], self.clean(column), 0, 0, 'C')
+        self.ln(head['height'])
+        self.line(left, self.get_y(), right, self.get_y())
+        body = self.use('table_cell')
+        for row in rows:
+            if self.get_y() + body['height'] > self.page_break_trigger:
+                self.add_page()
+                self.use('table_cell')
+            for value, width in zip(row, widths):
+                self.cell(width, body['height'], self.clean(value), 0, 0, 'C')
+            self.ln(body['height'])
+            self.line(left, self.get_y(), right, self.get_y())
+
+    def block_rule(self):
+        self.set_draw_color(*self.styles['rule']['draw'])
+        self.line(self.l_margin, self.get_y(), self.w - self.r_margin, self.get_y())
+
+    def block_note(self, lines):
+        """Cierre del documento: líneas centradas en cursiva tras un respiro"""
+        self.set_y(self.get_y() + 20)
+        self.block_lines(lines, 'note')
+
+    def block_page(self):
+        self.add_page()
+
+    def block_space(self, height):
+        self.ln(height)
+
+    def block_ensure(self, limit):
+        """Saltar de página si el cursor ya pasó de la altura indicada"""
+        if self.get_y() > limit:
+            self.add_page()
+
+
+# nombre -> {'output', 'group', 'spec'}; el orden de registro es el orden de construcción
+TARGETS = {}
+_loaded = False
+
+
+def register(name, output, spec, group):
+    """Registrar un objetivo; cada archivo de salida tiene un único dueño"""
+    for other, existing in TARGETS.items():
+        if other != name and existing['output'] == output:
+            raise ValueError(f'{output} ya lo genera el objetivo {other}')
+    TARGETS[name] = {'output': output, 'group': group, 'spec': spec}
+
+
+def target(name, output, group):
+    """Decorador: la función decorada devuelve la especificación del documento"""
+    def decorator(spec):
+        register(name, output, spec, group)
+        return spec
+    return decorator
+
+
+def load_targets():
+    global _loaded
+    if not _loaded:
+        for module in CONTENT_MODULES:
+            importlib.import_module(module)
+        _loaded = True
+    return TARGETS
+
+
+def render(spec):
+    pdf = CoursePDF(spec)
+    pdf.render(spec['blocks'])
+    return pdf
+
+
+def spec_digest(spec):
+    """Hash de todo lo que determina el PDF: contenido, tema, plantilla y fuentes"""
+    theme = THEMES[spec.get('theme', 'profesional')]
+    payload = json.dumps({'template': TEMPLATE_VERSION, 'fpdf': fpdf.__version__,
+                          'fonts': font_set(theme), 'theme': theme, 'spec': spec},
+                         sort_keys=True, ensure_ascii=False)
+    return hashlib.blake2b(payload.encode('utf-8'), digest_size=16).hexdigest()
+
+
+def load_manifest(path=MANIFEST_PATH):
+    try:
+        with open(path, encoding='utf-8') as f:
+            return json.load(f)
+    except (FileNotFoundError, ValueError):
+        return {}
+
+
+def save_manifest(manifest, path=MANIFEST_PATH):
+    """Escritura atómica: archivo temporal y rename"""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    os.replace(tmp_path, path)
+
+
+def up_to_date(recorded, output, digest):
+    """El objetivo no cambió y su PDF es el que se generó (mismo tamaño)"""
+    if not recorded or recorded['hash'] != digest or recorded['output'] != output:
+        return False
+    try:
+        return os.stat(output).st_size == recorded['size']
+    except FileNotFoundError:
+        return False
+
+
+def render_target(spec, output):
+    """Maquetar y escribir un PDF; devuelve (tamaño, segundos). Se ejecuta en los workers"""
+    started = time.perf_counter()
+    render(spec).output(output)
+    return os.path.getsize(output), time.perf_counter() - started
+
+
+def build_targets(names, force=False, workers=None):
+    """Construir varios objetivos con un solo manifiesto
+
+    Los objetivos al día se saltan; el resto se reparte entre `workers`
+    procesos. Devuelve {nombre: True si se maquetó, False si estaba al día}.
+    """
+    targets = load_targets()
+    manifest = load_manifest()
+    results = {}
+    pending = []
+    for name in names:
+        entry = targets[name]
+        spec = entry['spec']()
+        digest = spec_digest(spec)
+        results[name] = force or not up_to_date(manifest.get(name), entry['output'], digest)
+        if results[name]:
+            pending.append((name, entry['output'], spec, digest))
+    if not pending:
+        return results
+
+    for _, output, _, _ in pending:
+        directory = os.path.dirname(output)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+    specs = [spec for _, _, spec, _ in pending]
+    outputs = [output for _, output, _, _ in pending]
+    preload_fonts({spec.get('theme', 'profesional'): THEMES[spec.get('theme', 'profesional')]
+                   for spec in specs}.values())
+    workers = min(workers or BUILD_WORKERS, len(pending))
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            # map entrega los resultados en el orden de envío
+            rendered = list(pool.map(render_target, specs, outputs))
+    else:
+        rendered = list(map(render_target, specs, outputs))
+
+    for (name, output, _, digest), (size, seconds) in zip(pending, rendered):
+        manifest[name] = {'hash': digest, 'output': output, 'size': size}
+        print(f"✅ Created {output} ({seconds * 1000:.1f} ms)")
+    save_manifest(manifest)
+    return results
+
+
+def build(name, force=False):
+    """Construir un objetivo; devuelve la ruta generada"""
+    build_targets([name], force)
+    return TARGETS[name]['output']
+
+
+def group_targets(group):
+    return [name for name, entry in load_targets().items() if entry['group'] == group]
+
+
+def build_group(group, force=False, workers=None):
+    names = group_targets(group)
+    results = build_targets(names, force, workers)
+    skipped = len(names) - sum(results.values())
+    if skipped:
+        print(f"⏩ {skipped} PDF(s) up to date in group {group}")
+    return [TARGETS[name]['output'] for name in names]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Construir los PDFs del curso')
+    parser.add_argument('targets', nargs='*', help='Objetivos a construir (ver --list)')
+    parser.add_argument('--group', action='append', default=[], help='Construir todos los objetivos de un grupo')
+    parser.add_argument('--all', action='store_true', help='Construir todos los objetivos')
+    parser.add_argument('--list', action='store_true', help='Listar los objetivos registrados')
+    parser.add_argument('--force', action='store_true', help='Reconstruir aunque el manifiesto diga que están al día')
+    parser.add_argument('-j', '--jobs', type=int, default=BUILD_WORKERS, help='Procesos para maquetar en paralelo')
+    args = parser.parse_args()
+
+    targets = load_targets()
+    if args.list or not (args.targets or args.group or args.all):
+        for name, entry in targets.items():
+            print(f"{name:28} {entry['group']:14} {entry['output']}")
+        return
+
+    unknown = [name for name in args.targets if name not in targets]
+    groups = {entry['group'] for entry in targets.values()}
+    unknown += [f'--group {group}' for group in args.group if group not in groups]
+    if unknown:
+        parser.error(f"objetivos desconocidos: {', '.join(unknown)}")
+
+    names = list(targets) if args.all else list(args.targets)
+    for group in args.group:
+        names += [name for name in group_targets(group) if name not in names]
+    print(f"📚 Building {len(names)} PDF(s)...")
+    started = time.perf_counter()
+    results = build_targets(names, args.force, args.jobs)
+    elapsed = (time.perf_counter() - started) * 1000
+    rebuilt = sum(results.values())
+    print(f"⏱️  {rebuilt} rebuilt, {len(names) - rebuilt} up to date in {elapsed:.1f} ms")
+
+
+if __name__ == '__main__':
+    # Los scripts de contenido importan pdf_engine: usar ese módulo y no __main__
+    # para que el registro de objetivos sea uno solo
+    import pdf_engine
+    pdf_engine.main()
@@ -3,38 +3,61 @@
 Script para iniciar el servidor de gestión de usuarios
 """
 
+import argparse
+import importlib.util
+import signal
+import socket
 import subprocess
 import sys
 import os
-import webbrowser
+import traceback
 import time
 from threading import Thread
 
-def check_requirements():
+def check_requirements(install=True):
     """Verificar que los requisitos están instalados"""
-    try:
-        import flask
-        import flask_cors
+    missing = [name for name in ('flask', 'flask_cors') if importlib.util.find_spec(name) is None]
+    if not missing:
         print("✅ Requisitos encontrados")
         return True
-    except ImportError as e:
-        print(f"❌ Falta el requisito: {e}")
-        print("📦 Instalando requisitos...")
-        subprocess.check_call([sys.executable, "-m", "pip", "install", "flask", "flask-cors"])
-        return True
+    print(f"❌ Falta el requisito: {', '.join(missing)}")
+    if not install:
+        print("📦 Instálalos antes de iniciar: pip install flask flask-cors")
+        return False
+    print("📦 Instalando requisitos...")
+    subprocess.check_call([sys.executable, "-m", "pip", "install", "flask", "flask-cors"])
+    return True
 
-def start_server():
-    """Iniciar el servidor Flask"""
-    print("🚀 Iniciando servidor de gestión de usuarios...")
-    print("📍 URL: http://localhost:5000")
+def print_endpoints():
+    """Mostrar los endpoints del API"""
     print("📚 API endpoints:")
+    print("   GET  /api/health - Estado del servidor")
     print("   POST /api/register - Registrar nuevo usuario")
-    print("   POST /api/login - Iniciar sesión")
+    print("   POST /api/login - Iniciar sesión (devuelve un token de sesión)")
+    print("   POST /api/logout - Cerrar sesión (revoca el token)")
+    print("   GET  /api/users/by-email?email= - Buscar usuario por email")
+    print("   GET  /api/users/by-student-id?student_id= - Buscar usuario por código")
     print("   GET  /api/progress/<user_id> - Obtener progreso")
     print("   POST /api/attendance - Registrar asistencia")
+    print("   POST /api/attendance/batch - Registrar asistencia de toda la clase")
+    print("   GET  /api/attendance/sync?cursor= - Registros de asistencia desde el cursor")
+    print("   POST /api/attendance/sync - Subir los check-ins guardados sin conexión")
+    print("   GET  /api/attendance/stream - Asistencia en vivo de una sesión (Server-Sent Events)")
+    print("   POST /api/attendance/tokens - Emitir token firmado para el QR de una sesión")
+    print("   POST /api/attendance/checkin - Canjear el token del QR y registrar la asistencia")
     print("   POST /api/materials - Actualizar materiales")
+    print("   POST /api/materials/batch - Actualizar varios materiales a la vez")
     print("   POST /api/quiz - Registrar quiz")
     print("   POST /api/projects - Completar proyecto")
+    print("   GET  /api/admin/summary - Resumen paginado de estudiantes")
+    if not os.environ.get('ADMIN_API_KEY'):
+        print("⚠️ ADMIN_API_KEY no está definida: las rutas del profesorado responderán 403")
+
+def start_server():
+    """Iniciar el servidor Flask"""
+    print("🚀 Iniciando servidor de gestión de usuarios...")
+    print("📍 URL: http://localhost:5000")
+    print_endpoints()
     print("\n🔄 Servidor iniciado. Presiona Ctrl+C para detener.")
     print("💡 Puedes mantener esta ventana abierta mientras usas la web.")
 
@@ -46,6 +69,114 @@ def start_server():
     except KeyboardInterrupt:
         print("\n👋 Servidor detenido")
 
+def start_asgi_server(host, port, workers):
+    """Iniciar la variante ASGI (user_system_asgi.py) con uvicorn y varios workers"""
+    try:
+        import uvicorn
+    except ImportError:
+        print("❌ El modo --asgi necesita uvicorn: pip install uvicorn")
+        sys.exit(1)
+
+    if workers > 1:
+        # Los workers son procesos distintos: necesitan un almacenamiento compartido
+        os.environ['USER_STORAGE'] = 'sqlite'
+    print(f"🚀 Iniciando servidor ASGI con {workers} workers "
+          f"(almacenamiento: {os.environ.get('USER_STORAGE', 'json')})...")
+    print(f"📍 URL: http://{host}:{port}")
+    print_endpoints()
+    print("\n🔄 Servidor iniciado. Presiona Ctrl+C para detener.")
+
+    uvicorn.run('user_system_asgi:app', host=host, port=port, workers=workers,
+                log_level='warning')
+    print("\n👋 Servidor detenido")
+
+def run_production_worker(listener, host, port):
+    """Proceso worker: sirve la app Flask en el socket compartido hasta recibir SIGTERM"""
+    from werkzeug.serving import make_server
+    from user_system import app, checkin_feed, user_system
+
+    server = make_server(host, port, app, threaded=True, fd=listener.fileno())
+    # Al parar se esperan las peticiones en curso en lugar de cortarlas
+    server.daemon_threads = False
+    server.block_on_close = True
+
+    def stop(signum, frame):
+        # Cerrar los streams de asistencia en vivo: si no, el cierre los esperaría
+        checkin_feed.close()
+        # shutdown() espera a que serve_forever termine: no puede llamarse desde su hilo
+        Thread(target=server.shutdown, daemon=True).start()
+
+    signal.signal(signal.SIGTERM, stop)
+    signal.signal(signal.SIGINT, stop)
+    try:
+        server.serve_forever()
+    finally:
+        server.server_close()
+        user_system.storage.close()
+
+def start_production_server(host, port, workers):
+    """Modo producción: sin preguntas ni debug, N workers pre-fork sobre el mismo puerto"""
+    if not hasattr(os, 'fork'):
+        print("❌ El modo --production necesita os.fork (Linux o macOS); usa --asgi")
+        sys.exit(1)
+
+    # Los workers son procesos distintos: el estado compartido vive en SQLite
+    os.environ['USER_STORAGE'] = 'sqlite'
+    from user_storage import SQLiteStorage
+    SQLiteStorage().close()  # crear o migrar el esquema una sola vez, antes del fork
+
+    listener = socket.create_server((host, port), backlog=1024)
+    print(f"🚀 Iniciando servidor de producción con {workers} workers (almacenamiento: sqlite)...")
+    print(f"📍 URL: http://{host}:{port}")
+    print_endpoints()
+    print("\n🔄 Servidor iniciado. SIGTERM o Ctrl+C para detener.")
+    sys.stdout.flush()
+
+    children = set()
+    stopping = False
+
+    def spawn():
+        pid = os.fork()
+        if pid == 0:
+            code = 0
+            try:
+                run_production_worker(listener, host, port)
+            except BaseException:
+                traceback.print_exc()
+                code = 1
+            finally:
+                sys.stdout.flush()
+                os._exit(code)
+        children.add(pid)
+
+    def stop(signum, frame):
+        nonlocal stopping
+        stopping = True
+        for pid in list(children):
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+    signal.signal(signal.SIGTERM, stop)
+    signal.signal(signal.SIGINT, stop)
+    for _ in range(workers):
+        spawn()
+
+    while children:
+        try:
+            pid, status = os.wait()
+        except ChildProcessError:
+            break
+        children.discard(pid)
+        if not stopping:
+            print(f"⚠️ El worker {pid} terminó inesperadamente; se inicia otro")
+            time.sleep(1)
+            spawn()
+
+    listener.close()
+    print("\n👋 Servidor detenido (cambios volcados a disco)")
+
 def show_usage_instructions():
     """Mostrar instrucciones de uso"""
     print("\n" + "="*60)
@@ -59,15 +190,42 @@ def show_usage_instructions():
     print("   • Ver su progreso personal")
     print("   • Guardar actividades realizadas")
     print("4️⃣ Los datos se guardan en archivos JSON:")
-    print("   • users_database.json - Usuarios registrados")
-    print("   • progress_database.json - Progreso individual")
+    print("   • users_snapshot.ndjson - Usuarios y progreso, un registro por línea")
+    print("   • users_snapshot.idx - Índice para leer cada usuario sin cargar el resto")
+    print("   • users_snapshot.email.idx / .student_id.idx - Búsqueda por email y código")
+    print("   • attendance_checkins.ndjson - Registros de asistencia, uno por línea (solo se añaden)")
+    print("   • journal_database.jsonl - Diario de cambios desde la última instantánea")
+    print("   • Con USER_STORAGE=sqlite se usa user_system.db (SQLite) en su lugar")
     print("5️⃣ Mantén este servidor corriendo mientras usas la web")
+    print("6️⃣ Para los picos de asistencia (QR en clase) usa el modo ASGI:")
+    print("   • python start_server.py --asgi --workers 4")
+    print("7️⃣ En producción (sin preguntas, un worker por CPU, SQLite compartido):")
+    print("   • python start_server.py --production")
     print("="*60)
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Servidor de gestión de usuarios')
+    parser.add_argument('--production', action='store_true',
+                        help='Sin preguntas ni debug: workers pre-fork con almacenamiento SQLite')
+    parser.add_argument('--asgi', action='store_true',
+                        help='Servidor ASGI (uvicorn) con varios workers, sin modo debug')
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1)
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=5000)
+    args = parser.parse_args()
+
     print("🎯 Sistema de Gestión de Usuarios - Curso Intensivo de Español")
     print("="*60)
 
+    if args.production or args.asgi:
+        if not check_requirements(install=False):
+            sys.exit(1)
+        if args.asgi:
+            start_asgi_server(args.host, args.port, max(args.workers, 1))
+        else:
+            start_production_server(args.host, args.port, max(args.workers, 1))
+        sys.exit(0)
+
     # Verificar requisitos
     if not check_requirements():
         print("❌ No se pudieron instalar los requisitos")
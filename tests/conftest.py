@@ -0,0 +1,18 @@
+"""Configuración común: el servidor se importa en un directorio temporal
+
+user_system crea su almacenamiento (con rutas relativas) al importarse, así
+que las pruebas cambian de directorio antes y usan pocas iteraciones de hash.
+"""
+
+import os
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+os.environ.setdefault('PASSWORD_HASH_ITERATIONS', '1000')
+os.environ.setdefault('USER_SYSTEM_SECRET', 'pruebas')
+os.environ.setdefault('JOURNAL_COMMIT_WINDOW', '0')
+os.environ.pop('USER_STORAGE', None)
+os.chdir(tempfile.mkdtemp(prefix='user_system_tests_'))
@@ -0,0 +1,78 @@
+"""Canje del QR de asistencia por las dos rutas (/api/attendance y /checkin)"""
+
+import secrets
+from datetime import datetime, timezone
+
+import user_system as api
+
+
+def new_student():
+    student_id = secrets.token_hex(4)
+    user = api.user_system.create_user('Ana Pérez', f'{student_id}@example.com', student_id)
+    return user['id'], student_id
+
+
+def test_second_redemption_is_409():
+    user_id, _ = new_student()
+    token, _ = api.attendance_tokens.mint('s-api')
+
+    assert api.api_attendance({'user_id': user_id, 'token': token})[1] == 200
+    assert api.api_attendance({'user_id': user_id, 'token': token})[1] == 409
+
+
+def test_same_token_once_across_routes():
+    user_id, student_id = new_student()
+    token, _ = api.attendance_tokens.mint('s-rutas')
+
+    body, status = api.api_checkin({'token': token, 'student_id': student_id,
+                                    'student_name': 'Ana Pérez'})
+    assert status == 200 and body['session'] == 's-rutas'
+    assert api.api_attendance({'user_id': user_id, 'token': token})[1] == 409
+
+
+def test_checkin_replay_is_409():
+    token, _ = api.attendance_tokens.mint('s-checkin')
+    data = {'token': token, 'student_id': ' 2025001 ', 'student_name': 'Ana'}
+
+    assert api.api_checkin(data)[1] == 200
+    assert api.api_checkin(dict(data, student_id='2025001'))[1] == 409
+
+
+def test_invalid_token_is_403():
+    user_id, _ = new_student()
+    token, _ = api.attendance_tokens.mint('s-firma')
+
+    assert api.api_attendance({'user_id': user_id, 'token': token + 'x'})[1] == 403
+    assert api.api_attendance({'user_id': user_id})[1] == 403
+
+
+def offline_checkin(token, scanned_at):
+    """Resultado de subir un check-in guardado sin conexión a la hora scanned_at"""
+    # Como lo envía el navegador (toISOString)
+    stamp = datetime.fromtimestamp(scanned_at, timezone.utc).isoformat().replace('+00:00', 'Z')
+    body, _ = api.api_attendance_upload({'records': [
+        {'token': token, 'student_id': '3001', 'student_name': 'Luis', 'timestamp': stamp}]})
+    return body['results'][0]
+
+
+def test_offline_checkin_after_expiry(monkeypatch):
+    token, expires = api.attendance_tokens.mint('s-offline', 60)
+    later = expires + 3600
+    monkeypatch.setattr(api.time, 'time', lambda: later)
+
+    result = offline_checkin(token, expires - 30)
+    assert result['status'] == 200
+    assert result['record']['timestamp'] == datetime.fromtimestamp(expires - 30).isoformat()
+    # Sin hora de escaneo el token caducado no vale
+    assert api.api_checkin({'token': token, 'student_id': '3002', 'student_name': 'Eva'})[1] == 403
+
+
+def test_offline_checkin_outside_window(monkeypatch):
+    token, expires = api.attendance_tokens.mint('s-ventana', 60)
+
+    # Escaneado cuando el token ya había caducado
+    monkeypatch.setattr(api.time, 'time', lambda: expires + 600)
+    assert offline_checkin(token, expires + 300)['status'] == 403
+    # Subido demasiado tarde
+    monkeypatch.setattr(api.time, 'time', lambda: expires + api.ATTENDANCE_OFFLINE_MAX_DELAY + 1)
+    assert offline_checkin(token, expires - 30)['status'] == 403
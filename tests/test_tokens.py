@@ -0,0 +1,73 @@
+"""Tokens firmados: firma, caducidad, uso y canje de un solo uso"""
+
+import time
+
+from user_storage import JsonStorage
+from user_system import AttendanceTokens, SessionTokens, TokenSigner
+
+
+def attendance_tokens(tmp_path):
+    storage = JsonStorage(snapshot_file=str(tmp_path / 'users.ndjson'),
+                          index_file=str(tmp_path / 'users.idx'),
+                          journal_file=str(tmp_path / 'journal.jsonl'),
+                          checkins_file=str(tmp_path / 'checkins.ndjson'), commit_window=0)
+    return AttendanceTokens(TokenSigner(b'secreto', 'attendance'), storage), storage
+
+
+def test_signer_rejects_tampering_and_expiry():
+    signer = TokenSigner(b'secreto', 'attendance')
+    token = signer.sign({'s': 'sesion', 'exp': time.time() + 60})
+    body, signature = token.split('.')
+
+    assert signer.verify(token)['s'] == 'sesion'
+    assert signer.verify(f'{body}x.{signature}') is None
+    assert signer.verify(f'{body}.{signature[:-2]}') is None
+    assert signer.verify('no-es-un-token') is None
+    assert signer.verify(None) is None
+    assert signer.verify(signer.sign({'s': 'sesion', 'exp': time.time() - 1})) is None
+
+
+def test_signer_keys_are_per_purpose():
+    token = TokenSigner(b'secreto', 'attendance').sign({'u': 'u1', 'exp': time.time() + 60})
+
+    assert TokenSigner(b'secreto', 'session').verify(token) is None
+    assert TokenSigner(b'otro', 'attendance').verify(token) is None
+
+
+def test_attendance_token_redeemed_once_per_student(tmp_path):
+    tokens, storage = attendance_tokens(tmp_path)
+    token, expires = tokens.mint('S1', 60)
+
+    assert tokens.validate(token) == ('S1', expires)
+    assert tokens.redeem(token, '1001') == 'S1'
+    assert tokens.redeem(token, '1001') is False
+    assert tokens.redeem(token, '1002') == 'S1'
+    # Otro QR de la misma sesión tampoco sirve para repetir
+    assert tokens.redeem(tokens.mint('S1', 60)[0], '1001') is False
+    assert tokens.redeem(tokens.mint('S2', 60)[0], '1001') == 'S2'
+    assert tokens.redeem(token + 'x', '1003') is None
+    storage.close()
+
+
+def test_attendance_redeem_with_record(tmp_path):
+    tokens, storage = attendance_tokens(tmp_path)
+    token, _ = tokens.mint('S1', 60)
+    record = {'record_id': 'r1', 'studentId': '1001', 'studentName': 'Ana'}
+
+    assert tokens.redeem(token, '1001', record) == 'S1'
+    assert tokens.redeem(token, '1001', dict(record, record_id='r2')) is False
+    records = storage.checkins_since(0, 10)[0]
+    assert [(stored['record_id'], stored['session']) for stored in records] == [('r1', 'S1')]
+    storage.close()
+
+
+def test_session_token_revocation():
+    sessions = SessionTokens(TokenSigner(b'secreto', 'session'), ttl=60)
+    token, _ = sessions.issue('u1')
+    other, _ = sessions.issue('u1')
+
+    assert sessions.validate(token) == 'u1'
+    assert sessions.revoke(token)
+    assert sessions.validate(token) is None
+    assert not sessions.revoke(token)
+    assert sessions.validate(other) == 'u1'
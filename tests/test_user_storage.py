@@ -0,0 +1,215 @@
+"""Backends de almacenamiento: diario tras un corte, migraciones y reservas"""
+
+import json
+import os
+import shutil
+import sqlite3
+import time
+
+import pytest
+
+from user_storage import JsonStorage, SQLiteStorage, new_progress
+
+
+def make_user(user_id, email=None, student_id=None):
+    return {'id': user_id, 'name': 'Ana Pérez', 'email': email or f'{user_id}@example.com',
+            'student_id': student_id, 'password': 'hash', 'created_at': '2025-01-07T10:00:00',
+            'course_level': 'A1.2-A2.1', 'active': True}
+
+
+def open_json(directory, **options):
+    return JsonStorage(snapshot_file=str(directory / 'users.ndjson'),
+                       index_file=str(directory / 'users.idx'),
+                       journal_file=str(directory / 'journal.jsonl'),
+                       checkins_file=str(directory / 'checkins.ndjson'),
+                       commit_window=0, **options)
+
+
+def open_backend(kind, directory):
+    if kind == 'json':
+        return open_json(directory)
+    return SQLiteStorage(str(directory / 'users.db'))
+
+
+def quiz(quiz_id, correct, date):
+    return {'quiz_id': quiz_id, 'correct_answers': correct, 'total_questions': 5,
+            'accuracy': correct * 20.0, 'date': date}
+
+
+def test_legacy_json_rollups_skip_auto_ids(tmp_path):
+    # Formato anterior: historial sin límite ni agregados; los quizzes sin
+    # identificador se guardaban como quiz_<posición>
+    progress = new_progress('u1')
+    progress['quiz_scores'] = {
+        'total_quizzes': 3, 'correct_answers': 12, 'accuracy_rate': 0,
+        'quiz_history': [quiz('quiz_1', 3, '2025-01-07'), quiz('verbos', 4, '2025-01-08'),
+                         quiz('quiz_3', 5, '2025-01-09')]}
+    (tmp_path / 'users_database.json').write_text(json.dumps({'u1': make_user('u1')}))
+    (tmp_path / 'progress_database.json').write_text(json.dumps({'u1': progress}))
+
+    storage = open_json(tmp_path)
+    quiz_scores = storage.get_progress('u1')['quiz_scores']
+    storage.close()
+
+    assert quiz_scores['total_quizzes'] == 3
+    assert quiz_scores['total_questions'] == 15
+    assert list(quiz_scores['per_quiz']) == ['verbos']
+    assert [attempt['quiz_id'] for attempt in quiz_scores['quiz_history']] == ['quiz_1', 'verbos', 'quiz_3']
+    assert not (tmp_path / 'users_database.json').exists()
+
+
+def test_sqlite_backfill_skips_auto_ids(tmp_path):
+    db_file = str(tmp_path / 'users.db')
+    storage = SQLiteStorage(db_file)
+    storage.apply('u1', 'create_user', user=make_user('u1'))
+    storage.close()
+
+    # Base anterior a los agregados: sin quiz_rollups, quiz_stats ni auto_id
+    conn = sqlite3.connect(db_file)
+    conn.executescript('''
+        DROP TABLE quiz_rollups;
+        DROP TABLE quiz_stats;
+        ALTER TABLE quizzes DROP COLUMN auto_id;
+    ''')
+    conn.executemany(
+        'INSERT INTO quizzes (user_id, quiz_id, correct_answers, total_questions, accuracy, taken_at) '
+        'VALUES (?, ?, ?, ?, ?, ?)',
+        [('u1', q['quiz_id'], q['correct_answers'], q['total_questions'], q['accuracy'], q['date'])
+         for q in (quiz('quiz_1', 3, '2025-01-07'), quiz('verbos', 4, '2025-01-08'),
+                   quiz('quiz_3', 5, '2025-01-09'))])
+    conn.commit()
+    conn.close()
+
+    storage = SQLiteStorage(db_file)
+    quiz_scores = storage.get_progress('u1')['quiz_scores']
+    storage.apply('u1', 'quiz', quiz=quiz(None, 5, '2025-01-10'))
+    after = storage.get_progress('u1')['quiz_scores']
+    storage.close()
+
+    assert quiz_scores['total_quizzes'] == 3
+    assert list(quiz_scores['per_quiz']) == ['verbos']
+    assert after['total_quizzes'] == 4
+    assert list(after['per_quiz']) == ['verbos']
+
+
+def fill(storage):
+    storage.apply('u1', 'create_user', user=make_user('u1', student_id='1001'))
+    storage.apply('u1', 'attendance', class_date='2025-01-07')
+    storage.apply('u1', 'material', material_type='vocabulary', item_id='saludos')
+    storage.apply('u1', 'quiz', quiz=quiz('verbos', 4, '2025-01-07'))
+    storage.apply('u1', 'quiz', quiz=quiz(None, 5, '2025-01-08'))
+    storage.add_checkins([{'record_id': 'r1', 'session': 's1', 'studentId': '1001',
+                           'studentName': 'Ana'}])
+
+
+def test_journal_replay_after_crash(tmp_path):
+    live, crashed = tmp_path / 'live', tmp_path / 'crashed'
+    live.mkdir()
+    storage = open_json(live, durable=True)
+    fill(storage)
+    expected = storage.get_progress('u1')
+    storage.sync()
+
+    # Corte sin compactar: solo queda el diario (con una última línea a medias)
+    shutil.copytree(live, crashed)
+    with open(crashed / 'journal.jsonl', 'a', encoding='utf-8') as f:
+        f.write('{"op": "attendance", "user_id": "u1"')
+    storage.close()
+
+    for _ in range(2):
+        reopened = open_json(crashed)
+        assert reopened.get_progress('u1') == expected
+        assert reopened.find_user('student_id', '1001') == 'u1'
+        assert [record['record_id'] for record in reopened.checkins_since(0, 10)[0]] == ['r1']
+        reopened.close()
+
+
+def test_journal_replay_over_compacted_snapshot(tmp_path):
+    live, crashed = tmp_path / 'live', tmp_path / 'crashed'
+    live.mkdir()
+    storage = open_json(live, durable=True)
+    fill(storage)
+    expected = storage.get_progress('u1')
+    storage.sync()
+    shutil.copy(live / 'journal.jsonl', tmp_path / 'journal.jsonl')
+
+    # Corte entre escribir la instantánea nueva y vaciar el diario: las
+    # mutaciones que ya están en la instantánea no se aplican dos veces
+    storage.flush()
+    storage.sync()
+    shutil.copytree(live, crashed)
+    shutil.copy(tmp_path / 'journal.jsonl', crashed / 'journal.jsonl')
+    storage.close()
+
+    reopened = open_json(crashed)
+    progress = reopened.get_progress('u1')
+    reopened.close()
+    assert progress == expected
+    assert progress['attendance']['attended_classes'] == 1
+    assert progress['quiz_scores']['total_quizzes'] == 2
+
+
+def test_legacy_json_migration(tmp_path):
+    progress = new_progress('u1')
+    progress['attendance']['attendance_dates'] = ['2025-01-09', '2025-01-07']
+    progress['materials']['materials_viewed'] = ['saludos', 'familia', 'saludos']
+    (tmp_path / 'users_database.json').write_text(json.dumps(
+        {'u1': make_user('u1', 'Ana@Example.com', '1001'), 'u2': make_user('u2')}))
+    (tmp_path / 'progress_database.json').write_text(json.dumps({'u1': progress}))
+
+    storage = open_json(tmp_path)
+    migrated = storage.get_progress('u1')
+    assert migrated['attendance']['attendance_dates'] == ['2025-01-07', '2025-01-09']
+    assert migrated['materials']['materials_viewed']['_legacy'] == ['familia', 'saludos']
+    assert storage.find_user('email', 'ana@example.com') == 'u1'
+    assert storage.find_user('student_id', '1001') == 'u1'
+    assert storage.count_users() == 2
+    storage.close()
+
+    for name in ('users_database.json', 'progress_database.json'):
+        assert not os.path.exists(tmp_path / name)
+        assert os.path.exists(tmp_path / f'{name}.migrated')
+    # La migración es única: al reabrir se usa la instantánea
+    reopened = open_json(tmp_path)
+    assert reopened.get_progress('u1') == migrated
+    reopened.close()
+
+
+@pytest.mark.parametrize('kind', ['json', 'sqlite'])
+def test_claim_once(kind, tmp_path):
+    storage = open_backend(kind, tmp_path)
+    now = time.time()
+
+    assert storage.claim_once('clave', now + 60)
+    assert not storage.claim_once('clave', now + 60)
+    assert storage.claim_once('otra', now + 60)
+    # Una reserva caducada se puede volver a hacer
+    assert storage.claim_once('caducada', now - 1)
+    assert storage.claim_once('caducada', now + 60)
+    storage.close()
+
+
+@pytest.mark.parametrize('kind', ['json', 'sqlite'])
+def test_claim_checkin_stores_once(kind, tmp_path):
+    storage = open_backend(kind, tmp_path)
+    record = {'record_id': 'r1', 'session': 's1', 'studentId': '1001', 'studentName': 'Ana'}
+    expires = time.time() + 60
+
+    record_id, seq, created = storage.claim_checkin('s1/1001', expires, record)
+    assert (record_id, created) == ('r1', True)
+    assert storage.claim_checkin('s1/1001', expires, dict(record, record_id='r2')) is None
+
+    records, cursor, has_more = storage.checkins_since(0, 10)
+    assert [stored['record_id'] for stored in records] == ['r1']
+    assert (cursor, has_more) == (seq, False)
+    storage.close()
+
+
+def test_sqlite_claims_shared_between_connections(tmp_path):
+    first = SQLiteStorage(str(tmp_path / 'users.db'))
+    second = SQLiteStorage(str(tmp_path / 'users.db'))
+
+    assert first.claim_once('clave', time.time() + 60)
+    assert not second.claim_once('clave', time.time() + 60)
+    first.close()
+    second.close()
@@ -0,0 +1,30 @@
+"""Inicio de sesión (UserSystem.authenticate_user)"""
+
+import user_system as api
+
+
+def count_derivations(monkeypatch):
+    calls = []
+    derive = api.PasswordHasher._derive
+
+    def counting(self, password, salt, iterations):
+        calls.append(iterations)
+        return derive(self, password, salt, iterations)
+    monkeypatch.setattr(api.PasswordHasher, '_derive', counting)
+    return calls
+
+
+def test_unknown_user_costs_one_hash(monkeypatch):
+    calls = count_derivations(monkeypatch)
+
+    assert api.user_system.authenticate_user('no-existe', 'secreto') is None
+    assert calls == [api.user_system.passwords.iterations]
+
+
+def test_login_with_the_issued_password(monkeypatch):
+    user = api.user_system.create_user('Ana Pérez', 'login@example.com', '4001')
+    calls = count_derivations(monkeypatch)
+
+    assert api.user_system.authenticate_user(user['id'], 'incorrecta') is None
+    assert api.user_system.authenticate_user(user['id'], user['password'])['id'] == user['id']
+    assert calls == [api.user_system.passwords.iterations] * 2
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Normalización del texto de los PDFs del curso
+
+Las tablas se construyen una vez al importar el módulo y cada llamada solo las
+aplica: el texto se codifica en latin-1 y pasa por una tabla de bytes.translate
+(una pasada en C). Lo que no cabe en latin-1 (emojis, comillas tipográficas...)
+pasa antes por una única expresión regular compilada. Perfiles:
+
+    'ascii'    quita tildes y cambia ¿ ¡ por ? ! (fuentes estándar, como siempre)
+    'latin1'   conserva tildes, ñ y ¿ ¡; elimina lo que no cabe en latin-1
+    'spanish'  conserva todo el texto en español sin limitarse a latin-1
+               (para fuentes TrueType con Unicode)
+
+En los tres los emojis conocidos pasan a palabra y el resto se eliminan.
+
+    python text_normalizer.py   # microbenchmark: coste por llamada de cada perfil
+"""
+
+import re
+import unicodedata
+
+# Símbolos que no tienen glifo en las fuentes estándar
+SYMBOLS = {
+    '•': '-', '·': '.', '–': '-', '—': '-', '…': '...',
+    '“': '"', '”': '"', '„': '"', '‘': "'", '’': "'", '\u00a0': ' ',
+}
+# Emojis de los títulos de los materiales antiguos
+EMOJI_WORDS = {
+    '📘': 'Guia', '🎯': 'Objetivos', '📚': 'Metodologia', '📝': 'Evaluacion',
+    '💡': 'Recomendaciones', '🌟': 'Expresiones', '🗣': 'Frases', '🎭': 'Reacciones',
+    '🔢': 'Verbos', '✅': 'Soluciones',
+}
+
+# Un emoji completo (base, selector de variante y secuencias unidas con ZWJ) o uno
+# de los símbolos de SYMBOLS fuera de latin-1 (· y el espacio duro van en la tabla)
+_EMOJI_BASE = '\U0001F000-\U0001FAFF\u2600-\u27BF\u2B00-\u2BFF'
+_WIDE_SYMBOLS = ''.join(char for char in SYMBOLS if ord(char) > 0xFF)
+SPECIAL_RE = re.compile(f'[{_EMOJI_BASE}\uFE0F\u200D{re.escape(_WIDE_SYMBOLS)}]'
+                        f'(?:\uFE0F|\u200D[{_EMOJI_BASE}])*')
+_SPECIAL = {**SYMBOLS, **EMOJI_WORDS}
+
+
+def _special(match):
+    return _SPECIAL.get(match.group().replace('\uFE0F', ''), '')
+
+
+def _byte_table(fold):
+    """Tabla de bytes.translate para texto ya codificado en latin-1
+
+    Devuelve (tabla, bytes a borrar). Con fold, cada letra acentuada pasa a su
+    letra base (según su descomposición Unicode), ¿ ¡ a ? ! y se borra el resto
+    de lo que no es ASCII.
+    """
+    table = bytearray(range(256))
+    for char, replacement in SYMBOLS.items():
+        if len(replacement) == 1 and ord(char) < 256:
+            table[ord(char)] = ord(replacement)
+    if not fold:
+        return bytes(table), b''
+    delete = bytearray()
+    for code in range(0x80, 0x100):
+        if table[code] != code:
+            continue
+        base = unicodedata.normalize('NFKD', chr(code)).encode('ascii', 'ignore')
+        base = {'¿': b'?', '¡': b'!', 'Ø': b'O', 'ø': b'o', 'Ð': b'D', 'ð': b'd'}.get(chr(code), base)
+        if len(base) == 1:
+            table[code] = base[0]
+        else:
+            delete.append(code)
+    return bytes(table), bytes(delete)
+
+
+# perfil -> (tabla de bytes.translate, bytes a borrar, codificación) o None si no
+# se recorta a latin-1
+PROFILES = {
+    'ascii': (*_byte_table(fold=True), 'ascii'),
+    'latin1': (*_byte_table(fold=False), 'latin-1'),
+    'spanish': None,
+}
+
+
+def normalize(text, profile='ascii'):
+    """Adaptar el texto al perfil indicado (ver PROFILES)"""
+    text = str(text)
+    if text.isascii():
+        return text
+    try:
+        data = text.encode('latin-1')
+    except UnicodeEncodeError:
+        # Solo el texto con emojis o símbolos tipográficos pasa por la expresión
+        text = SPECIAL_RE.sub(_special, text)
+        data = text.encode('latin-1', 'ignore')
+    if PROFILES[profile] is None:
+        return text
+    table, delete, encoding = PROFILES[profile]
+    return data.translate(table, delete).decode(encoding)
+
+
+def _legacy_clean(text):
+    """clean_text de los generadores antiguos: un replace por entrada del diccionario"""
+    replacements = {
+        'á': 'a', 'é': 'e', 'í': 'i', 'ó': 'o', 'ú': 'u',
+        'Á': 'A', 'É': 'E', 'Í': 'I', 'Ó': 'O', 'Ú': 'U',
+        'ñ': 'n', 'Ñ': 'N', 'ü': 'u', 'Ü': 'U',
+        '¿': '?', '¡': '!',
+        '•': '-', '·': '.',
+        '📘': 'Guia', '🎯': 'Objetivos', '📚': 'Metodologia',
+        '📝': 'Evaluacion', '💡': 'Recomendaciones', '🌟': 'Expresiones',
+        '🗣️': 'Frases', '🎭': 'Reacciones', '🔢': 'Verbos', '✅': 'Soluciones'
+    }
+    for old, new in replacements.items():
+        text = text.replace(old, new)
+    return text.encode('latin-1', 'ignore').decode('latin-1')
+
+
+def main():
+    import timeit
+
+    samples = {
+        'ascii': 'Practica este dialogo con un companero/a y cambia algunas palabras',
+        'espanol': '¿Dónde está la estación? ¡Qué día tan bonito para visitar la Alhambra!',
+        'emoji': '📘 Guía del curso • 🎯 Objetivos de la sesión — “práctica” 🗣️',
+    }
+    rounds = 20000
+    print(f"📊 Coste por llamada ({rounds} llamadas por muestra)")
+    for label, sample in samples.items():
+        legacy = timeit.timeit(lambda: _legacy_clean(sample), number=rounds) / rounds * 1e6
+        print(f"   {label:>8}: legado {legacy:6.2f} µs", end='')
+        for profile in PROFILES:
+            cost = timeit.timeit(lambda: normalize(sample, profile), number=rounds) / rounds * 1e6
+            print(f" | {profile} {cost:5.2f} µs", end='')
+        print()
+
+
+if __name__ == "__main__":
+    main()
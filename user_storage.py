@@ -0,0 +1,1697 @@
+#!/usr/bin/env python3
+"""
+Backends de almacenamiento para el sistema de usuarios
+
+Todos los backends ofrecen la misma interfaz:
+
+- get_user / iter_users / count_users: lectura de usuarios
+- get_progress: documento de progreso de un usuario (mismo formato que el JSON)
+- progress_version: versión del progreso (sube con cada mutación) sin leer el documento
+- iter_progress: pares (usuario, progreso) en una sola pasada, para resúmenes
+- apply(user_id, op, **fields): aplicar una mutación; devuelve True si cambió algo
+- apply_many(changes): aplicar varias mutaciones con una sola persistencia
+- add_checkins / checkins_since: registro de asistencia con cursor para sincronizar
+- claim_once(key, expires): reservar una clave de un solo uso (p. ej. canje de un QR)
+- claim_checkin(key, expires, record): claim_once y add_checkins de un registro a la vez
+- find_user(field, value): user_id por email o student_id (índices secundarios)
+- flush / close: persistir cambios pendientes y liberar recursos
+
+El backend se elige con la variable de entorno USER_STORAGE ('json' o 'sqlite').
+"""
+
+import atexit
+import bisect
+import copy
+import hashlib
+import heapq
+import itertools
+import json
+import mmap
+import os
+import queue
+import secrets
+import sqlite3
+import threading
+import time
+from array import array
+from collections import OrderedDict
+from contextlib import nullcontext
+from datetime import datetime
+
+# Instantánea de usuarios del backend por defecto: un registro NDJSON por usuario
+# (usuario + progreso) y un índice de ancho fijo user_id -> posición
+USERS_SNAPSHOT_FILE = 'users_snapshot.ndjson'
+USERS_INDEX_FILE = 'users_snapshot.idx'
+SNAPSHOT_FORMAT = 'users-ndjson-1'
+INDEX_MAGIC = 'USERIDX1'
+INDEX_KEY_WIDTH = 32
+INDEX_HEADER_WIDTH = 64
+# Campos de las entradas: clave, offset y longitud del registro...
+PRIMARY_INDEX_WIDTHS = (INDEX_KEY_WIDTH, 12, 10)
+# ...y en los índices secundarios, clave del valor y clave del usuario
+LOOKUP_INDEX_WIDTHS = (INDEX_KEY_WIDTH, INDEX_KEY_WIDTH)
+LOOKUP_FIELDS = ('email', 'student_id')
+# Registros de usuario sin cambios que se mantienen en memoria (LRU)
+USER_CACHE_SIZE = int(os.environ.get('USER_CACHE_SIZE', '10000'))
+# Candados por usuario repartidos en un número fijo de franjas (memoria acotada
+# aunque lleguen user_id desconocidos)
+USER_LOCK_STRIPES = 256
+# Formato anterior (dos JSON completos): se migra a la instantánea al arrancar
+USERS_DB_FILE = 'users_database.json'
+PROGRESS_DB_FILE = 'progress_database.json'
+# Registros de asistencia de las páginas attendance*.html: NDJSON al que solo se
+# añaden líneas, en orden de seq (el formato anterior, una lista JSON, se migra)
+CHECKINS_FILE = 'attendance_checkins.ndjson'
+CHECKINS_DB_FILE = 'attendance_checkins.json'
+# Diario de mutaciones (una línea JSON por cambio) que se aplica sobre la instantánea
+JOURNAL_FILE = 'journal_database.jsonl'
+# Número de mutaciones acumuladas en el diario antes de compactarlo en la instantánea
+JOURNAL_COMPACT_THRESHOLD = 1000
+# Ventana (segundos) en la que se agrupan mutaciones para hacer un solo fsync
+JOURNAL_COMMIT_WINDOW = float(os.environ.get('JOURNAL_COMMIT_WINDOW', '0.05'))
+# Base de datos del backend SQLite
+SQLITE_DB_FILE = 'user_system.db'
+
+PROJECT_IDS = ('photo_project', 'cooking_workshop', 'role_playing', 'final_project')
+MATERIAL_TYPES = ('vocabulary', 'exercises')
+# Intentos de quiz que se guardan en el documento de progreso (los más recientes)
+QUIZ_HISTORY_LIMIT = 20
+# Materiales vistos antes de separarlos por tipo (no se sabe a qué tipo pertenecían)
+LEGACY_MATERIALS_KEY = '_legacy'
+
+
+def new_progress(user_id, created_at=None):
+    """Documento de progreso inicial de un usuario"""
+    return {
+        'user_id': user_id,
+        'attendance': {
+            'total_classes': 16,  # Lunes-Jueves x 4 semanas
+            'attended_classes': 0,
+            'attendance_dates': [],
+            'attendance_rate': 0
+        },
+        'materials': {
+            'vocabulary_completed': 0,
+            'total_vocabulary': 50,
+            'exercises_completed': 0,
+            'total_exercises': 20,
+            'materials_viewed': {material_type: [] for material_type in MATERIAL_TYPES},
+            'completion_rate': 0
+        },
+        'projects': {
+            **{project_id: {'status': 'pending', 'completed_at': None} for project_id in PROJECT_IDS},
+            'completion_rate': 0
+        },
+        'quiz_scores': {
+            'total_quizzes': 0,
+            'correct_answers': 0,
+            'total_questions': 0,
+            'accuracy_rate': 0,
+            'per_quiz': {},
+            'quiz_history': []
+        },
+        'weekly_goals': {
+            'week_1': {'goals': [], 'completed': 0, 'total': 0},
+            'week_2': {'goals': [], 'completed': 0, 'total': 0},
+            'week_3': {'goals': [], 'completed': 0, 'total': 0},
+            'week_4': {'goals': [], 'completed': 0, 'total': 0}
+        },
+        'version': 0,
+        'last_updated': created_at or datetime.now().isoformat()
+    }
+
+
+def fsync_directory(path):
+    """Persistir la entrada del directorio de path tras un rename (no disponible en Windows)"""
+    if hasattr(os, 'O_DIRECTORY'):
+        dir_fd = os.open(os.path.dirname(os.path.abspath(path)), os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
+
+
+def _sorted_contains(items, value):
+    """Búsqueda binaria en una lista ordenada"""
+    index = bisect.bisect_left(items, value)
+    return index < len(items) and items[index] == value
+
+
+def _add_quiz_attempt(quiz_scores, quiz_record, auto_id=False):
+    """Actualizar los agregados de quizzes con un intento, en O(1)"""
+    quiz_scores['total_quizzes'] += 1
+    quiz_scores['correct_answers'] += quiz_record['correct_answers']
+    quiz_scores['total_questions'] += quiz_record['total_questions']
+
+    # Solo se siguen por separado los quizzes con identificador propio; los
+    # anónimos reciben quiz_N y crearían una entrada nueva en cada intento
+    if not auto_id:
+        stats = quiz_scores['per_quiz'].setdefault(
+            quiz_record['quiz_id'], {'attempts': 0, 'best_accuracy': 0})
+        stats['attempts'] += 1
+        stats['best_accuracy'] = max(stats['best_accuracy'], quiz_record['accuracy'])
+        stats['last_accuracy'] = quiz_record['accuracy']
+        stats['last_date'] = quiz_record['date']
+
+    history = quiz_scores['quiz_history']
+    history.append(quiz_record)
+    del history[:-QUIZ_HISTORY_LIMIT]
+
+
+def _rebuild_quiz_rollups(quiz_scores):
+    """Calcular los agregados a partir del historial completo de los documentos antiguos
+
+    Ese historial no tenía límite y los intentos sin quiz_id recibían
+    quiz_<posición en el historial>: esos no se siguen en per_quiz.
+    """
+    history = quiz_scores['quiz_history']
+    quiz_scores.update({'total_quizzes': 0, 'correct_answers': 0, 'total_questions': 0,
+                        'per_quiz': {}, 'quiz_history': []})
+    for position, quiz_record in enumerate(history, 1):
+        auto_id = quiz_record.pop('auto_id', False) or quiz_record.get('quiz_id') == f'quiz_{position}'
+        _add_quiz_attempt(quiz_scores, quiz_record, auto_id)
+
+
+class JournalWriter(threading.Thread):
+    """Único hilo que escribe en el diario
+
+    Los hilos de las peticiones solo encolan líneas ya serializadas; este hilo
+    las agrupa durante una ventana de confirmación (commit_window segundos),
+    las escribe en orden con un solo fsync por grupo y compacta el diario
+    cuando supera el umbral.
+    """
+
+    def __init__(self, path, compact, compact_threshold, entries=0,
+                 commit_window=JOURNAL_COMMIT_WINDOW):
+        super().__init__(name='journal-writer', daemon=True)
+        self.path = path
+        self.compact = compact
+        self.compact_threshold = compact_threshold
+        self.commit_window = commit_window
+        self.entries = entries
+        self.queue = queue.Queue()
+        self._tickets = itertools.count(1)
+        self._committed = 0
+        self._committed_cond = threading.Condition()
+        self.start()
+
+    def append(self, line):
+        """Encolar una línea; devuelve el número de turno para wait_committed"""
+        ticket = next(self._tickets)
+        self.queue.put(('line', (ticket, line)))
+        return ticket
+
+    def wait_committed(self, ticket):
+        """Esperar a que la línea con ese turno esté en disco (tras su fsync)"""
+        with self._committed_cond:
+            self._committed_cond.wait_for(lambda: self._committed >= ticket)
+
+    def command(self, kind):
+        """Enviar 'sync', 'compact' o 'stop' al hilo escritor y esperar a que termine"""
+        done = threading.Event()
+        self.queue.put((kind, done))
+        done.wait()
+
+    def _next_batch(self):
+        """Primer elemento de la cola más todo lo que llegue dentro de la ventana"""
+        batch = [self.queue.get()]
+        deadline = time.monotonic() + self.commit_window
+        while batch[-1][0] == 'line':
+            timeout = deadline - time.monotonic()
+            try:
+                if timeout > 0:
+                    batch.append(self.queue.get(timeout=timeout))
+                else:
+                    batch.append(self.queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def run(self):
+        with open(self.path, 'a', encoding='utf-8') as f:
+            while True:
+                batch = self._next_batch()
+
+                last_ticket = None
+                for kind, payload in batch:
+                    if kind == 'line':
+                        last_ticket, line = payload
+                        f.write(line)
+                        self.entries += 1
+                if last_ticket is not None:
+                    f.flush()
+                    os.fsync(f.fileno())
+                    with self._committed_cond:
+                        self._committed = last_ticket
+                        self._committed_cond.notify_all()
+
+                stop = False
+                for kind, payload in batch:
+                    if kind == 'line':
+                        continue
+                    if kind == 'compact':
+                        self._compact(f)
+                    stop = stop or kind == 'stop'
+                    payload.set()
+                if stop:
+                    return
+
+                if self.entries >= self.compact_threshold:
+                    self._compact(f)
+
+    def _compact(self, f):
+        self.compact()
+        f.seek(0)
+        f.truncate()
+        os.fsync(f.fileno())
+        self.entries = 0
+
+
+class FixedIndex:
+    """Archivo de entradas de ancho fijo ordenadas por clave, abierto con mmap
+
+    Cada entrada son campos separados por espacios (el primero es la clave);
+    la cabecera lleva la generación de la instantánea y el número de entradas.
+    """
+
+    def __init__(self, path, generation, widths):
+        self.path = path
+        self.entry_width = sum(widths) + len(widths)
+        self.mm = None
+        self.count = 0
+        if not os.path.exists(path) or os.path.getsize(path) < INDEX_HEADER_WIDTH:
+            return
+        with open(path, 'rb') as f:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        header = mm[:INDEX_HEADER_WIDTH].decode('ascii').split()
+        if (len(header) != 3 or header[0] != INDEX_MAGIC or header[1] != generation
+                or len(mm) - INDEX_HEADER_WIDTH != int(header[2]) * self.entry_width):
+            mm.close()
+            return
+        self.mm = mm
+        self.count = int(header[2])
+
+    @property
+    def valid(self):
+        return self.mm is not None
+
+    def entry(self, position):
+        start = INDEX_HEADER_WIDTH + position * self.entry_width
+        return self.mm[start:start + self.entry_width].split()
+
+    def _key_at(self, position):
+        start = INDEX_HEADER_WIDTH + position * self.entry_width
+        return self.mm[start:start + INDEX_KEY_WIDTH]
+
+    def find(self, key):
+        """Primera posición con esa clave (búsqueda binaria), o None"""
+        low, high = 0, self.count
+        while low < high:
+            middle = (low + high) // 2
+            if self._key_at(middle) < key:
+                low = middle + 1
+            else:
+                high = middle
+        if low < self.count and self._key_at(low) == key:
+            return low
+        return None
+
+    def matches(self, key):
+        """Entradas con esa clave (puede haber varias en los índices secundarios)"""
+        position = self.find(key)
+        while position is not None and position < self.count and self._key_at(position) == key:
+            yield self.entry(position)
+            position += 1
+
+    def entries(self):
+        for position in range(self.count):
+            yield tuple(self.entry(position))
+
+    def close(self):
+        if self.mm is not None:
+            self.mm.close()
+
+    @staticmethod
+    def write(path, generation, widths, entries):
+        """Escribir las entradas (ya ordenadas por clave) en path.tmp; devuelve esa ruta"""
+        tmp_path = f"{path}.tmp"
+        entries = list(entries)
+        with open(tmp_path, 'wb') as f:
+            f.write(f"{INDEX_MAGIC} {generation} {len(entries):012d}".ljust(INDEX_HEADER_WIDTH - 1)
+                    .encode('ascii') + b'\n')
+            for entry in entries:
+                f.write(b' '.join(field if isinstance(field, bytes) else b'%0*d' % (width, field)
+                                  for field, width in zip(entry, widths)) + b'\n')
+            f.flush()
+            os.fsync(f.fileno())
+        return tmp_path
+
+
+class UserSnapshot:
+    """Instantánea de usuarios en disco: un registro NDJSON por usuario más sus índices
+
+    El índice principal (FixedIndex) va de la clave del user_id (hash de ancho
+    fijo) a la posición del registro, y se abre con mmap sin cargarlo: abrir la
+    instantánea es O(1) sea cual sea el número de usuarios. Los índices
+    secundarios (LOOKUP_FIELDS) van del email o el código de estudiante
+    normalizados a la clave del usuario. Todos los archivos llevan la misma
+    generación; si alguno no coincide (corte entre los os.replace) se
+    reconstruyen los índices recorriendo los datos.
+    """
+
+    def __init__(self, data_file, index_file):
+        self.data_file = data_file
+        self.index_file = index_file
+        self.lock = threading.Lock()
+        self.closed = False
+        self.data = open(data_file, 'rb')
+        header = json.loads(self.data.readline())
+        self.generation = header['generation']
+        if not self._open_indexes():
+            self.close()
+            self.rebuild_indexes(data_file, index_file, self.generation)
+            self.closed = False
+            self.data = open(data_file, 'rb')
+            if not self._open_indexes():
+                raise ValueError(f"Índice de usuarios inválido: {index_file}")
+
+    def _open_indexes(self):
+        self.index = FixedIndex(self.index_file, self.generation, PRIMARY_INDEX_WIDTHS)
+        self.lookups = {field: FixedIndex(lookup_index_file(self.index_file, field), self.generation,
+                                          LOOKUP_INDEX_WIDTHS)
+                        for field in LOOKUP_FIELDS}
+        return self.index.valid and all(lookup.valid for lookup in self.lookups.values())
+
+    @property
+    def count(self):
+        return self.index.count
+
+    def contains(self, user_id):
+        return self.index.find(index_key(user_id)) is not None
+
+    def read(self, user_id):
+        """Registro del usuario leído del disco, o None si no está en la instantánea
+
+        Lanza ValueError si la instantánea ya se cerró (la reemplazó una compactación).
+        """
+        record = self.read_key(index_key(user_id))
+        return record if record is not None and record['id'] == user_id else None
+
+    def read_key(self, key):
+        position = self.index.find(key)
+        if position is None:
+            return None
+        _, offset, length = self.index.entry(position)
+        with self.lock:
+            if self.closed:
+                raise ValueError('Instantánea cerrada')
+            self.data.seek(int(offset))
+            line = self.data.read(int(length))
+        return json.loads(line)
+
+    def lookup(self, field, value):
+        """user_id cuyo campo normalizado es value, o None"""
+        for _, user_key in self.lookups[field].matches(index_key(value)):
+            record = self.read_key(user_key)
+            if record is not None and normalize_lookup(field, record['user'].get(field)) == value:
+                return record['id']
+        return None
+
+    def close(self):
+        with self.lock:
+            self.closed = True
+            self.data.close()
+            for index in (getattr(self, 'index', None), *getattr(self, 'lookups', {}).values()):
+                if index is not None:
+                    index.close()
+
+    @staticmethod
+    def write(data_file, index_file, lines, lookups):
+        """Escribir una instantánea nueva
+
+        lines son pares (clave, línea) ordenados por clave; lookups, por campo,
+        pares (clave del valor, clave del usuario) ordenados.
+        """
+        generation = secrets.token_hex(16)
+        entries = []
+        tmp_data = f"{data_file}.tmp"
+        with open(tmp_data, 'wb') as f:
+            f.write(json.dumps({'format': SNAPSHOT_FORMAT, 'generation': generation}).encode() + b'\n')
+            for key, line in lines:
+                entries.append((key, f.tell(), len(line)))
+                f.write(line)
+            f.flush()
+            os.fsync(f.fileno())
+        replacements = [(tmp_data, data_file),
+                        (FixedIndex.write(index_file, generation, PRIMARY_INDEX_WIDTHS, entries), index_file)]
+        for field in LOOKUP_FIELDS:
+            path = lookup_index_file(index_file, field)
+            replacements.append((FixedIndex.write(path, generation, LOOKUP_INDEX_WIDTHS, lookups[field]), path))
+        # Primero los datos: un corte entre los replace deja índices de otra
+        # generación, que se detectan y se reconstruyen al abrir
+        for tmp_path, path in replacements:
+            os.replace(tmp_path, path)
+        fsync_directory(data_file)
+
+    @staticmethod
+    def rebuild_indexes(data_file, index_file, generation):
+        """Reconstruir todos los índices recorriendo el archivo de datos"""
+        entries = []
+        lookups = {field: [] for field in LOOKUP_FIELDS}
+        with open(data_file, 'rb') as f:
+            f.readline()
+            offset = f.tell()
+            for line in f:
+                if line.strip():
+                    record = json.loads(line)
+                    key = index_key(record['id'])
+                    entries.append((key, offset, len(line)))
+                    for field, value in lookup_values(record['user']):
+                        lookups[field].append((index_key(value), key))
+                offset += len(line)
+        entries.sort()
+        os.replace(FixedIndex.write(index_file, generation, PRIMARY_INDEX_WIDTHS, entries), index_file)
+        for field in LOOKUP_FIELDS:
+            path = lookup_index_file(index_file, field)
+            os.replace(FixedIndex.write(path, generation, LOOKUP_INDEX_WIDTHS, sorted(lookups[field])), path)
+
+
+def index_key(value):
+    """Clave de ancho fijo de los índices para un user_id o un valor de búsqueda"""
+    return hashlib.blake2b(value.encode('utf-8'), digest_size=INDEX_KEY_WIDTH // 2).hexdigest().encode('ascii')
+
+
+def lookup_index_file(index_file, field):
+    """users_snapshot.idx -> users_snapshot.email.idx"""
+    base, extension = os.path.splitext(index_file)
+    return f"{base}.{field}{extension}"
+
+
+def normalize_lookup(field, value):
+    """Forma canónica de un email o código de estudiante (None si está vacío)"""
+    if value is None:
+        return None
+    value = str(value).strip()
+    if field == 'email':
+        value = value.lower()
+    return value or None
+
+
+def lookup_values(user):
+    """Pares (campo, valor normalizado) de los índices secundarios de un usuario"""
+    for field in LOOKUP_FIELDS:
+        value = normalize_lookup(field, user.get(field))
+        if value is not None:
+            yield field, value
+
+
+def record_line(record):
+    """Línea NDJSON de un registro; el id va primero para leerlo sin decodificar el resto"""
+    return json.dumps({'id': record['user']['id'], 'user': record['user'], 'progress': record['progress']},
+                      ensure_ascii=False, separators=(',', ':')).encode('utf-8') + b'\n'
+
+
+def record_id(line, _decoder=json.JSONDecoder()):
+    """user_id de una línea de la instantánea sin decodificar el registro completo"""
+    return _decoder.raw_decode(line, line.index(':') + 1)[0]
+
+
+def upgrade_progress(progress):
+    """Adaptar un documento de progreso de versiones anteriores al formato actual"""
+    # Las instantáneas antiguas guardaban las fechas en orden de llegada
+    progress['attendance']['attendance_dates'].sort()
+    # ...un historial de quizzes sin límite ni agregados, y una sola lista
+    # de materiales vistos para todos los tipos
+    quiz_scores = progress['quiz_scores']
+    if 'total_questions' not in quiz_scores:
+        _rebuild_quiz_rollups(quiz_scores)
+    materials = progress['materials']
+    if isinstance(materials['materials_viewed'], list):
+        legacy = sorted(set(materials['materials_viewed']))
+        materials['materials_viewed'] = {material_type: [] for material_type in MATERIAL_TYPES}
+        if legacy:
+            materials['materials_viewed'][LEGACY_MATERIALS_KEY] = legacy
+    return progress
+
+
+class CheckinLog:
+    """Registros de asistencia en un NDJSON al que solo se añaden líneas (línea n = seq n)
+
+    En memoria solo están los índices: el offset de cada línea, record_id ->
+    seq y, por sesión, la lista ordenada de sus seq (checkins_since con sesión
+    no recorre los registros de las demás). Los registros nuevos quedan en
+    memoria, y en el diario, hasta la siguiente compactación, que añade al
+    final del archivo solo esos: el archivo nunca se reescribe. Los ya
+    volcados se leen con os.pread, sin candado.
+    """
+
+    def __init__(self, path, legacy_path=None):
+        self.path = path
+        if legacy_path and not os.path.exists(path) and os.path.exists(legacy_path):
+            self.migrate(legacy_path)
+        self.ids = {}
+        self.sessions = {}
+        self.count = 0
+        # Offset de inicio de la línea de cada seq volcado, más el final del archivo
+        self._offsets = array('Q', [0])
+        self._unsaved = {}
+        self._lock = threading.Lock()
+        self._load()
+        self._fd = os.open(path, os.O_RDONLY | os.O_CREAT, 0o644)
+
+    def migrate(self, legacy_path):
+        """Pasar la lista JSON completa del formato anterior a NDJSON (una sola vez)"""
+        with open(legacy_path, 'r', encoding='utf-8') as f:
+            checkins = json.load(f)
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.writelines(self._line(checkin) for checkin in checkins)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.path)
+        os.replace(legacy_path, f"{legacy_path}.migrated")
+        fsync_directory(self.path)
+
+    def _load(self):
+        if not os.path.exists(self.path):
+            return
+        with open(self.path, 'rb') as f:
+            offset = 0
+            for line in f:
+                if not line.endswith(b'\n'):
+                    break
+                checkin = json.loads(line)
+                if checkin['seq'] != self.count + 1:
+                    raise ValueError(f"{self.path}: seq {checkin['seq']} fuera de orden")
+                self._index(checkin)
+                offset += len(line)
+                self._offsets.append(offset)
+        if offset < os.path.getsize(self.path):
+            # Última línea incompleta tras un corte: se quita (el diario aún la tiene)
+            with open(self.path, 'r+b') as f:
+                f.truncate(offset)
+
+    @staticmethod
+    def _line(checkin):
+        return (json.dumps(checkin, ensure_ascii=False, separators=(',', ':')) + '\n').encode('utf-8')
+
+    def _index(self, checkin):
+        self.count = checkin['seq']
+        self.ids[checkin['record_id']] = checkin['seq']
+        self.sessions.setdefault(checkin['session'], []).append(checkin['seq'])
+
+    def add(self, checkin):
+        """Añadir un registro con el seq siguiente (False si ya estaba)"""
+        with self._lock:
+            if checkin['seq'] <= self.count:
+                return False
+            self._index(checkin)
+            self._unsaved[checkin['seq']] = checkin
+            return True
+
+    def persist(self):
+        """Añadir al archivo los registros que aún no están (solo desde el hilo escritor)"""
+        with self._lock:
+            saved = len(self._offsets) - 1
+            pending = [self._unsaved[seq] for seq in range(saved + 1, self.count + 1)]
+        if not pending:
+            return
+        lines = [self._line(checkin) for checkin in pending]
+        with open(self.path, 'ab') as f:
+            f.writelines(lines)
+            f.flush()
+            os.fsync(f.fileno())
+        with self._lock:
+            offset = self._offsets[-1]
+            for checkin, line in zip(pending, lines):
+                offset += len(line)
+                self._offsets.append(offset)
+                del self._unsaved[checkin['seq']]
+
+    def since(self, cursor, limit, session=None):
+        """Registros con seq > cursor; devuelve (registros, nuevo cursor, hay_más)"""
+        position = max(cursor, 0)
+        with self._lock:
+            end = self.count
+            if session is None:
+                seqs = range(position + 1, min(end, position + limit) + 1)
+                has_more = position + limit < end
+            else:
+                session_seqs = self.sessions.get(session, [])
+                start = bisect.bisect_right(session_seqs, position)
+                seqs = session_seqs[start:start + limit]
+                has_more = start + limit < len(session_seqs)
+            saved = len(self._offsets) - 1
+            found = [self._unsaved[seq] if seq > saved else (self._offsets[seq - 1], self._offsets[seq])
+                     for seq in seqs]
+        for i, item in enumerate(found):
+            if isinstance(item, tuple):
+                start_offset, end_offset = item
+                found[i] = json.loads(os.pread(self._fd, end_offset - start_offset, start_offset))
+        new_cursor = found[-1]['seq'] if has_more else max(position, end)
+        return found, new_cursor, has_more
+
+    def close(self):
+        os.close(self._fd)
+
+
+class JsonStorage:
+    """Instantánea NDJSON indexada más un diario de mutaciones de solo escritura al final
+
+    Al arrancar solo se abre el índice de la instantánea (UserSnapshot) y se
+    agrupan por usuario las mutaciones pendientes del diario: el registro de un
+    usuario se lee del disco la primera vez que se usa y se guarda en una caché
+    LRU acotada (cache_size). Los registros modificados desde la última
+    compactación quedan fijados en memoria (_dirty) hasta que la compactación
+    los escribe en una instantánea nueva.
+
+    Las mutaciones de un mismo usuario se serializan con el candado de su
+    franja (USER_LOCK_STRIPES candados fijos), así que dos estudiantes solo se
+    esperan si comparten franja; la escritura a disco la hace un único hilo
+    (JournalWriter).
+
+    Con durable=False (por defecto) apply vuelve en cuanto la mutación está en
+    memoria y encolada: un corte solo puede perder la ventana de confirmación
+    en curso. Con durable=True espera al fsync del grupo que la contiene.
+    """
+
+    def __init__(self, snapshot_file=USERS_SNAPSHOT_FILE, index_file=USERS_INDEX_FILE,
+                 journal_file=JOURNAL_FILE, compact_threshold=JOURNAL_COMPACT_THRESHOLD,
+                 commit_window=JOURNAL_COMMIT_WINDOW, durable=False,
+                 checkins_file=CHECKINS_FILE, cache_size=USER_CACHE_SIZE,
+                 users_file=None, progress_file=None):
+        directory = os.path.dirname(snapshot_file)
+        self.snapshot_file = snapshot_file
+        self.index_file = index_file
+        self.journal_file = journal_file
+        self.checkins_file = checkins_file
+        # Archivos JSON completos de versiones anteriores: se migran una sola vez
+        self.users_file = users_file or os.path.join(directory, USERS_DB_FILE)
+        self.progress_file = progress_file or os.path.join(directory, PROGRESS_DB_FILE)
+        self.durable = durable
+        self.cache_size = cache_size
+        self._user_locks = [threading.RLock() for _ in range(USER_LOCK_STRIPES)]
+        self._checkins_lock = threading.Lock()
+        # Registros leídos del disco y sin cambios (LRU) y registros pendientes de compactar
+        self._cache = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self._dirty = {}
+        # Mutaciones del diario aún no aplicadas, por usuario (se aplican al leerlo)
+        self._pending = {}
+        # Usuarios creados después de la última instantánea, y sus emails y
+        # códigos de estudiante (los índices secundarios en disco no los tienen)
+        self._unindexed = set()
+        self._unindexed_lookups = {field: {} for field in LOOKUP_FIELDS}
+        self._lookup_lock = threading.RLock()
+        # Claves de un solo uso: solo en memoria, este backend no se comparte entre procesos
+        self._claims = {}
+        self._claims_lock = threading.Lock()
+        self._claims_purge_at = 0
+        self.load_databases()
+        self.writer = JournalWriter(journal_file, self.save_databases, compact_threshold,
+                                    entries=self.journal_entries, commit_window=commit_window)
+        # El hilo escritor es daemon: al salir se vacía la cola antes de terminar
+        atexit.register(self.sync)
+
+    def _lock_for(self, user_id):
+        """Candado del usuario: el de su franja (varios usuarios pueden compartirlo)"""
+        return self._user_locks[hash(user_id) % USER_LOCK_STRIPES]
+
+    def load_databases(self):
+        """Abrir la instantánea indexada y agrupar por usuario el diario de mutaciones"""
+        if not os.path.exists(self.snapshot_file):
+            self.migrate_legacy_files()
+        self.snapshot = UserSnapshot(self.snapshot_file, self.index_file)
+
+        # Registros de asistencia: solo los índices en memoria (CheckinLog)
+        self.checkins = CheckinLog(self.checkins_file,
+                                   os.path.join(os.path.dirname(self.checkins_file), CHECKINS_DB_FILE))
+
+        self.journal_entries = self.replay_journal()
+
+    def migrate_legacy_files(self):
+        """Convertir users_database.json y progress_database.json a la instantánea NDJSON
+
+        Es la única vez que se cargan completos; después se renombran a *.migrated.
+        """
+        users, progress = {}, {}
+        if os.path.exists(self.users_file):
+            with open(self.users_file, 'r', encoding='utf-8') as f:
+                users = json.load(f)
+        if os.path.exists(self.progress_file):
+            with open(self.progress_file, 'r', encoding='utf-8') as f:
+                progress = json.load(f)
+
+        lines = sorted(
+            (index_key(user_id), record_line({
+                'user': user,
+                'progress': upgrade_progress(progress[user_id]) if user_id in progress else None
+            }))
+            for user_id, user in users.items())
+        lookups = {field: [] for field in LOOKUP_FIELDS}
+        for user_id, user in users.items():
+            for field, value in lookup_values(user):
+                lookups[field].append((index_key(value), index_key(user_id)))
+        UserSnapshot.write(self.snapshot_file, self.index_file, lines,
+                           {field: sorted(entries) for field, entries in lookups.items()})
+
+        for path in (self.users_file, self.progress_file):
+            if os.path.exists(path):
+                os.replace(path, f"{path}.migrated")
+
+    def replay_journal(self):
+        """Agrupar por usuario las mutaciones del diario; se aplican al leer cada usuario"""
+        if not os.path.exists(self.journal_file):
+            return 0
+
+        entries = 0
+        with open(self.journal_file, 'r', encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    mutation = json.loads(line)
+                except json.JSONDecodeError:
+                    # Última línea incompleta tras un corte abrupto: se descarta
+                    break
+                if mutation['op'] == 'checkin':
+                    self._apply_checkin(mutation['checkin'])
+                else:
+                    user_id = mutation['user_id']
+                    self._pending.setdefault(user_id, []).append(mutation)
+                    if mutation['op'] == 'create_user' and not self.snapshot.contains(user_id):
+                        self._add_unindexed(user_id, mutation['user'])
+                entries += 1
+        return entries
+
+    def _record(self, user_id):
+        """Registro {'user', 'progress'} en memoria, leyéndolo del disco la primera vez"""
+        record = self._dirty.get(user_id)
+        if record is not None:
+            return record
+        with self._cache_lock:
+            record = self._cache.get(user_id)
+            if record is not None:
+                self._cache.move_to_end(user_id)
+                return record
+
+        with self._lock_for(user_id):
+            record = self._dirty.get(user_id) or self._cache.get(user_id)
+            if record is not None:
+                return record
+            record = self._read_snapshot(user_id)
+            pending = self._pending.pop(user_id, None)
+            if pending:
+                changed = False
+                for mutation in pending:
+                    record, applied = self._mutate(user_id, record, mutation)
+                    changed = changed or applied
+                if changed:
+                    self._dirty[user_id] = record
+                    return record
+            if record is not None:
+                self._cache_put(user_id, record)
+            return record
+
+    def _read_snapshot(self, user_id):
+        while True:
+            snapshot = self.snapshot
+            try:
+                record = snapshot.read(user_id)
+            except ValueError:
+                if snapshot is self.snapshot:
+                    raise
+                continue  # una compactación acaba de reemplazar la instantánea
+            if record is not None:
+                del record['id']
+            return record
+
+    def _cache_put(self, user_id, record):
+        with self._cache_lock:
+            self._cache[user_id] = record
+            self._cache.move_to_end(user_id)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
+    def _mark_dirty(self, user_id, record):
+        """Fijar en memoria un registro modificado hasta la próxima compactación"""
+        self._dirty[user_id] = record
+        with self._cache_lock:
+            self._cache.pop(user_id, None)
+
+    def save_databases(self):
+        """Compactar: escribir una instantánea nueva con los registros modificados
+
+        Los registros sin cambios se copian byte a byte de la instantánea
+        anterior (sin decodificarlos). Cada registro modificado se serializa
+        bajo el candado de su usuario, así que la instantánea es coherente por
+        usuario aunque sigan llegando mutaciones; las que queden fuera se
+        reproducen desde el diario.
+        """
+        for user_id in list(self._pending):
+            self._record(user_id)
+
+        old = self.snapshot
+        written = {}
+        changed_lines = {}
+        new_keys = []
+        # Los emails y códigos no cambian: basta añadir los de los usuarios nuevos
+        new_lookups = {field: [] for field in LOOKUP_FIELDS}
+        for user_id in list(self._dirty):
+            with self._lock_for(user_id):
+                record = self._dirty[user_id]
+                key = index_key(user_id)
+                written[user_id] = record['progress']['version']
+                changed_lines[key] = record_line(record)
+                if old.index.find(key) is None:
+                    new_keys.append(key)
+                    for field, value in lookup_values(record['user']):
+                        new_lookups[field].append((index_key(value), key))
+
+        def lines(source):
+            # Claves antiguas y nuevas mezcladas en orden: el índice sale ya ordenado
+            entries = heapq.merge(old.index.entries(), ((key, b'0', b'0') for key in sorted(new_keys)))
+            for key, offset, length in entries:
+                if key in changed_lines:
+                    yield key, changed_lines[key]
+                else:
+                    source.seek(int(offset))
+                    yield key, source.read(int(length))
+
+        lookups = {field: heapq.merge(old.lookups[field].entries(), sorted(new_lookups[field]))
+                   for field in LOOKUP_FIELDS}
+        # Copia con su propio descriptor: las lecturas de old no esperan a la compactación
+        with open(old.data_file, 'rb') as source:
+            UserSnapshot.write(self.snapshot_file, self.index_file, lines(source), lookups)
+        self.snapshot = UserSnapshot(self.snapshot_file, self.index_file)
+        old.close()
+
+        # Los registros que no cambiaron durante la escritura pasan a la caché
+        for user_id, version in written.items():
+            with self._lock_for(user_id):
+                record = self._dirty.get(user_id)
+                if record is not None and record['progress']['version'] == version:
+                    del self._dirty[user_id]
+                    self._cache_put(user_id, record)
+                if user_id in self._unindexed:
+                    with self._lookup_lock:
+                        self._unindexed.discard(user_id)
+                        for field, value in lookup_values(record['user'] if record else {}):
+                            if self._unindexed_lookups[field].get(value) == user_id:
+                                del self._unindexed_lookups[field][value]
+
+        # Los registros de asistencia solo se añaden al final de su archivo
+        self.checkins.persist()
+
+    def sync(self):
+        """Esperar a que el hilo escritor haya escrito todo lo encolado"""
+        if self.writer.is_alive():
+            self.writer.command('sync')
+
+    def flush(self):
+        """Escribir lo pendiente y compactar el diario en la instantánea"""
+        self.writer.command('compact')
+
+    def close(self):
+        if self.writer.is_alive():
+            self.writer.command('compact')
+            self.writer.command('stop')
+            self.writer.join()
+            self.checkins.close()
+
+    def release_connection(self):
+        """Sin conexiones por hilo: no hay nada que soltar al terminar una petición"""
+
+    def get_user(self, user_id):
+        record = self._record(user_id)
+        return record['user'] if record is not None else None
+
+    def _iter_records(self):
+        """Recorrer todos los registros leyendo la instantánea en secuencia
+
+        Los registros que están en memoria (modificados o en caché) tienen
+        prioridad sobre la línea del disco; si una compactación reemplaza la
+        instantánea a mitad del recorrido, el resto se lee de la nueva.
+        """
+        generation = self.snapshot.generation
+        unindexed = list(self._unindexed)
+        with open(self.snapshot_file, 'rb') as f:
+            f.readline()
+            for line in f:
+                if not line.strip():
+                    continue
+                user_id = record_id(line.decode('utf-8'))
+                record = self._dirty.get(user_id) or self._cache.get(user_id)
+                if record is None:
+                    if user_id in self._pending or self.snapshot.generation != generation:
+                        record = self._record(user_id)
+                    else:
+                        record = json.loads(line)
+                if record is not None:
+                    yield record
+        for user_id in unindexed:
+            record = self._record(user_id)
+            if record is not None:
+                yield record
+
+    def iter_users(self):
+        return (record['user'] for record in self._iter_records())
+
+    def count_users(self):
+        return self.snapshot.count + len(self._unindexed)
+
+    def get_progress(self, user_id):
+        """Copia del documento de progreso: quien la lea puede modificarla libremente"""
+        with self._lock_for(user_id):
+            record = self._record(user_id)
+            if record is None or record['progress'] is None:
+                return None
+            return copy.deepcopy(record['progress'])
+
+    def progress_version(self, user_id):
+        with self._lock_for(user_id):
+            record = self._record(user_id)
+            if record is None or record['progress'] is None:
+                return None
+            return record['progress']['version']
+
+    def iter_progress(self):
+        """Pares (usuario, progreso) sin copiar: solo para lectura"""
+        for record in self._iter_records():
+            if record['progress'] is not None:
+                yield record['user'], record['progress']
+
+    def apply(self, user_id, op, **fields):
+        """Aplicar una mutación y añadirla al diario (O(1) bytes por escritura)
+
+        Cada mutación lleva la versión del progreso del usuario que produce, de
+        modo que al reproducir el diario se ignoran las que ya estaban incluidas
+        en la instantánea.
+        """
+        return self.apply_many([(user_id, op, fields)])[0]
+
+    def apply_many(self, changes):
+        """Aplicar una lista de (user_id, op, fields); devuelve un bool por cambio
+
+        Todas las líneas del lote se encolan juntas, así que acaban en el mismo
+        grupo de confirmación del diario (un solo fsync).
+        """
+        results = []
+        last_ticket = None
+        for user_id, op, fields in changes:
+            with self._lock_for(user_id), self._lookup_lock if op == 'create_user' else nullcontext():
+                record = self._record(user_id)
+                current = (record['progress'] or {}).get('version', 0) if record else 0
+                mutation = {
+                    'op': op,
+                    'user_id': user_id,
+                    'version': current + 1,
+                    'at': datetime.now().isoformat(),
+                    **fields
+                }
+                # Email ya registrado: la comprobación y el alta van bajo el mismo candado
+                if op == 'create_user' and self.find_user('email', fields['user'].get('email')):
+                    changed = False
+                else:
+                    changed = self.apply_mutation(mutation)
+                if changed:
+                    # Se encola dentro del candado para que el diario conserve el
+                    # orden de versiones de cada usuario
+                    last_ticket = self.writer.append(
+                        json.dumps(mutation, ensure_ascii=False, separators=(',', ':')) + '\n')
+            results.append(changed)
+
+        if self.durable and last_ticket is not None:
+            self.writer.wait_committed(last_ticket)
+        return results
+
+    def add_checkins(self, records):
+        """Guardar registros de asistencia; devuelve (record_id, seq, nuevo) por registro
+
+        Los reenvíos de un mismo record_id (p. ej. tras estar sin conexión) no
+        se duplican: devuelven el seq que ya tenían.
+        """
+        results = []
+        last_ticket = None
+        received_at = datetime.now().isoformat()
+        with self._checkins_lock:
+            for record in records:
+                seq = self.checkins.ids.get(record['record_id'])
+                if seq is not None:
+                    results.append((record['record_id'], seq, False))
+                    continue
+                checkin = {
+                    'seq': self.checkins.count + 1,
+                    'record_id': record['record_id'],
+                    'session': record.get('session'),
+                    'received_at': received_at,
+                    'record': record
+                }
+                self._apply_checkin(checkin)
+                last_ticket = self.writer.append(json.dumps(
+                    {'op': 'checkin', 'checkin': checkin},
+                    ensure_ascii=False, separators=(',', ':')) + '\n')
+                results.append((record['record_id'], checkin['seq'], True))
+
+        if self.durable and last_ticket is not None:
+            self.writer.wait_committed(last_ticket)
+        return results
+
+    def _apply_checkin(self, checkin):
+        return self.checkins.add(checkin)
+
+    def checkins_since(self, cursor, limit, session=None):
+        """Registros con seq > cursor; devuelve (registros, nuevo cursor, hay_más)"""
+        return self.checkins.since(cursor, limit, session)
+
+    def claim_once(self, key, expires):
+        """Reservar key hasta expires (epoch); False si ya estaba reservada"""
+        now = time.time()
+        with self._claims_lock:
+            if now >= self._claims_purge_at:
+                self._claims = {k: until for k, until in self._claims.items() if until >= now}
+                self._claims_purge_at = now + 60
+            if self._claims.get(key, 0) >= now:
+                return False
+            self._claims[key] = expires
+            return True
+
+    def claim_checkin(self, key, expires, record):
+        """Reservar key y guardar el registro; (record_id, seq, nuevo) o None si ya estaba reservada
+
+        Si el registro no se puede guardar la reserva se deshace, así que el
+        estudiante puede volver a intentarlo.
+        """
+        if not self.claim_once(key, expires):
+            return None
+        try:
+            return self.add_checkins([record])[0]
+        except BaseException:
+            with self._claims_lock:
+                self._claims.pop(key, None)
+            raise
+
+    def apply_mutation(self, mutation):
+        """Aplicar una mutación sobre el registro en memoria (con el candado del usuario)"""
+        if mutation['op'] == 'checkin':
+            return self._apply_checkin(mutation['checkin'])
+
+        user_id = mutation['user_id']
+        record, changed = self._mutate(user_id, self._record(user_id), mutation)
+        if changed:
+            self._mark_dirty(user_id, record)
+            if mutation['op'] == 'create_user' and not self.snapshot.contains(user_id):
+                self._add_unindexed(user_id, record['user'])
+        return changed
+
+    def _add_unindexed(self, user_id, user):
+        with self._lookup_lock:
+            self._unindexed.add(user_id)
+            for field, value in lookup_values(user):
+                self._unindexed_lookups[field].setdefault(value, user_id)
+
+    def find_user(self, field, value):
+        """user_id por email o código de estudiante (LOOKUP_FIELDS), o None
+
+        Primero los usuarios creados desde la última instantánea (en memoria),
+        luego el índice secundario en disco: O(log n) sin recorrer usuarios.
+        """
+        value = normalize_lookup(field, value)
+        if value is None:
+            return None
+        user_id = self._unindexed_lookups[field].get(value)
+        if user_id is not None:
+            return user_id
+        while True:
+            snapshot = self.snapshot
+            try:
+                return snapshot.lookup(field, value)
+            except ValueError:
+                if snapshot is self.snapshot:
+                    raise
+
+    def _mutate(self, user_id, record, mutation):
+        """Aplicar una mutación a un registro (o None); devuelve (registro, cambió)"""
+        if mutation['op'] == 'create_user':
+            # Un usuario creado sin documento de progreso (migración de un corte
+            # entre las dos instantáneas antiguas) se completa aquí
+            if record is None:
+                record = {'user': mutation['user'], 'progress': None}
+            if record['progress'] is not None:
+                return record, False
+            record['progress'] = new_progress(user_id, mutation['at'])
+        else:
+            progress = record and record['progress']
+            if progress is None or mutation['version'] <= progress.get('version', 0):
+                return record, False
+            if mutation['op'] == 'set_password':
+                # Única mutación sobre los datos del usuario y no sobre su progreso
+                if record['user'].get('password') == mutation['password']:
+                    return record, False
+                record['user']['password'] = mutation['password']
+            elif not getattr(self, f"_apply_{mutation['op']}")(progress, mutation):
+                return record, False
+
+        progress = record['progress']
+        progress['version'] = mutation['version']
+        progress['last_updated'] = mutation['at']
+        return record, True
+
+    def _apply_attendance(self, progress, mutation):
+        # attendance_dates se mantiene ordenada: búsqueda binaria en O(log n)
+        attendance = progress['attendance']
+        dates = attendance['attendance_dates']
+        if _sorted_contains(dates, mutation['class_date']):
+            return False
+        bisect.insort(dates, mutation['class_date'])
+        attendance['attended_classes'] += 1
+        return True
+
+    def _apply_material(self, progress, mutation):
+        # Un conjunto ordenado por tipo: el mismo id en vocabulario y en
+        # ejercicios son materiales distintos
+        material_type, item_id = mutation['material_type'], mutation['item_id']
+        if material_type not in MATERIAL_TYPES:
+            return False
+        materials = progress['materials']
+        viewed = materials['materials_viewed']
+        if _sorted_contains(viewed.get(LEGACY_MATERIALS_KEY, ()), item_id):
+            return False
+        items = viewed.setdefault(material_type, [])
+        index = bisect.bisect_left(items, item_id)
+        if index < len(items) and items[index] == item_id:
+            return False
+        items.insert(index, item_id)
+        materials[f"{material_type}_completed"] += 1
+        return True
+
+    def _apply_quiz(self, progress, mutation):
+        quiz_scores = progress['quiz_scores']
+        quiz_record = mutation['quiz']
+        # El indicador va en la mutación (y así en el diario), no en el intento
+        # que se guarda en quiz_history; los diarios anteriores lo llevaban dentro
+        auto_id = mutation.get('auto_id') or quiz_record.pop('auto_id', False)
+        if not quiz_record.get('quiz_id'):
+            quiz_record['quiz_id'] = f"quiz_{quiz_scores['total_quizzes'] + 1}"
+            auto_id = mutation['auto_id'] = True
+        _add_quiz_attempt(quiz_scores, quiz_record, auto_id)
+        return True
+
+    def _apply_project(self, progress, mutation):
+        project = progress['projects'].get(mutation['project_id'])
+        if not isinstance(project, dict) or project['status'] == 'completed':
+            return False
+        project['status'] = 'completed'
+        project['completed_at'] = mutation['at']
+        return True
+
+
+SQLITE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS users (
+    id TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    email TEXT NOT NULL,
+    student_id TEXT,
+    password TEXT,
+    created_at TEXT NOT NULL,
+    course_level TEXT,
+    active INTEGER NOT NULL DEFAULT 1,
+    version INTEGER NOT NULL DEFAULT 0,
+    last_updated TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_users_email ON users (lower(trim(email)));
+CREATE INDEX IF NOT EXISTS idx_users_student_id ON users (trim(student_id));
+CREATE TABLE IF NOT EXISTS attendance (
+    id INTEGER PRIMARY KEY,
+    user_id TEXT NOT NULL REFERENCES users(id),
+    class_date TEXT NOT NULL,
+    recorded_at TEXT NOT NULL,
+    UNIQUE (user_id, class_date)
+);
+CREATE INDEX IF NOT EXISTS idx_attendance_class_date ON attendance (class_date);
+CREATE TABLE IF NOT EXISTS materials (
+    user_id TEXT NOT NULL REFERENCES users(id),
+    material_type TEXT NOT NULL,
+    item_id TEXT NOT NULL,
+    viewed_at TEXT NOT NULL,
+    PRIMARY KEY (user_id, material_type, item_id)
+);
+CREATE TABLE IF NOT EXISTS quizzes (
+    id INTEGER PRIMARY KEY,
+    user_id TEXT NOT NULL REFERENCES users(id),
+    quiz_id TEXT NOT NULL,
+    auto_id INTEGER NOT NULL DEFAULT 0,
+    correct_answers INTEGER NOT NULL,
+    total_questions INTEGER NOT NULL,
+    accuracy REAL NOT NULL,
+    taken_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_quizzes_user ON quizzes (user_id, id);
+CREATE TABLE IF NOT EXISTS quiz_rollups (
+    user_id TEXT PRIMARY KEY REFERENCES users(id),
+    total_quizzes INTEGER NOT NULL DEFAULT 0,
+    correct_answers INTEGER NOT NULL DEFAULT 0,
+    total_questions INTEGER NOT NULL DEFAULT 0
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS quiz_stats (
+    user_id TEXT NOT NULL REFERENCES users(id),
+    quiz_id TEXT NOT NULL,
+    attempts INTEGER NOT NULL,
+    best_accuracy REAL NOT NULL,
+    last_accuracy REAL NOT NULL,
+    last_date TEXT NOT NULL,
+    PRIMARY KEY (user_id, quiz_id)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS projects (
+    user_id TEXT NOT NULL REFERENCES users(id),
+    project_id TEXT NOT NULL,
+    completed_at TEXT NOT NULL,
+    PRIMARY KEY (user_id, project_id)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS checkins (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    record_id TEXT NOT NULL UNIQUE,
+    session TEXT,
+    received_at TEXT NOT NULL,
+    record TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_checkins_session ON checkins (session, seq);
+CREATE TABLE IF NOT EXISTS claims (
+    key TEXT PRIMARY KEY,
+    expires REAL NOT NULL
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_claims_expires ON claims (expires);
+"""
+
+# Las búsquedas usan los índices de expresión de SQLITE_SCHEMA
+LOOKUP_QUERIES = {
+    'email': 'SELECT id FROM users WHERE lower(trim(email)) = ? ORDER BY created_at LIMIT 1',
+    'student_id': 'SELECT id FROM users WHERE trim(student_id) = ? ORDER BY created_at LIMIT 1',
+}
+USER_COLUMNS = ('id', 'name', 'email', 'student_id', 'password', 'created_at', 'course_level', 'active')
+
+
+class SQLiteStorage:
+    """Tablas normalizadas e indexadas en SQLite (modo WAL, una conexión por hilo)
+
+    Las consultas usan siempre SQL constante con parámetros, de modo que el
+    caché de sentencias de sqlite3 las prepara una sola vez por conexión.
+    """
+
+    def __init__(self, db_file=SQLITE_DB_FILE):
+        self.db_file = db_file
+        self._local = threading.local()
+        self._connections = []
+        self._connections_lock = threading.Lock()
+        conn = self.connection()
+        had_rollups = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE name = 'quiz_rollups'").fetchone()
+        had_quizzes = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE name = 'quizzes'").fetchone()
+        if had_quizzes and not had_rollups:
+            columns = [row['name'] for row in conn.execute('PRAGMA table_info(quizzes)')]
+            if 'auto_id' not in columns:
+                conn.execute('ALTER TABLE quizzes ADD COLUMN auto_id INTEGER NOT NULL DEFAULT 0')
+        conn.executescript(SQLITE_SCHEMA)
+        if had_quizzes and not had_rollups:
+            self._backfill_quiz_rollups(conn)
+
+    def _backfill_quiz_rollups(self, conn):
+        """Calcular los agregados de quizzes de una base creada antes de existir
+
+        Entonces los intentos sin quiz_id se guardaban como quiz_<n.º de intento
+        del usuario>: se marcan como auto_id y no cuentan en quiz_stats.
+        """
+        conn.executescript("""
+            BEGIN;
+            UPDATE quizzes SET auto_id = 1 WHERE id IN (
+                SELECT id FROM (
+                    SELECT id, quiz_id, ROW_NUMBER() OVER (PARTITION BY user_id ORDER BY id) AS attempt
+                    FROM quizzes)
+                WHERE quiz_id = 'quiz_' || attempt);
+            INSERT OR IGNORE INTO quiz_rollups (user_id, total_quizzes, correct_answers, total_questions)
+                SELECT user_id, COUNT(*), SUM(correct_answers), SUM(total_questions)
+                FROM quizzes GROUP BY user_id;
+            INSERT OR IGNORE INTO quiz_stats (user_id, quiz_id, attempts, best_accuracy, last_accuracy, last_date)
+                SELECT q.user_id, q.quiz_id, COUNT(*), MAX(q.accuracy),
+                    (SELECT l.accuracy FROM quizzes l WHERE l.user_id = q.user_id
+                        AND l.quiz_id = q.quiz_id ORDER BY l.id DESC LIMIT 1),
+                    MAX(q.taken_at)
+                FROM quizzes q WHERE NOT q.auto_id GROUP BY q.user_id, q.quiz_id;
+            COMMIT;
+        """)
+
+    def connection(self):
+        """Conexión propia del hilo actual"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_file, isolation_level=None,
+                                   check_same_thread=False, cached_statements=256)
+            conn.row_factory = sqlite3.Row
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            conn.execute('PRAGMA foreign_keys=ON')
+            conn.execute('PRAGMA busy_timeout=5000')
+            self._local.conn = conn
+            with self._connections_lock:
+                self._connections.append(conn)
+        return conn
+
+    def release_connection(self):
+        """Cerrar la conexión del hilo actual (al terminar cada petición)
+
+        Con un servidor de un hilo por petición cada hilo nuevo abriría otra
+        conexión que nadie cierra; la siguiente petición del hilo abre una nueva.
+        """
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            return
+        self._local.conn = None
+        with self._connections_lock:
+            if conn in self._connections:
+                self._connections.remove(conn)
+        conn.close()
+
+    def flush(self):
+        """Cada mutación se confirma en su propia transacción: no hay nada pendiente"""
+
+    def close(self):
+        with self._connections_lock:
+            for conn in self._connections:
+                conn.close()
+            self._connections = []
+        self._local = threading.local()
+
+    def _user_from_row(self, row):
+        user = {column: row[column] for column in USER_COLUMNS}
+        user['active'] = bool(user['active'])
+        return user
+
+    def get_user(self, user_id):
+        row = self.connection().execute(
+            'SELECT * FROM users WHERE id = ?', (user_id,)).fetchone()
+        return self._user_from_row(row) if row else None
+
+    def iter_users(self):
+        for row in self.connection().execute('SELECT * FROM users ORDER BY created_at'):
+            yield self._user_from_row(row)
+
+    def count_users(self):
+        return self.connection().execute('SELECT COUNT(*) FROM users').fetchone()[0]
+
+    def get_progress(self, user_id):
+        """Reconstruir el documento de progreso a partir de las tablas normalizadas"""
+        conn = self.connection()
+        user = conn.execute(
+            'SELECT created_at, version, last_updated FROM users WHERE id = ?',
+            (user_id,)).fetchone()
+        if user is None:
+            return None
+
+        progress = new_progress(user_id, user['last_updated'] or user['created_at'])
+        progress['version'] = user['version']
+
+        attendance = progress['attendance']
+        attendance['attendance_dates'] = [row[0] for row in conn.execute(
+            'SELECT class_date FROM attendance WHERE user_id = ? ORDER BY class_date', (user_id,))]
+        attendance['attended_classes'] = len(attendance['attendance_dates'])
+
+        materials = progress['materials']
+        for row in conn.execute(
+                'SELECT material_type, item_id FROM materials WHERE user_id = ? '
+                'ORDER BY material_type, item_id', (user_id,)):
+            materials['materials_viewed'][row['material_type']].append(row['item_id'])
+            materials[f"{row['material_type']}_completed"] += 1
+
+        quiz_scores = progress['quiz_scores']
+        rollup = conn.execute(
+            'SELECT total_quizzes, correct_answers, total_questions FROM quiz_rollups '
+            'WHERE user_id = ?', (user_id,)).fetchone()
+        if rollup:
+            quiz_scores.update(dict(rollup))
+        for row in conn.execute(
+                'SELECT quiz_id, attempts, best_accuracy, last_accuracy, last_date '
+                'FROM quiz_stats WHERE user_id = ?', (user_id,)):
+            quiz_scores['per_quiz'][row['quiz_id']] = {
+                'attempts': row['attempts'],
+                'best_accuracy': row['best_accuracy'],
+                'last_accuracy': row['last_accuracy'],
+                'last_date': row['last_date']
+            }
+        recent = conn.execute(
+            'SELECT quiz_id, correct_answers, total_questions, accuracy, taken_at '
+            'FROM quizzes WHERE user_id = ? ORDER BY id DESC LIMIT ?',
+            (user_id, QUIZ_HISTORY_LIMIT)).fetchall()
+        quiz_scores['quiz_history'] = [{
+            'quiz_id': row['quiz_id'],
+            'correct_answers': row['correct_answers'],
+            'total_questions': row['total_questions'],
+            'accuracy': row['accuracy'],
+            'date': row['taken_at']
+        } for row in reversed(recent)]
+
+        for row in conn.execute(
+                'SELECT project_id, completed_at FROM projects WHERE user_id = ?', (user_id,)):
+            progress['projects'][row['project_id']] = {
+                'status': 'completed', 'completed_at': row['completed_at']}
+
+        return progress
+
+    def progress_version(self, user_id):
+        row = self.connection().execute('SELECT version FROM users WHERE id = ?', (user_id,)).fetchone()
+        return row[0] if row else None
+
+    def iter_progress(self):
+        """Pares (usuario, progreso resumido) con una sola consulta agregada
+
+        El progreso resumido solo trae los contadores; las listas (fechas,
+        materiales vistos, historial de quizzes) quedan vacías.
+        """
+        query = """
+            SELECT u.*,
+                (SELECT COUNT(*) FROM attendance a WHERE a.user_id = u.id) AS attended_classes,
+                (SELECT COUNT(*) FROM materials m
+                    WHERE m.user_id = u.id AND m.material_type = 'vocabulary') AS vocabulary_completed,
+                (SELECT COUNT(*) FROM materials m
+                    WHERE m.user_id = u.id AND m.material_type = 'exercises') AS exercises_completed,
+                COALESCE(r.total_quizzes, 0) AS total_quizzes,
+                COALESCE(r.correct_answers, 0) AS correct_answers,
+                COALESCE(r.total_questions, 0) AS total_questions,
+                (SELECT GROUP_CONCAT(p.project_id) FROM projects p
+                    WHERE p.user_id = u.id) AS completed_projects
+            FROM users u LEFT JOIN quiz_rollups r ON r.user_id = u.id
+            ORDER BY u.created_at
+        """
+        for row in self.connection().execute(query):
+            progress = new_progress(row['id'], row['last_updated'] or row['created_at'])
+            progress['version'] = row['version']
+            progress['attendance']['attended_classes'] = row['attended_classes']
+            progress['materials']['vocabulary_completed'] = row['vocabulary_completed']
+            progress['materials']['exercises_completed'] = row['exercises_completed']
+            progress['quiz_scores']['total_quizzes'] = row['total_quizzes']
+            progress['quiz_scores']['correct_answers'] = row['correct_answers']
+            progress['quiz_scores']['total_questions'] = row['total_questions']
+            for project_id in (row['completed_projects'] or '').split(','):
+                if project_id in progress['projects']:
+                    progress['projects'][project_id]['status'] = 'completed'
+            yield self._user_from_row(row), progress
+
+    def apply(self, user_id, op, **fields):
+        """Aplicar una mutación en una transacción y subir la versión del usuario"""
+        return self.apply_many([(user_id, op, fields)])[0]
+
+    def apply_many(self, changes):
+        """Aplicar una lista de (user_id, op, fields) en una única transacción"""
+        conn = self.connection()
+        at = datetime.now().isoformat()
+        results = []
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            for user_id, op, fields in changes:
+                if op == 'create_user':
+                    changed = self._apply_create_user(conn, user_id, at, fields)
+                else:
+                    exists = conn.execute('SELECT 1 FROM users WHERE id = ?', (user_id,)).fetchone()
+                    changed = bool(exists) and getattr(self, f'_apply_{op}')(conn, user_id, at, fields)
+                if changed:
+                    conn.execute(
+                        'UPDATE users SET version = version + 1, last_updated = ? WHERE id = ?',
+                        (at, user_id))
+                results.append(changed)
+            conn.execute('COMMIT')
+        except BaseException:
+            conn.execute('ROLLBACK')
+            raise
+        return results
+
+    def add_checkins(self, records):
+        """Guardar registros de asistencia en una transacción (idempotente por record_id)"""
+        conn = self.connection()
+        received_at = datetime.now().isoformat()
+        results = []
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            for record in records:
+                cursor = conn.execute(
+                    'INSERT OR IGNORE INTO checkins (record_id, session, received_at, record) '
+                    'VALUES (?, ?, ?, ?)',
+                    (record['record_id'], record.get('session'), received_at,
+                     json.dumps(record, ensure_ascii=False)))
+                if cursor.rowcount == 1:
+                    results.append((record['record_id'], cursor.lastrowid, True))
+                else:
+                    seq = conn.execute('SELECT seq FROM checkins WHERE record_id = ?',
+                                       (record['record_id'],)).fetchone()[0]
+                    results.append((record['record_id'], seq, False))
+            conn.execute('COMMIT')
+        except BaseException:
+            conn.execute('ROLLBACK')
+            raise
+        return results
+
+    def checkins_since(self, cursor, limit, session=None):
+        """Registros con seq > cursor; devuelve (registros, nuevo cursor, hay_más)"""
+        conn = self.connection()
+        latest = conn.execute('SELECT COALESCE(MAX(seq), 0) FROM checkins').fetchone()[0]
+        if session is None:
+            rows = conn.execute(
+                'SELECT * FROM checkins WHERE seq > ? AND seq <= ? ORDER BY seq LIMIT ?',
+                (cursor, latest, limit)).fetchall()
+        else:
+            rows = conn.execute(
+                'SELECT * FROM checkins WHERE session = ? AND seq > ? AND seq <= ? '
+                'ORDER BY seq LIMIT ?', (session, cursor, latest, limit)).fetchall()
+
+        found = [{
+            'seq': row['seq'],
+            'record_id': row['record_id'],
+            'session': row['session'],
+            'received_at': row['received_at'],
+            'record': json.loads(row['record'])
+        } for row in rows]
+        has_more = len(found) == limit and found[-1]['seq'] < latest
+        new_cursor = found[-1]['seq'] if has_more else max(latest, cursor)
+        return found, new_cursor, has_more
+
+    def claim_once(self, key, expires):
+        """Reservar key hasta expires (epoch); False si ya estaba reservada
+
+        INSERT OR IGNORE es atómico, así que vale entre varios procesos.
+        """
+        conn = self.connection()
+        conn.execute('DELETE FROM claims WHERE expires < ?', (time.time(),))
+        cursor = conn.execute('INSERT OR IGNORE INTO claims (key, expires) VALUES (?, ?)',
+                              (key, expires))
+        return cursor.rowcount == 1
+
+    def claim_checkin(self, key, expires, record):
+        """Reservar key y guardar el registro en la misma transacción
+
+        Devuelve (record_id, seq, nuevo), o None si key ya estaba reservada.
+        """
+        conn = self.connection()
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            conn.execute('DELETE FROM claims WHERE expires < ?', (time.time(),))
+            claimed = conn.execute('INSERT OR IGNORE INTO claims (key, expires) VALUES (?, ?)',
+                                   (key, expires)).rowcount == 1
+            if claimed:
+                cursor = conn.execute(
+                    'INSERT INTO checkins (record_id, session, received_at, record) VALUES (?, ?, ?, ?)',
+                    (record['record_id'], record.get('session'), datetime.now().isoformat(),
+                     json.dumps(record, ensure_ascii=False)))
+            conn.execute('COMMIT')
+        except BaseException:
+            conn.execute('ROLLBACK')
+            raise
+        return (record['record_id'], cursor.lastrowid, True) if claimed else None
+
+    def find_user(self, field, value):
+        """user_id por email o código de estudiante (LOOKUP_FIELDS), o None"""
+        value = normalize_lookup(field, value)
+        if value is None:
+            return None
+        row = self.connection().execute(LOOKUP_QUERIES[field], (value,)).fetchone()
+        return row['id'] if row else None
+
+    def _apply_create_user(self, conn, user_id, at, fields):
+        # Dentro de la transacción de apply_many: la comprobación del email y el
+        # alta son atómicas también entre varios procesos
+        user = fields['user']
+        cursor = conn.execute(
+            'INSERT OR IGNORE INTO users (id, name, email, student_id, password, created_at, '
+            'course_level, active) SELECT ?, ?, ?, ?, ?, ?, ?, ? '
+            'WHERE NOT EXISTS (SELECT 1 FROM users WHERE lower(trim(email)) = ?)',
+            (*(user[column] for column in USER_COLUMNS), normalize_lookup('email', user.get('email'))))
+        return cursor.rowcount == 1
+
+    def _apply_set_password(self, conn, user_id, at, fields):
+        cursor = conn.execute('UPDATE users SET password = ? WHERE id = ? AND password IS NOT ?',
+                              (fields['password'], user_id, fields['password']))
+        return cursor.rowcount == 1
+
+    def _apply_attendance(self, conn, user_id, at, fields):
+        cursor = conn.execute(
+            'INSERT OR IGNORE INTO attendance (user_id, class_date, recorded_at) VALUES (?, ?, ?)',
+            (user_id, fields['class_date'], at))
+        return cursor.rowcount == 1
+
+    def _apply_material(self, conn, user_id, at, fields):
+        if fields['material_type'] not in MATERIAL_TYPES:
+            return False
+        cursor = conn.execute(
+            'INSERT OR IGNORE INTO materials (user_id, material_type, item_id, viewed_at) '
+            'VALUES (?, ?, ?, ?)',
+            (user_id, fields['material_type'], fields['item_id'], at))
+        return cursor.rowcount == 1
+
+    def _apply_quiz(self, conn, user_id, at, fields):
+        quiz_record = fields['quiz']
+        quiz_id = quiz_record.get('quiz_id')
+        rollup = conn.execute(
+            'SELECT total_quizzes FROM quiz_rollups WHERE user_id = ?', (user_id,)).fetchone()
+        if not quiz_id:
+            quiz_id = f'quiz_{(rollup[0] if rollup else 0) + 1}'
+        conn.execute(
+            'INSERT INTO quizzes (user_id, quiz_id, auto_id, correct_answers, total_questions, '
+            'accuracy, taken_at) VALUES (?, ?, ?, ?, ?, ?, ?)',
+            (user_id, quiz_id, int(not quiz_record.get('quiz_id')), quiz_record['correct_answers'],
+             quiz_record['total_questions'], quiz_record['accuracy'], quiz_record['date']))
+        conn.execute(
+            'INSERT INTO quiz_rollups (user_id, total_quizzes, correct_answers, total_questions) '
+            'VALUES (?, 1, ?, ?) ON CONFLICT (user_id) DO UPDATE SET '
+            'total_quizzes = total_quizzes + 1, '
+            'correct_answers = correct_answers + excluded.correct_answers, '
+            'total_questions = total_questions + excluded.total_questions',
+            (user_id, quiz_record['correct_answers'], quiz_record['total_questions']))
+        if quiz_record.get('quiz_id'):
+            conn.execute(
+                'INSERT INTO quiz_stats (user_id, quiz_id, attempts, best_accuracy, last_accuracy, '
+                'last_date) VALUES (?, ?, 1, ?, ?, ?) ON CONFLICT (user_id, quiz_id) DO UPDATE SET '
+                'attempts = attempts + 1, best_accuracy = MAX(best_accuracy, excluded.best_accuracy), '
+                'last_accuracy = excluded.last_accuracy, last_date = excluded.last_date',
+                (user_id, quiz_id, quiz_record['accuracy'], quiz_record['accuracy'], quiz_record['date']))
+        return True
+
+    def _apply_project(self, conn, user_id, at, fields):
+        if fields['project_id'] not in PROJECT_IDS:
+            return False
+        cursor = conn.execute(
+            'INSERT OR IGNORE INTO projects (user_id, project_id, completed_at) VALUES (?, ?, ?)',
+            (user_id, fields['project_id'], at))
+        return cursor.rowcount == 1
+
+
+STORAGE_BACKENDS = {
+    'json': JsonStorage,
+    'sqlite': SQLiteStorage,
+}
+
+
+def create_storage(kind=None):
+    """Crear el backend indicado (o el de la variable de entorno USER_STORAGE)"""
+    kind = (kind or os.environ.get('USER_STORAGE', 'json')).lower()
+    if kind not in STORAGE_BACKENDS:
+        raise ValueError(f"Backend de almacenamiento desconocido: {kind}")
+    return STORAGE_BACKENDS[kind]()
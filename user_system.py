@@ -3,260 +3,795 @@
 Sistema de gestión de usuarios y base de datos para seguimiento del progreso
 """
 
+import asyncio
+import base64
 import json
 import os
+import threading
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, date
-from flask import Flask, request, jsonify, render_template_string
+from functools import partial, wraps
+from flask import Flask, Response, g, request, jsonify
 from flask_cors import CORS
 import hashlib
+import hmac
 import secrets
+from user_storage import create_storage, normalize_lookup
 
-# Datos de usuarios (en producción usaríamos una base de datos real)
-USERS_DB_FILE = 'users_database.json'
-PROGRESS_DB_FILE = 'progress_database.json'
+# Clave para firmar tokens; si no se define USER_SYSTEM_SECRET se genera una y se
+# guarda en SECRET_KEY_FILE para que todos los procesos usen la misma
+SECRET_KEY_FILE = '.user_system_secret'
+# Validez de los tokens de asistencia que se muestran en el QR (segundos)
+ATTENDANCE_TOKEN_TTL = 5 * 60
+# Validez máxima que se puede pedir al emitir un token
+ATTENDANCE_TOKEN_MAX_TTL = 4 * 60 * 60
+# Check-ins guardados sin conexión: se aceptan si se escanearon mientras el token
+# valía y se suben como mucho este tiempo después de que caducara (segundos), con
+# un margen para el reloj del dispositivo
+ATTENDANCE_OFFLINE_MAX_DELAY = 24 * 60 * 60
+ATTENDANCE_CLOCK_SKEW = 2 * 60
+# Contraseñas: iteraciones de PBKDF2-SHA256 y procesos dedicados a calcularlo
+# (0 = en el propio hilo de la petición; hashlib libera el GIL durante el cálculo)
+PASSWORD_HASH_ITERATIONS = int(os.environ.get('PASSWORD_HASH_ITERATIONS', '600000'))
+PASSWORD_HASH_WORKERS = int(os.environ.get('PASSWORD_HASH_WORKERS', '0'))
+# Validez de los tokens de sesión que se emiten al iniciar sesión (segundos)
+SESSION_TOKEN_TTL = 12 * 60 * 60
+# Verificaciones correctas recientes que se recuerdan para no repetir el hash
+LOGIN_CACHE_SIZE = 4096
+LOGIN_CACHE_TTL = 10 * 60
+# Stream de asistencia en vivo: eventos recientes que se guardan por sesión para
+# las reconexiones, sesiones con búfer, latido (también es lo que tarda en verse
+# un registro recibido por otro proceso) y duración máxima de cada conexión
+CHECKIN_EVENT_BUFFER = 200
+CHECKIN_EVENT_SESSIONS = 64
+CHECKIN_STREAM_HEARTBEAT = 15
+CHECKIN_STREAM_MAX_SECONDS = 2 * 60
 
 class UserSystem:
-    def __init__(self):
-        self.load_databases()
-
-    def load_databases(self):
-        """Cargar bases de datos desde archivos JSON"""
-        if os.path.exists(USERS_DB_FILE):
-            with open(USERS_DB_FILE, 'r', encoding='utf-8') as f:
-                self.users = json.load(f)
-        else:
-            self.users = {}
-
-        if os.path.exists(PROGRESS_DB_FILE):
-            with open(PROGRESS_DB_FILE, 'r', encoding='utf-8') as f:
-                self.progress = json.load(f)
-        else:
-            self.progress = {}
-
-    def save_databases(self):
-        """Guardar bases de datos a archivos JSON"""
-        with open(USERS_DB_FILE, 'w', encoding='utf-8') as f:
-            json.dump(self.users, f, ensure_ascii=False, indent=2)
-
-        with open(PROGRESS_DB_FILE, 'w', encoding='utf-8') as f:
-            json.dump(self.progress, f, ensure_ascii=False, indent=2)
+    def __init__(self, storage=None, passwords=None):
+        self.storage = storage or create_storage()
+        self.passwords = passwords or PasswordHasher()
 
     def create_user(self, name, email, student_id=None):
-        """Crear nuevo usuario"""
+        """Crear nuevo usuario (None si el email ya está registrado)"""
+        # Un email repetido se rechaza antes de pagar el hash de la contraseña;
+        # el alta lo vuelve a comprobar bajo candado por si hay dos a la vez
+        normalized_email = normalize_lookup('email', email)
+        if self.storage.find_user('email', normalized_email):
+            return None
+
         user_id = secrets.token_hex(8)
         password = secrets.token_hex(4)
 
         user_data = {
             'id': user_id,
             'name': name,
-            'email': email,
-            'student_id': student_id,
+            'email': normalized_email,
+            'student_id': normalize_lookup('student_id', student_id),
             'password': password,
             'created_at': datetime.now().isoformat(),
             'course_level': 'A1.2-A2.1',
             'active': True
         }
 
-        self.users[user_id] = user_data
-        self.initialize_progress(user_id)
-        self.save_databases()
+        # Se guarda solo el hash; la contraseña en claro se devuelve una única vez
+        stored = dict(user_data, password=self.passwords.hash(password))
+        if not self.storage.apply(user_id, 'create_user', user=stored):
+            return None
 
         return user_data
 
-    def initialize_progress(self, user_id):
-        """Inicializar progreso del usuario"""
-        self.progress[user_id] = {
-            'user_id': user_id,
-            'attendance': {
-                'total_classes': 16,  # Lunes-Jueves x 4 semanas
-                'attended_classes': 0,
-                'attendance_dates': [],
-                'attendance_rate': 0
-            },
-            'materials': {
-                'vocabulary_completed': 0,
-                'total_vocabulary': 50,
-                'exercises_completed': 0,
-                'total_exercises': 20,
-                'materials_viewed': [],
-                'completion_rate': 0
-            },
-            'projects': {
-                'photo_project': {'status': 'pending', 'completed_at': None},
-                'cooking_workshop': {'status': 'pending', 'completed_at': None},
-                'role_playing': {'status': 'pending', 'completed_at': None},
-                'final_project': {'status': 'pending', 'completed_at': None},
-                'completion_rate': 0
-            },
-            'quiz_scores': {
-                'total_quizzes': 0,
-                'correct_answers': 0,
-                'accuracy_rate': 0,
-                'quiz_history': []
-            },
-            'weekly_goals': {
-                'week_1': {'goals': [], 'completed': 0, 'total': 0},
-                'week_2': {'goals': [], 'completed': 0, 'total': 0},
-                'week_3': {'goals': [], 'completed': 0, 'total': 0},
-                'week_4': {'goals': [], 'completed': 0, 'total': 0}
-            },
-            'last_updated': datetime.now().isoformat()
-        }
-
     def get_user_progress(self, user_id):
-        """Obtener progreso completo del usuario"""
-        if user_id not in self.progress:
+        """Obtener progreso completo del usuario (solo lectura, no escribe a disco)"""
+        progress_data = self.storage.get_progress(user_id)
+        if progress_data is None:
             return None
 
-        # Calcular tasas de completado
-        progress_data = self.progress[user_id]
+        return self.compute_rates(progress_data)
+
+    def get_progress_version(self, user_id):
+        """Versión del progreso (sube con cada cambio) sin leer el documento completo"""
+        return self.storage.progress_version(user_id)
 
+    @staticmethod
+    def progress_rates(progress_data):
+        """Tasas derivadas de un documento de progreso, sin modificarlo"""
         # Asistencia
         attendance = progress_data['attendance']
-        attendance['attendance_rate'] = round((attendance['attended_classes'] / attendance['total_classes']) * 100, 1) if attendance['total_classes'] > 0 else 0
+        attendance_rate = round((attendance['attended_classes'] / attendance['total_classes']) * 100, 1) if attendance['total_classes'] > 0 else 0
 
         # Materiales
         materials = progress_data['materials']
         total_materials = materials['total_vocabulary'] + materials['total_exercises']
         completed_materials = materials['vocabulary_completed'] + materials['exercises_completed']
-        materials['completion_rate'] = round((completed_materials / total_materials) * 100, 1) if total_materials > 0 else 0
+        completion_rate = round((completed_materials / total_materials) * 100, 1) if total_materials > 0 else 0
 
-        # Proyectos
-        projects = progress_data['projects']
-        completed_projects = sum(1 for project in projects.values() if project['status'] == 'completed')
-        total_projects = len([p for p in projects.values() if p['status'] != 'final_project']) + 1
-        projects['completion_rate'] = round((completed_projects / total_projects) * 100, 1) if total_projects > 0 else 0
+        # Proyectos (la clave 'completion_rate' convive con los proyectos en el mismo dict)
+        projects = [p for p in progress_data['projects'].values() if isinstance(p, dict)]
+        completed_projects = sum(1 for project in projects if project['status'] == 'completed')
+        projects_rate = round((completed_projects / len(projects)) * 100, 1) if projects else 0
 
         # Quiz scores
         quiz_scores = progress_data['quiz_scores']
-        if quiz_scores['total_quizzes'] > 0:
-            quiz_scores['accuracy_rate'] = round((quiz_scores['correct_answers'] / (quiz_scores['total_quizzes'] * 5)) * 100, 1)  # Asumiendo 5 preguntas por quiz
+        accuracy_rate = round((quiz_scores['correct_answers'] / quiz_scores['total_questions']) * 100, 1) if quiz_scores['total_questions'] > 0 else 0
 
-        progress_data['last_updated'] = datetime.now().isoformat()
-        self.save_databases()
+        return {
+            'attendance_rate': attendance_rate,
+            'materials_completion': completion_rate,
+            'projects_completion': projects_rate,
+            'quiz_accuracy': accuracy_rate
+        }
 
+    @classmethod
+    def compute_rates(cls, progress_data):
+        """Escribir las tasas derivadas en un documento de progreso sin persistirlas"""
+        rates = cls.progress_rates(progress_data)
+        progress_data['attendance']['attendance_rate'] = rates['attendance_rate']
+        progress_data['materials']['completion_rate'] = rates['materials_completion']
+        progress_data['projects']['completion_rate'] = rates['projects_completion']
+        progress_data['quiz_scores']['accuracy_rate'] = rates['quiz_accuracy']
         return progress_data
 
     def record_attendance(self, user_id, class_date=None):
         """Registrar asistencia de un usuario"""
-        if user_id not in self.progress:
-            return False
-
         if class_date is None:
             class_date = date.today().isoformat()
 
-        progress = self.progress[user_id]
-        if class_date not in progress['attendance']['attendance_dates']:
-            progress['attendance']['attendance_dates'].append(class_date)
-            progress['attendance']['attended_classes'] += 1
-            progress['last_updated'] = datetime.now().isoformat()
-            self.save_databases()
-            return True
+        return self.storage.apply(user_id, 'attendance', class_date=class_date)
 
-        return False
+    def record_attendance_batch(self, records, class_date=None):
+        """Registrar la asistencia de varios usuarios con una sola persistencia
+
+        records es una lista de dicts con 'user_id' y, opcionalmente,
+        'class_date'; devuelve un resultado por elemento, en el mismo orden.
+        """
+        default_date = class_date or date.today().isoformat()
+        results = [{'user_id': record.get('user_id'),
+                    'class_date': record.get('class_date') or default_date}
+                   for record in records]
+
+        valid = [result for result in results if result['user_id']]
+        applied = self.storage.apply_many(
+            [(result['user_id'], 'attendance', {'class_date': result['class_date']}) for result in valid])
+        for result, success in zip(valid, applied):
+            result['success'] = success
+
+        for result in results:
+            result.setdefault('success', False)
+        return results
+
+    def checkins_since(self, cursor=0, session=None, limit=500):
+        """Registros de asistencia que el servidor tiene después de 'cursor'"""
+        checkins, new_cursor, has_more = self.storage.checkins_since(cursor, limit, session)
+        return {
+            'records': [checkin_record(checkin) for checkin in checkins],
+            'cursor': new_cursor,
+            'has_more': has_more
+        }
 
     def update_material_progress(self, user_id, material_type, item_id):
         """Actualizar progreso de materiales"""
-        if user_id not in self.progress:
-            return False
+        return self.storage.apply(user_id, 'material', material_type=material_type, item_id=item_id)
 
-        progress = self.progress[user_id]
-        material_key = f"{material_type}_completed"
+    def update_material_progress_batch(self, user_id, items, material_type=None):
+        """Registrar de una vez varios materiales vistos (p. ej. todas las páginas de una miniweb)
 
-        if material_key in progress['materials']:
-            if item_id not in progress['materials'].get('materials_viewed', []):
-                progress['materials']['materials_viewed'].append(item_id)
-                progress['materials'][material_key] += 1
-                progress['last_updated'] = datetime.now().isoformat()
-                self.save_databases()
-                return True
+        items es una lista de dicts con 'item_id' y, opcionalmente,
+        'material_type'; devuelve un resultado por elemento, en el mismo orden.
+        """
+        results = [{'material_type': item.get('material_type') or material_type,
+                    'item_id': item.get('item_id')} for item in items]
 
-        return False
+        valid = [result for result in results if result['material_type'] and result['item_id']]
+        applied = self.storage.apply_many(
+            [(user_id, 'material', {'material_type': result['material_type'], 'item_id': result['item_id']})
+             for result in valid])
+        for result, success in zip(valid, applied):
+            result['success'] = success
+
+        for result in results:
+            result.setdefault('success', False)
+        return results
 
     def record_quiz_score(self, user_id, correct_answers, total_questions, quiz_id=None):
         """Registrar resultado de quiz"""
-        if user_id not in self.progress:
-            return False
-
-        progress = self.progress[user_id]
         quiz_record = {
-            'quiz_id': quiz_id or f"quiz_{len(progress['quiz_scores']['quiz_history']) + 1}",
+            'quiz_id': quiz_id,
             'correct_answers': correct_answers,
             'total_questions': total_questions,
             'accuracy': round((correct_answers / total_questions) * 100, 1) if total_questions > 0 else 0,
             'date': datetime.now().isoformat()
         }
 
-        progress['quiz_scores']['quiz_history'].append(quiz_record)
-        progress['quiz_scores']['total_quizzes'] += 1
-        progress['quiz_scores']['correct_answers'] += correct_answers
-        progress['last_updated'] = datetime.now().isoformat()
-        self.save_databases()
-
-        return True
+        return self.storage.apply(user_id, 'quiz', quiz=quiz_record)
 
     def complete_project(self, user_id, project_id):
         """Marcar proyecto como completado"""
-        if user_id not in self.progress or project_id not in self.progress[user_id]['projects']:
-            return False
-
-        progress = self.progress[user_id]
-        if progress['projects'][project_id]['status'] != 'completed':
-            progress['projects'][project_id]['status'] = 'completed'
-            progress['projects'][project_id]['completed_at'] = datetime.now().isoformat()
-            progress['last_updated'] = datetime.now().isoformat()
-            self.save_databases()
-            return True
-
-        return False
+        return self.storage.apply(user_id, 'project', project_id=project_id)
 
     def get_user_by_id(self, user_id):
         """Obtener datos de usuario por ID"""
-        return self.users.get(user_id)
+        return self.storage.get_user(user_id)
+
+    def get_user_by_email(self, email):
+        """Obtener datos de usuario por email (índice secundario, sin recorrer usuarios)"""
+        user_id = self.storage.find_user('email', email)
+        return self.storage.get_user(user_id) if user_id else None
+
+    def get_user_by_student_id(self, student_id):
+        """Obtener datos de usuario por código de estudiante"""
+        user_id = self.storage.find_user('student_id', student_id)
+        return self.storage.get_user(user_id) if user_id else None
 
     def authenticate_user(self, user_id, password):
-        """Autenticar usuario"""
-        user = self.users.get(user_id)
-        if user and user.get('password') == password:
-            return user
-        return None
+        """Autenticar usuario
+
+        Las contraseñas antiguas guardadas en claro (o con menos iteraciones)
+        se convierten al hash actual en el primer inicio de sesión correcto.
+        """
+        if not isinstance(password, str):
+            return None
+        user = self.storage.get_user(user_id)
+        if not user:
+            # El mismo cálculo que una contraseña incorrecta: el tiempo de
+            # respuesta no revela si el usuario existe
+            self.passwords.verify(user_id, password, self.passwords.dummy_hash)
+            return None
+        valid, outdated = self.passwords.verify(user_id, password, user.get('password') or '')
+        if not valid:
+            return None
+        if outdated:
+            self.storage.apply(user_id, 'set_password', password=self.passwords.hash(password))
+        return user
+
+    def iter_users_summary(self):
+        """Resumen de los usuarios activos en una sola pasada, sin tocar el disco"""
+        for user, progress in self.storage.iter_progress():
+            if user.get('active', True):
+                yield {
+                    'user_id': user['id'],
+                    'name': user['name'],
+                    'email': user['email'],
+                    **self.progress_rates(progress),
+                    'last_active': progress['last_updated']
+                }
 
     def get_all_users_summary(self):
         """Obtener resumen de todos los usuarios"""
-        summary = []
-        for user_id, user in self.users.items():
-            if user.get('active', True):
-                progress = self.get_user_progress(user_id)
-                if progress:
-                    summary.append({
-                        'user_id': user_id,
-                        'name': user['name'],
-                        'email': user['email'],
-                        'attendance_rate': progress['attendance']['attendance_rate'],
-                        'materials_completion': progress['materials']['completion_rate'],
-                        'projects_completion': progress['projects']['completion_rate'],
-                        'quiz_accuracy': progress['quiz_scores']['accuracy_rate'],
-                        'last_active': progress['last_updated']
-                    })
-        return summary
+        return list(self.iter_users_summary())
+
+def load_secret_key():
+    """Clave secreta del servidor (variable de entorno o archivo local)"""
+    secret = os.environ.get('USER_SYSTEM_SECRET')
+    if secret:
+        return secret.encode('utf-8')
+
+    if not os.path.exists(SECRET_KEY_FILE):
+        # Varios workers pueden llegar aquí a la vez tras el fork: la clave se
+        # escribe completa en un temporal y os.link la publica solo si nadie lo
+        # ha hecho antes; todos leen después la que quedó
+        tmp = f'{SECRET_KEY_FILE}.{os.getpid()}.tmp'
+        fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, 'w') as f:
+            f.write(secrets.token_hex(32))
+            f.flush()
+            os.fsync(f.fileno())
+        try:
+            os.link(tmp, SECRET_KEY_FILE)
+        except FileExistsError:
+            pass
+        finally:
+            os.unlink(tmp)
+    with open(SECRET_KEY_FILE, 'r') as f:
+        return f.read().strip().encode('utf-8')
+
+def pbkdf2_hash(password, salt, iterations):
+    """PBKDF2-SHA256 (función de módulo para poder enviarla a otro proceso)"""
+    return hashlib.pbkdf2_hmac('sha256', password.encode('utf-8'), salt, iterations)
+
+class PasswordHasher:
+    """Contraseñas con PBKDF2-SHA256 y sal propia: pbkdf2_sha256$<iter>$<sal>$<hash>
+
+    La comparación usa hmac.compare_digest. Como cada verificación cuesta
+    cientos de milisegundos de CPU, se recuerdan las verificaciones correctas
+    recientes (LRU acotada, con caducidad) bajo una clave HMAC que no guarda la
+    contraseña. Con workers > 0 el cálculo se hace en un ProcessPoolExecutor.
+    """
+
+    PREFIX = 'pbkdf2_sha256'
+
+    def __init__(self, iterations=PASSWORD_HASH_ITERATIONS, workers=PASSWORD_HASH_WORKERS,
+                 cache_size=LOGIN_CACHE_SIZE, cache_ttl=LOGIN_CACHE_TTL):
+        self.iterations = iterations
+        self.workers = workers
+        self.cache_size = cache_size
+        self.cache_ttl = cache_ttl
+        self._pool = None
+        self._pool_lock = threading.Lock()
+        self._cache = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self._cache_key = secrets.token_bytes(32)
+        # Hash fijo que no corresponde a ninguna contraseña, con el coste actual:
+        # se verifica contra él cuando el usuario no existe
+        self.dummy_hash = f"{self.PREFIX}${iterations}${'00' * 16}${'00' * 32}"
+
+    def _derive(self, password, salt, iterations):
+        if self.workers <= 0:
+            return pbkdf2_hash(password, salt, iterations)
+        with self._pool_lock:
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(max_workers=self.workers)
+        return self._pool.submit(pbkdf2_hash, password, salt, iterations).result()
+
+    def hash(self, password):
+        salt = secrets.token_bytes(16)
+        digest = self._derive(password, salt, self.iterations)
+        return f"{self.PREFIX}${self.iterations}${salt.hex()}${digest.hex()}"
+
+    def verify(self, user_id, password, stored):
+        """(válida, hay_que_rehacer_el_hash) para la contraseña de un usuario"""
+        if not stored.startswith(self.PREFIX + '$'):
+            # Contraseña antigua guardada en claro
+            valid = hmac.compare_digest(password.encode('utf-8'), stored.encode('utf-8'))
+            return valid, valid
+
+        cache_key = hmac.new(self._cache_key, f"{user_id}\0{stored}\0{password}".encode('utf-8'),
+                             hashlib.sha256).digest()
+        now = time.monotonic()
+        with self._cache_lock:
+            expires = self._cache.get(cache_key)
+            if expires is not None and expires > now:
+                self._cache.move_to_end(cache_key)
+                return True, False
+
+        try:
+            _, iterations, salt, expected = stored.split('$')
+            digest = self._derive(password, bytes.fromhex(salt), int(iterations))
+        except ValueError:
+            return False, False
+        if not hmac.compare_digest(digest, bytes.fromhex(expected)):
+            return False, False
+
+        with self._cache_lock:
+            self._cache[cache_key] = now + self.cache_ttl
+            self._cache.move_to_end(cache_key)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return True, int(iterations) < self.iterations
+
+class TokenSigner:
+    """Tokens firmados con HMAC-SHA256: <payload JSON en base64url>.<firma>
+
+    La verificación no necesita consultar ninguna base de datos.
+    """
+
+    def __init__(self, secret, purpose):
+        # Una clave derivada por uso: un token de asistencia no sirve como sesión
+        self.key = hmac.new(secret, purpose.encode('utf-8'), hashlib.sha256).digest()
+
+    @staticmethod
+    def _b64encode(data):
+        return base64.urlsafe_b64encode(data).rstrip(b'=').decode('ascii')
+
+    @staticmethod
+    def _b64decode(text):
+        return base64.urlsafe_b64decode(text + '=' * (-len(text) % 4))
+
+    def sign(self, payload):
+        body = self._b64encode(json.dumps(payload, separators=(',', ':')).encode('utf-8'))
+        signature = hmac.new(self.key, body.encode('ascii'), hashlib.sha256).digest()
+        return f"{body}.{self._b64encode(signature)}"
+
+    def verify(self, token, leeway=0):
+        """Payload del token si la firma es válida y no ha caducado (más leeway segundos); si no, None"""
+        try:
+            body, signature = token.split('.')
+            expected = hmac.new(self.key, body.encode('ascii'), hashlib.sha256).digest()
+            if not hmac.compare_digest(expected, self._b64decode(signature)):
+                return None
+            payload = json.loads(self._b64decode(body))
+        except (AttributeError, ValueError, TypeError):
+            return None
+        if payload.get('exp', 0) + leeway < time.time():
+            return None
+        return payload
+
+class AttendanceTokens:
+    """Tokens de asistencia por sesión de clase, cortos y firmados
+
+    La validación es sin estado (firma + caducidad). Para evitar que un mismo
+    estudiante use el QR dos veces, cada canje reserva la clave
+    (sesión, estudiante) en el almacenamiento con claim_once; con SQLite la
+    reserva vale para todos los procesos del servidor. La reserva dura hasta
+    que el token ya no se puede subir ni sin conexión, así que la memoria no
+    crece con el tiempo.
+    """
+
+    def __init__(self, signer, storage, ttl=ATTENDANCE_TOKEN_TTL):
+        self.signer = signer
+        self.storage = storage
+        self.ttl = ttl
+
+    def mint(self, session, ttl=None):
+        issued = int(time.time())
+        expires = issued + (ttl or self.ttl)
+        token = self.signer.sign({'s': session, 'iat': issued, 'exp': expires, 'n': secrets.token_hex(4)})
+        return token, expires
+
+    def validate(self, token, scanned_at=None):
+        """(sesión, caducidad) de un token válido, o None
+
+        Con scanned_at (hora epoch a la que el dispositivo guardó el check-in sin
+        conexión) el token vale aunque ya haya caducado, si esa hora cae dentro
+        de su validez y no han pasado más de ATTENDANCE_OFFLINE_MAX_DELAY.
+        """
+        if scanned_at is None:
+            payload = self.signer.verify(token)
+        else:
+            payload = self.signer.verify(token, ATTENDANCE_OFFLINE_MAX_DELAY)
+        if payload is None:
+            return None
+        if scanned_at is not None:
+            # Los tokens emitidos antes de llevar iat: lo máximo que pudieron durar
+            issued = payload.get('iat', payload['exp'] - ATTENDANCE_TOKEN_MAX_TTL)
+            latest = min(payload['exp'], time.time()) + ATTENDANCE_CLOCK_SKEW
+            if not issued - ATTENDANCE_CLOCK_SKEW <= scanned_at <= latest:
+                return None
+        return payload['s'], payload['exp']
+
+    def redeem(self, token, student_key, record=None, scanned_at=None):
+        """Canjear el token para un estudiante: devuelve la sesión, o None si no vale
+
+        Devuelve False si ese estudiante ya lo había canjeado en esta sesión.
+        Con record, el registro de asistencia (con la sesión del token) se
+        guarda en la misma operación que la reserva: no hay canje sin registro.
+        scanned_at es el de validate, para los check-ins guardados sin conexión.
+        """
+        validated = self.validate(token, scanned_at)
+        if validated is None:
+            return None
+        session, token_expires = validated
+
+        claim = json.dumps(['attendance', session, student_key])
+        expires = token_expires + ATTENDANCE_OFFLINE_MAX_DELAY
+        if record is None:
+            claimed = self.storage.claim_once(claim, expires)
+        else:
+            claimed = self.storage.claim_checkin(claim, expires, dict(record, session=session)) is not None
+        if not claimed:
+            return False
+        return session
+
+class SessionTokens:
+    """Tokens de sesión firmados: el servidor no guarda las sesiones abiertas
+
+    validate solo comprueba la firma, la caducidad y la lista de revocados
+    (en memoria), así que una petición autenticada no consulta la base de
+    datos. Cada token revocado se recuerda hasta que caduca y luego se olvida.
+    Con varios procesos cada uno tiene su propia lista: un cierre de sesión
+    solo se ve en el proceso que lo atendió, hasta que el token caduca.
+    """
+
+    def __init__(self, signer, ttl=SESSION_TOKEN_TTL):
+        self.signer = signer
+        self.ttl = ttl
+        self._revoked = {}
+        self._lock = threading.Lock()
+        self._purge_at = 0
+
+    def issue(self, user_id):
+        """Emitir un token para el usuario; devuelve (token, caducidad)"""
+        expires = int(time.time()) + self.ttl
+        token = self.signer.sign({'u': user_id, 'exp': expires, 'j': secrets.token_hex(8)})
+        return token, expires
+
+    def _payload(self, token):
+        payload = self.signer.verify(token)
+        if payload is None or payload.get('j') in self._revoked:
+            return None
+        return payload
+
+    def validate(self, token):
+        """user_id del token si es válido y no se ha revocado; si no, None"""
+        payload = self._payload(token)
+        return payload['u'] if payload else None
+
+    def revoke(self, token):
+        payload = self._payload(token)
+        if payload is None:
+            return False
+        now = time.time()
+        with self._lock:
+            if now >= self._purge_at:
+                self._revoked = {jti: expires for jti, expires in self._revoked.items() if expires >= now}
+                self._purge_at = now + 60
+            self._revoked[payload['j']] = payload['exp']
+        return True
+
+def clean_checkin(record):
+    """Registro de asistencia con solo los campos de CHECKIN_FIELDS, o None si no es válido
+
+    Lo demás que envíe el cliente (token del QR, IP, navegador...) no se guarda.
+    """
+    if not isinstance(record, dict):
+        return None
+    cleaned = {}
+    for field, max_length in CHECKIN_FIELDS.items():
+        value = record.get(field)
+        if value is None and field not in CHECKIN_REQUIRED:
+            continue
+        if not isinstance(value, str) or not value.strip() or len(value) > max_length:
+            return None
+        cleaned[field] = value.strip()
+    if 'timestamp' in cleaned:
+        try:
+            datetime.fromisoformat(cleaned['timestamp'])
+        except ValueError:
+            return None
+    return cleaned
+
+def checkin_key(student_id, user_id=None):
+    """Clave con la que se canjea el QR para un estudiante
+
+    Es el código de estudiante tanto en /api/attendance como en
+    /api/attendance/checkin, así que un mismo token no se canjea una vez por
+    ruta. Solo los usuarios sin código usan su user_id.
+    """
+    student_id = normalize_lookup('student_id', student_id)
+    return student_id if student_id else f'user:{user_id}'
+
+def checkin_record(checkin):
+    """Registro de asistencia tal como lo reciben las páginas (sincronización y stream)"""
+    # Los registros guardados antes de filtrar los campos pueden llevar token, IP o navegador
+    record = {field: value for field, value in checkin['record'].items() if field in CHECKIN_FIELDS}
+    return {**record, 'record_id': checkin['record_id'],
+            'seq': checkin['seq'], 'received_at': checkin['received_at']}
+
+class CheckinFeed:
+    """Eventos de asistencia en vivo por sesión, para el stream del profesorado
+
+    Un único cursor recorre los registros del almacenamiento en orden de seq y
+    reparte cada uno en el búfer acotado de su sesión; los streams esperan en
+    una condición (stream, un hilo por conexión) o en un asyncio.Event de su
+    bucle (astream, sin ocupar ningún hilo) y solo leen de esos búferes. El
+    cursor avanza cuando se registran check-ins en este proceso y, para los que
+    llegan por otros procesos, cada vez que un stream cumple el latido sin
+    eventos. Una reconexión más antigua que el búfer se completa con el
+    almacenamiento.
+    """
+
+    def __init__(self, storage, buffer_size=CHECKIN_EVENT_BUFFER,
+                 max_sessions=CHECKIN_EVENT_SESSIONS, heartbeat=CHECKIN_STREAM_HEARTBEAT):
+        self.storage = storage
+        self.buffer_size = buffer_size
+        self.max_sessions = max_sessions
+        self.heartbeat = heartbeat
+        # sesión -> {'floor': seq hasta el que el búfer ya no responde, 'events': [(seq, registro)]}
+        self._buffers = OrderedDict()
+        self._evicted_floor = 0
+        self._cursor = None  # sin streams abiertos todavía no se lee nada
+        self._cond = threading.Condition()
+        self._pump_lock = threading.Lock()
+        self._closed = False
+        # (bucle, asyncio.Event) de cada astream abierto
+        self._async_waiters = set()
+
+    def notify(self):
+        """Avisar de registros nuevos (solo lee si alguien está escuchando)"""
+        if self._cursor is not None:
+            self._pump()
+
+    def close(self):
+        """Terminar todos los streams abiertos (al parar el servidor)"""
+        with self._cond:
+            self._closed = True
+            self._wake()
+
+    def _wake(self):
+        # Con self._cond: despertar a los streams de hilos y a los de asyncio
+        self._cond.notify_all()
+        for loop, wakeup in self._async_waiters:
+            try:
+                loop.call_soon_threadsafe(wakeup.set)
+            except RuntimeError:
+                pass  # bucle ya cerrado
+
+    def _pump(self):
+        with self._pump_lock:
+            cursor, has_more = self._cursor or 0, True
+            while has_more:
+                checkins, cursor, has_more = self.storage.checkins_since(cursor, ATTENDANCE_SYNC_PAGE)
+                with self._cond:
+                    for checkin in checkins:
+                        self._buffer(checkin)
+                    self._cursor = cursor
+                    self._wake()
+
+    def _buffer(self, checkin):
+        buffer = self._buffers.get(checkin['session'])
+        if buffer is None:
+            # Lo anterior de una sesión descartada pudo ser de esta: se pide al almacenamiento
+            buffer = self._buffers[checkin['session']] = {'floor': self._evicted_floor, 'events': deque()}
+            if len(self._buffers) > self.max_sessions:
+                _, evicted = self._buffers.popitem(last=False)
+                last_seq = evicted['events'][-1][0] if evicted['events'] else evicted['floor']
+                self._evicted_floor = max(self._evicted_floor, last_seq)
+        else:
+            self._buffers.move_to_end(checkin['session'])
+        events = buffer['events']
+        if len(events) >= self.buffer_size:
+            buffer['floor'] = events.popleft()[0]
+        events.append((checkin['seq'], checkin_record(checkin)))
+
+    def _since(self, session, cursor):
+        # Con self._cond: eventos con seq > cursor, o None si el búfer no llega tan atrás
+        buffer = self._buffers.get(session)
+        if buffer is None:
+            return None if cursor < self._evicted_floor else []
+        if cursor < buffer['floor']:
+            return None
+        return [event for event in buffer['events'] if event[0] > cursor]
+
+    def stream(self, session, cursor=None, max_seconds=CHECKIN_STREAM_MAX_SECONDS):
+        """Generador de (seq, registro) de la sesión; (None, None) en cada latido sin eventos
+
+        Sin cursor empieza por los registros que lleguen a partir de ahora.
+        """
+        if self._cursor is None:
+            self._pump()
+        if cursor is None:
+            cursor = self._cursor
+        deadline = time.monotonic() + max_seconds
+        while not self._closed and time.monotonic() < deadline:
+            with self._cond:
+                events = self._since(session, cursor)
+                if events == []:
+                    self._cond.wait_for(lambda: self._closed or self._since(session, cursor) != [],
+                                        self.heartbeat)
+                    events = self._since(session, cursor)
+            if events is None:
+                checkins, latest, _ = self.storage.checkins_since(cursor, ATTENDANCE_SYNC_PAGE, session)
+                events = [(checkin['seq'], checkin_record(checkin)) for checkin in checkins]
+                if not events:
+                    # Nada de la sesión hasta 'latest': el búfer ya cubre el resto
+                    cursor = max(cursor, latest)
+                    continue
+            if events:
+                for seq, record in events:
+                    yield seq, record
+                cursor = events[-1][0]
+            elif not self._closed:
+                self._pump()  # registros recibidos por otros procesos (SQLite)
+                yield None, None
+
+    async def astream(self, session, cursor=None, max_seconds=CHECKIN_STREAM_MAX_SECONDS):
+        """Como stream, pero para un bucle asyncio (servidor ASGI)
+
+        La espera es un asyncio.Event que despierta _wake: una conexión abierta
+        no ocupa ningún hilo. Solo las lecturas del almacenamiento pasan por el
+        pool de hilos del bucle.
+        """
+        wakeup = asyncio.Event()
+        waiter = (asyncio.get_running_loop(), wakeup)
+        if self._cursor is None:
+            await asyncio.to_thread(self._pump)
+        if cursor is None:
+            cursor = self._cursor
+        deadline = time.monotonic() + max_seconds
+        with self._cond:
+            self._async_waiters.add(waiter)
+        try:
+            while not self._closed and time.monotonic() < deadline:
+                with self._cond:
+                    wakeup.clear()
+                    events = self._since(session, cursor)
+                if events == []:
+                    try:
+                        await asyncio.wait_for(wakeup.wait(), self.heartbeat)
+                    except asyncio.TimeoutError:
+                        if not self._closed:
+                            await asyncio.to_thread(self._pump)  # registros de otros procesos
+                            yield None, None
+                    continue
+                if events is None:
+                    checkins, latest, _ = await asyncio.to_thread(
+                        self.storage.checkins_since, cursor, ATTENDANCE_SYNC_PAGE, session)
+                    events = [(checkin['seq'], checkin_record(checkin)) for checkin in checkins]
+                    if not events:
+                        cursor = max(cursor, latest)
+                        continue
+                for seq, record in events:
+                    yield seq, record
+                cursor = events[-1][0]
+        finally:
+            with self._cond:
+                self._async_waiters.discard(waiter)
+
+def bearer_token(authorization):
+    """Token de una cabecera 'Authorization: Bearer <token>' (o None)"""
+    scheme, _, token = (authorization or '').partition(' ')
+    return token.strip() if scheme.lower() == 'bearer' and token.strip() else None
+
+def admin_authorized(provided_key):
+    """Comprobar la clave de administración (sin ADMIN_API_KEY no se permite a nadie)"""
+    admin_key = os.environ.get('ADMIN_API_KEY')
+    if not admin_key or not provided_key:
+        return False
+    return hmac.compare_digest(provided_key.encode('utf-8'), admin_key.encode('utf-8'))
+
+def require_admin(view):
+    """Exigir la cabecera X-Admin-Key con el valor de la variable ADMIN_API_KEY"""
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        if not admin_authorized(request.headers.get('X-Admin-Key', '')):
+            return jsonify({'error': 'Acceso restringido al profesorado'}), 403
+        return view(*args, **kwargs)
+    return wrapper
+
+SUMMARY_SORT_FIELDS = ('name', 'attendance_rate', 'materials_completion',
+                       'projects_completion', 'quiz_accuracy', 'last_active')
+SUMMARY_MAX_PER_PAGE = 500
+BATCH_MAX_ITEMS = 1000
+ATTENDANCE_SYNC_PAGE = 500
+# Campos de un registro de asistencia que se guardan y se devuelven (longitud máxima)
+CHECKIN_FIELDS = {'record_id': 64, 'session': 100, 'studentId': 32, 'studentName': 100, 'timestamp': 40}
+CHECKIN_REQUIRED = ('session', 'studentId', 'studentName')
 
-# Crear aplicación Flask para el API
-app = Flask(__name__)
-CORS(app)
 user_system = UserSystem()
+attendance_tokens = AttendanceTokens(TokenSigner(load_secret_key(), 'attendance'), user_system.storage)
+session_tokens = SessionTokens(TokenSigner(load_secret_key(), 'session'))
+checkin_feed = CheckinFeed(user_system.storage)
 
-@app.route('/api/register', methods=['POST'])
-def register_user():
-    data = request.json
+# Manejadores del API independientes del servidor: reciben los datos de la
+# petición ya decodificados y devuelven (cuerpo, código). Los comparten la app
+# Flask de abajo y la variante ASGI de user_system_asgi.py.
+
+def session_user(authorization):
+    """user_id de la sesión de la cabecera Authorization; None sin cabecera, False si no vale"""
+    token = bearer_token(authorization)
+    if token is None:
+        return None
+    return session_tokens.validate(token) or False
+
+def api_as_user(handler, data, user, is_admin):
+    """Ejecutar un manejador de un solo estudiante con el user_id de su sesión
+
+    Con sesión, el user_id lo fija el token (uno distinto en la petición se
+    rechaza). Sin sesión solo se acepta el user_id de la petición si is_admin
+    (X-Admin-Key correcta; sin ADMIN_API_KEY nunca).
+    """
+    if user is False:
+        return {'error': 'Sesión inválida o caducada'}, 401
+    if user:
+        if data.get('user_id') not in (None, '', user):
+            return {'error': 'No puedes modificar los datos de otro estudiante'}, 403
+        return handler(dict(data, user_id=user))
+    if not is_admin:
+        return {'error': 'Inicia sesión para continuar'}, 401
+    return handler(data)
+
+def api_health():
+    """Estado del proceso y del almacenamiento, para el supervisor o el balanceador"""
+    try:
+        user_system.storage.get_user('')
+    except Exception as error:
+        return {'status': 'error', 'error': str(error)}, 503
+    return {'status': 'ok', 'storage': type(user_system.storage).__name__, 'pid': os.getpid()}, 200
+
+def api_register(data):
     name = data.get('name')
     email = data.get('email')
     student_id = data.get('student_id')
 
     if not name or not email:
-        return jsonify({'error': 'Nombre y email son requeridos'}), 400
+        return {'error': 'Nombre y email son requeridos'}, 400
 
     user = user_system.create_user(name, email, student_id)
-    return jsonify({
+    if user is None:
+        return {'error': 'Ya existe un usuario con ese email'}, 409
+    return {
         'success': True,
         'user': {
             'id': user['id'],
@@ -264,125 +799,599 @@ def register_user():
             'email': user['email'],
             'password': user['password']
         }
-    })
+    }, 200
 
-@app.route('/api/login', methods=['POST'])
-def login_user():
-    data = request.json
+def api_login(data):
     user_id = data.get('user_id')
     password = data.get('password')
 
     if not user_id or not password:
-        return jsonify({'error': 'ID de usuario y contraseña son requeridos'}), 400
+        return {'error': 'ID de usuario y contraseña son requeridos'}, 400
 
     user = user_system.authenticate_user(user_id, password)
     if user:
-        return jsonify({
+        token, expires = session_tokens.issue(user['id'])
+        return {
             'success': True,
             'user': {
                 'id': user['id'],
                 'name': user['name'],
                 'email': user['email']
-            }
-        })
+            },
+            'token': token,
+            'expires_at': expires
+        }, 200
     else:
-        return jsonify({'error': 'Credenciales inválidas'}), 401
+        return {'error': 'Credenciales inválidas'}, 401
+
+def public_user(user):
+    """Datos de un usuario que se pueden mostrar (sin contraseña)"""
+    return {field: user.get(field) for field in ('id', 'name', 'email', 'student_id',
+                                                 'course_level', 'active', 'created_at')}
+
+def api_user_by_email(args):
+    """Buscar un usuario por email"""
+    email = args.get('email')
+    if not email:
+        return {'error': 'El email es requerido'}, 400
+    user = user_system.get_user_by_email(email)
+    if user is None:
+        return {'error': 'Usuario no encontrado'}, 404
+    return {'success': True, 'user': public_user(user)}, 200
+
+def api_user_by_student_id(args):
+    """Buscar un usuario por código de estudiante"""
+    student_id = args.get('student_id')
+    if not student_id:
+        return {'error': 'El código de estudiante es requerido'}, 400
+    user = user_system.get_user_by_student_id(student_id)
+    if user is None:
+        return {'error': 'Usuario no encontrado'}, 404
+    return {'success': True, 'user': public_user(user)}, 200
+
+def api_logout(authorization):
+    """Revocar el token de sesión de la cabecera Authorization"""
+    token = bearer_token(authorization)
+    if token is None or not session_tokens.revoke(token):
+        return {'error': 'Sesión inválida o caducada'}, 401
+    return {'success': True}, 200
+
+def progress_etag(version):
+    return f'W/"v{version}"'
+
+def progress_headers(version):
+    # no-cache: el navegador guarda la respuesta pero la revalida siempre con If-None-Match
+    return {'ETag': progress_etag(version), 'Cache-Control': 'private, no-cache'}
+
+def etag_matches(if_none_match, etag):
+    """Comparación débil de If-None-Match (admite listas y '*')"""
+    if not if_none_match:
+        return False
+    candidates = {tag.strip().removeprefix('W/') for tag in if_none_match.split(',')}
+    return '*' in candidates or etag.removeprefix('W/') in candidates
+
+def project_progress(progress, fields):
+    """Quedarse solo con los campos pedidos ('seccion' o 'seccion.campo', separados por comas)
+
+    user_id y version se incluyen siempre. Devuelve None si algún campo no existe.
+    """
+    projected = {'user_id': progress['user_id'], 'version': progress['version']}
+    for field in filter(None, (part.strip() for part in fields.split(','))):
+        section, _, key = field.partition('.')
+        if section not in progress:
+            return None
+        if not key:
+            projected[section] = progress[section]
+        elif isinstance(progress[section], dict) and key in progress[section]:
+            target = projected.setdefault(section, {})
+            if target is not progress[section]:
+                target[key] = progress[section][key]
+        else:
+            return None
+    return projected
+
+def api_progress(data):
+    """Progreso de un usuario con ETag (versión del progreso) y proyección opcional
+
+    data admite 'fields' (proyección) e 'if_none_match' (cabecera If-None-Match):
+    si la versión no ha cambiado se responde 304 sin leer ni serializar el documento.
+    """
+    user_id = data.get('user_id')
+    if_none_match = data.get('if_none_match')
+    if if_none_match:
+        version = user_system.get_progress_version(user_id)
+        if version is not None and etag_matches(if_none_match, progress_etag(version)):
+            return None, 304, progress_headers(version)
 
-@app.route('/api/progress/<user_id>', methods=['GET'])
-def get_progress(user_id):
     progress = user_system.get_user_progress(user_id)
-    if progress:
-        return jsonify({'success': True, 'progress': progress})
-    else:
-        return jsonify({'error': 'Usuario no encontrado'}), 404
+    if not progress:
+        return {'error': 'Usuario no encontrado'}, 404
+    if data.get('fields'):
+        progress = project_progress(progress, data['fields'])
+        if progress is None:
+            return {'error': 'Campo de progreso desconocido'}, 400
+    return {'success': True, 'progress': progress}, 200, progress_headers(progress['version'])
 
-@app.route('/api/attendance', methods=['POST'])
-def record_attendance():
-    data = request.json
+def api_attendance(data, is_admin=False):
+    """Registrar la asistencia de un estudiante
+
+    Los estudiantes necesitan el token del QR de la clase y la fecha es siempre
+    la del servidor. Solo la administración (is_admin) puede registrar sin token
+    y con una class_date de la petición.
+    """
     user_id = data.get('user_id')
     class_date = data.get('class_date')
+    token = data.get('token')
 
     if not user_id:
-        return jsonify({'error': 'ID de usuario requerido'}), 400
+        return {'error': 'ID de usuario requerido'}, 400
+
+    if token:
+        # Asistencia con el QR de la clase: el token fija la fecha de hoy
+        user = user_system.get_user_by_id(user_id)
+        if not user:
+            return {'error': 'Usuario no encontrado'}, 404
+        session = attendance_tokens.redeem(token, checkin_key(user.get('student_id'), user_id))
+        if session is None:
+            return {'error': 'Token inválido o caducado'}, 403
+        if session is False:
+            return {'error': 'Ya has registrado tu asistencia en esta sesión'}, 409
+        class_date = date.today().isoformat()
+    elif not is_admin:
+        return {'error': 'Escanea el QR de la clase para registrar tu asistencia'}, 403
 
     success = user_system.record_attendance(user_id, class_date)
     if success:
-        return jsonify({'success': True})
+        return {'success': True}, 200
     else:
-        return jsonify({'error': 'No se pudo registrar la asistencia'}), 400
+        return {'error': 'No se pudo registrar la asistencia'}, 400
 
-@app.route('/api/materials', methods=['POST'])
-def update_materials():
-    data = request.json
+def api_mint_attendance_token(data):
+    """Emitir un token firmado y de corta duración para el QR de una sesión"""
+    session = data.get('session')
+    if not session:
+        return {'error': 'La sesión es requerida'}, 400
+
+    try:
+        ttl = min(max(int(data.get('ttl') or ATTENDANCE_TOKEN_TTL), 1), ATTENDANCE_TOKEN_MAX_TTL)
+    except (TypeError, ValueError):
+        return {'error': 'Duración inválida'}, 400
+    token, expires = attendance_tokens.mint(session, ttl)
+    return {'success': True, 'token': token, 'session': session, 'expires_at': expires}, 200
+
+def api_verify_attendance_token(data):
+    """Comprobar un token sin canjearlo (al abrir la página del QR)"""
+    validated = attendance_tokens.validate(data.get('token'))
+    if validated is None:
+        return {'error': 'Token inválido o caducado'}, 403
+    session, expires = validated
+    return {'success': True, 'session': session, 'expires_at': expires}, 200
+
+def client_time(value):
+    """Hora epoch de un timestamp ISO del cliente (p. ej. de toISOString), o None si no vale"""
+    try:
+        return datetime.fromisoformat(value.replace('Z', '+00:00')).timestamp()
+    except (AttributeError, ValueError, OverflowError):
+        return None
+
+def api_checkin(data, offline=False):
+    """Canjear el token del QR de las páginas attendance y guardar el registro de asistencia
+
+    El registro lo escribe el servidor con la sesión del token y su propia hora,
+    en la misma operación que el canje; el cliente solo aporta nombre y código.
+    Con offline (check-ins que se suben desde la cola de las páginas) el
+    timestamp del cliente es la hora del registro y el token se comprueba para
+    esa hora: vale aunque haya caducado mientras no había conexión.
+
+    La ruta es pública (las páginas de asistencia no inician sesión): el código
+    de estudiante no se comprueba contra ninguna cuenta, así que quien tenga el
+    QR puede registrar a otro estudiante. Cada código solo se registra una vez
+    por sesión, y para asistencia ligada a la cuenta está /api/attendance.
+    """
+    token = data.get('token')
+    if not token or not data.get('student_id'):
+        return {'error': 'Token y código de estudiante son requeridos'}, 400
+    scanned_at = None
+    if offline and data.get('timestamp') is not None:
+        scanned_at = client_time(data['timestamp'])
+        if scanned_at is None:
+            return {'error': 'Hora del registro inválida'}, 400
+    validated = attendance_tokens.validate(token, scanned_at)
+    if validated is None:
+        return {'error': 'Token inválido o caducado'}, 403
+
+    moment = datetime.now() if scanned_at is None else datetime.fromtimestamp(scanned_at)
+    record = clean_checkin({'record_id': secrets.token_hex(8), 'session': validated[0],
+                            'studentId': str(data['student_id']),
+                            'studentName': data.get('student_name'),
+                            'timestamp': moment.isoformat()})
+    if record is None:
+        return {'error': 'Nombre o código de estudiante inválidos'}, 400
+
+    session = attendance_tokens.redeem(token, checkin_key(record['studentId']), record, scanned_at)
+    if session is None:
+        return {'error': 'Token inválido o caducado'}, 403
+    if session is False:
+        return {'error': 'Ya has registrado tu asistencia en esta sesión'}, 409
+    checkin_feed.notify()
+    return {'success': True, 'session': session, 'record': record}, 200
+
+def api_attendance_batch(data):
+    """Registrar la asistencia de toda una clase en una sola petición"""
+    records = data.get('records')
+
+    if not isinstance(records, list) or not records:
+        return {'error': 'Se requiere una lista de registros'}, 400
+    if len(records) > BATCH_MAX_ITEMS:
+        return {'error': f'Máximo {BATCH_MAX_ITEMS} registros por petición'}, 400
+    if not all(isinstance(record, dict) for record in records):
+        return {'error': 'Cada registro debe incluir user_id'}, 400
+
+    results = user_system.record_attendance_batch(records, data.get('class_date'))
+    return {
+        'success': True,
+        'recorded': sum(1 for result in results if result['success']),
+        'results': results
+    }, 200
+
+def api_attendance_sync(args):
+    """Sincronización incremental: registros del servidor posteriores al cursor"""
+    try:
+        cursor = int(args.get('cursor', 0))
+    except (TypeError, ValueError):
+        return {'error': 'Cursor inválido'}, 400
+    result = user_system.checkins_since(cursor, args.get('session'), ATTENDANCE_SYNC_PAGE)
+    return {'success': True, **result}, 200
+
+def api_attendance_upload(data):
+    """Subir los check-ins que las páginas guardaron sin conexión
+
+    Cada uno lleva el token de su QR y la hora (timestamp) a la que se guardó, y
+    se canjea como en /api/attendance/checkin (firma, un solo uso por
+    estudiante), con la caducidad comprobada para esa hora. Devuelve un
+    resultado por registro, en el mismo orden, con el código que habría tenido
+    por separado.
+    """
+    records = data.get('records')
+
+    if not isinstance(records, list) or not records:
+        return {'error': 'Se requiere una lista de registros'}, 400
+    if len(records) > BATCH_MAX_ITEMS:
+        return {'error': f'Máximo {BATCH_MAX_ITEMS} registros por petición'}, 400
+
+    results = []
+    for record in records:
+        if not isinstance(record, dict):
+            body, status = {'error': 'Registro inválido'}, 400
+        else:
+            body, status = api_checkin(record, offline=True)
+        results.append({'status': status, **body})
+    return {
+        'success': True,
+        'recorded': sum(1 for result in results if result['status'] == 200),
+        'results': results
+    }, 200
+
+# Cabeceras de la respuesta del stream de asistencia (Server-Sent Events)
+STREAM_HEADERS = {'Content-Type': 'text/event-stream', 'Cache-Control': 'no-cache',
+                  'X-Accel-Buffering': 'no'}
+
+def stream_args(args):
+    """(sesión, cursor) de una petición al stream; ValueError con el mensaje si no valen"""
+    session = args.get('session')
+    if not session:
+        raise ValueError('La sesión es requerida')
+    cursor = args.get('last_event_id') or args.get('cursor')
+    try:
+        return session, int(cursor) if cursor not in (None, '') else None
+    except (TypeError, ValueError):
+        raise ValueError('Cursor inválido') from None
+
+def stream_event(seq, record):
+    """Un evento del stream de asistencia; un comentario de latido si seq es None"""
+    if seq is None:
+        return ': keepalive\n\n'
+    return f'id: {seq}\nevent: checkin\ndata: {json.dumps(record, ensure_ascii=False)}\n\n'
+
+def api_attendance_stream(args):
+    """Server-Sent Events con los registros de asistencia de una sesión según llegan
+
+    Cada evento lleva como id el seq del registro, así que al reconectar el
+    navegador envía Last-Event-ID y se reanuda sin huecos. También se acepta
+    cursor= (el de la sincronización) para empezar justo después de ella.
+    """
+    try:
+        session, cursor = stream_args(args)
+    except ValueError as error:
+        return {'error': str(error)}, 400
+
+    def events():
+        yield 'retry: 3000\n\n'
+        for seq, record in checkin_feed.stream(session, cursor):
+            yield stream_event(seq, record)
+
+    return events(), 200, STREAM_HEADERS
+
+def api_materials(data):
     user_id = data.get('user_id')
     material_type = data.get('material_type')
     item_id = data.get('item_id')
 
     if not all([user_id, material_type, item_id]):
-        return jsonify({'error': 'Todos los campos son requeridos'}), 400
+        return {'error': 'Todos los campos son requeridos'}, 400
 
     success = user_system.update_material_progress(user_id, material_type, item_id)
     if success:
-        return jsonify({'success': True})
+        return {'success': True}, 200
     else:
-        return jsonify({'error': 'No se pudo actualizar el progreso'}), 400
+        return {'error': 'No se pudo actualizar el progreso'}, 400
 
-@app.route('/api/quiz', methods=['POST'])
-def record_quiz():
-    data = request.json
+def api_materials_batch(data):
+    """Registrar todas las páginas vistas de una unidad en una sola petición"""
+    user_id = data.get('user_id')
+    items = data.get('items')
+
+    if not user_id or not isinstance(items, list) or not items:
+        return {'error': 'ID de usuario y lista de materiales son requeridos'}, 400
+    if len(items) > BATCH_MAX_ITEMS:
+        return {'error': f'Máximo {BATCH_MAX_ITEMS} materiales por petición'}, 400
+    if not all(isinstance(item, dict) for item in items):
+        return {'error': 'Cada material debe incluir item_id'}, 400
+
+    results = user_system.update_material_progress_batch(user_id, items, data.get('material_type'))
+    return {
+        'success': True,
+        'updated': sum(1 for result in results if result['success']),
+        'results': results
+    }, 200
+
+def api_quiz(data):
     user_id = data.get('user_id')
     correct_answers = data.get('correct_answers')
     total_questions = data.get('total_questions')
     quiz_id = data.get('quiz_id')
 
     if not all([user_id, correct_answers is not None, total_questions]):
-        return jsonify({'error': 'Todos los campos son requeridos'}), 400
+        return {'error': 'Todos los campos son requeridos'}, 400
 
     success = user_system.record_quiz_score(user_id, correct_answers, total_questions, quiz_id)
     if success:
-        return jsonify({'success': True})
+        return {'success': True}, 200
     else:
-        return jsonify({'error': 'No se pudo registrar el quiz'}), 400
+        return {'error': 'No se pudo registrar el quiz'}, 400
 
-@app.route('/api/projects', methods=['POST'])
-def complete_project():
-    data = request.json
+def api_projects(data):
     user_id = data.get('user_id')
     project_id = data.get('project_id')
 
     if not user_id or not project_id:
-        return jsonify({'error': 'ID de usuario y proyecto son requeridos'}), 400
+        return {'error': 'ID de usuario y proyecto son requeridos'}, 400
 
     success = user_system.complete_project(user_id, project_id)
     if success:
-        return jsonify({'success': True})
+        return {'success': True}, 200
+    else:
+        return {'error': 'No se pudo completar el proyecto'}, 400
+
+def api_admin_summary(args):
+    """Resumen paginado con filtros (asistencia, precisión en quizzes, última actividad) y orden
+
+    Con format=ndjson el cuerpo es un generador de líneas en lugar de un dict.
+    """
+    try:
+        page = max(int(args.get('page', 1)), 1)
+        per_page = min(max(int(args.get('per_page', 50)), 1), SUMMARY_MAX_PER_PAGE)
+        attendance_below = float(args['attendance_below']) if 'attendance_below' in args else None
+        min_quiz_accuracy = float(args['min_quiz_accuracy']) if 'min_quiz_accuracy' in args else None
+        max_quiz_accuracy = float(args['max_quiz_accuracy']) if 'max_quiz_accuracy' in args else None
+    except ValueError:
+        return {'error': 'Parámetros numéricos inválidos'}, 400
+    active_since = args.get('active_since')
+    active_before = args.get('active_before')
+    sort = args.get('sort')
+    if sort and sort not in SUMMARY_SORT_FIELDS:
+        return {'error': f"Orden no válido. Usa: {', '.join(SUMMARY_SORT_FIELDS)}"}, 400
+
+    def matches(row):
+        if attendance_below is not None and row['attendance_rate'] >= attendance_below:
+            return False
+        if min_quiz_accuracy is not None and row['quiz_accuracy'] < min_quiz_accuracy:
+            return False
+        if max_quiz_accuracy is not None and row['quiz_accuracy'] > max_quiz_accuracy:
+            return False
+        if active_since and row['last_active'] < active_since:
+            return False
+        if active_before and row['last_active'] >= active_before:
+            return False
+        return True
+
+    rows = (row for row in user_system.iter_users_summary() if matches(row))
+
+    if args.get('format') == 'ndjson':
+        # Flujo completo, una fila por línea, sin cargar el resumen en memoria
+        return (json.dumps(row, ensure_ascii=False) + '\n' for row in rows), 200
+
+    start = (page - 1) * per_page
+    if sort:
+        rows = sorted(rows, key=lambda row: row[sort], reverse=args.get('order') == 'desc')
+        total = len(rows)
+        page_rows = rows[start:start + per_page]
     else:
-        return jsonify({'error': 'No se pudo completar el proyecto'}), 400
+        # Sin orden: se recorre el flujo una vez y solo se guarda la página pedida
+        page_rows = []
+        total = 0
+        for row in rows:
+            if start <= total < start + per_page:
+                page_rows.append(row)
+            total += 1
+
+    return {
+        'success': True,
+        'page': page,
+        'per_page': per_page,
+        'total': total,
+        'users': page_rows
+    }, 200
+
+# Crear aplicación Flask para el API
+app = Flask(__name__)
+CORS(app)
+
+def respond(result):
+    """Convertir el (cuerpo, código[, cabeceras]) de un manejador en una respuesta Flask"""
+    body, status, *extra = result
+    headers = extra[0] if extra else {}
+    if body is None:
+        return Response(status=status, headers=headers)
+    if isinstance(body, dict):
+        return jsonify(body), status, headers
+    response = Response(body, status=status, headers={'Content-Type': 'application/x-ndjson', **headers})
+    # El generador se recorre después del teardown: su conexión se suelta al cerrar la respuesta
+    response.call_on_close(user_system.storage.release_connection)
+    return response
+
+@app.teardown_appcontext
+def release_storage(error):
+    """Soltar la conexión del hilo de la petición (un hilo nuevo por petición con threaded=True)"""
+    user_system.storage.release_connection()
+
+@app.before_request
+def load_session():
+    """Validar el token de sesión una vez por petición (sin consultar la base de datos)"""
+    g.session_user = session_user(request.headers.get('Authorization'))
+
+def respond_as_user(handler, data):
+    is_admin = admin_authorized(request.headers.get('X-Admin-Key', ''))
+    return respond(api_as_user(handler, data, g.session_user, is_admin))
+
+@app.route('/api/health', methods=['GET'])
+def health():
+    return respond(api_health())
+
+@app.route('/api/register', methods=['POST'])
+def register_user():
+    return respond(api_register(request.json or {}))
+
+@app.route('/api/login', methods=['POST'])
+def login_user():
+    return respond(api_login(request.json or {}))
+
+@app.route('/api/logout', methods=['POST'])
+def logout_user():
+    return respond(api_logout(request.headers.get('Authorization')))
+
+@app.route('/api/users/by-email', methods=['GET'])
+@require_admin
+def user_by_email():
+    return respond(api_user_by_email(request.args))
+
+@app.route('/api/users/by-student-id', methods=['GET'])
+@require_admin
+def user_by_student_id():
+    return respond(api_user_by_student_id(request.args))
+
+@app.route('/api/progress/<user_id>', methods=['GET'])
+def get_progress(user_id):
+    return respond_as_user(api_progress, {'user_id': user_id,
+                                          'fields': request.args.get('fields'),
+                                          'if_none_match': request.headers.get('If-None-Match')})
+
+@app.route('/api/attendance', methods=['POST'])
+def record_attendance():
+    is_admin = admin_authorized(request.headers.get('X-Admin-Key', ''))
+    return respond_as_user(partial(api_attendance, is_admin=is_admin), request.json or {})
+
+@app.route('/api/attendance/tokens', methods=['POST'])
+@require_admin
+def mint_attendance_token():
+    return respond(api_mint_attendance_token(request.json or {}))
+
+@app.route('/api/attendance/tokens/verify', methods=['POST'])
+def verify_attendance_token():
+    return respond(api_verify_attendance_token(request.json or {}))
+
+@app.route('/api/attendance/checkin', methods=['POST'])
+def checkin_with_token():
+    return respond(api_checkin(request.json or {}))
+
+@app.route('/api/attendance/batch', methods=['POST'])
+@require_admin
+def record_attendance_batch():
+    return respond(api_attendance_batch(request.json or {}))
+
+@app.route('/api/attendance/sync', methods=['GET'])
+@require_admin
+def sync_attendance():
+    return respond(api_attendance_sync(request.args))
+
+@app.route('/api/attendance/sync', methods=['POST'])
+def upload_attendance():
+    return respond(api_attendance_upload(request.json or {}))
+
+@app.route('/api/attendance/stream', methods=['GET'])
+@require_admin
+def attendance_stream():
+    return respond(api_attendance_stream({'session': request.args.get('session'),
+                                          'cursor': request.args.get('cursor'),
+                                          'last_event_id': request.headers.get('Last-Event-ID')}))
+
+@app.route('/api/materials', methods=['POST'])
+def update_materials():
+    return respond_as_user(api_materials, request.json or {})
+
+@app.route('/api/materials/batch', methods=['POST'])
+def update_materials_batch():
+    return respond_as_user(api_materials_batch, request.json or {})
+
+@app.route('/api/quiz', methods=['POST'])
+def record_quiz():
+    return respond_as_user(api_quiz, request.json or {})
+
+@app.route('/api/projects', methods=['POST'])
+def complete_project():
+    return respond_as_user(api_projects, request.json or {})
+
+@app.route('/api/admin/summary', methods=['GET'])
+@require_admin
+def admin_summary():
+    return respond(api_admin_summary(request.args))
 
 # Crear archivos de bases de datos si no existen
 if __name__ == "__main__":
     # Inicializar bases de datos si no existen
-    if not os.path.exists(USERS_DB_FILE):
+    if user_system.storage.count_users() == 0:
         # Crear un usuario de ejemplo para pruebas
         example_user = user_system.create_user(
             name="Estudiante Ejemplo",
             email="estudiante@ejemplo.com",
             student_id="2025001"
         )
-        print(f"✅ Usuario de ejemplo creado:")
+        print("✅ Usuario de ejemplo creado:")
         print(f"   ID: {example_user['id']}")
         print(f"   Contraseña: {example_user['password']}")
-        print(f"   Guarda estos datos para probar el sistema")
+        print("   Guarda estos datos para probar el sistema")
 
     print("\n🚀 Sistema de usuarios iniciado en http://localhost:5000")
     print("📊 API endpoints disponibles:")
+    print("   GET  /api/health - Estado del servidor")
     print("   POST /api/register - Registrar nuevo usuario")
-    print("   POST /api/login - Iniciar sesión")
+    print("   POST /api/login - Iniciar sesión (devuelve un token de sesión)")
+    print("   POST /api/logout - Cerrar sesión (revoca el token)")
+    print("   GET  /api/users/by-email?email= - Buscar usuario por email")
+    print("   GET  /api/users/by-student-id?student_id= - Buscar usuario por código")
     print("   GET  /api/progress/<user_id> - Obtener progreso")
     print("   POST /api/attendance - Registrar asistencia")
+    print("   POST /api/attendance/batch - Registrar asistencia de toda la clase")
+    print("   GET  /api/attendance/sync?cursor= - Registros de asistencia desde el cursor")
+    print("   POST /api/attendance/sync - Subir los check-ins guardados sin conexión")
+    print("   GET  /api/attendance/stream - Asistencia en vivo de una sesión (Server-Sent Events)")
+    print("   POST /api/attendance/tokens - Emitir token firmado para el QR de una sesión")
+    print("   POST /api/attendance/checkin - Canjear el token del QR y registrar la asistencia")
     print("   POST /api/materials - Actualizar materiales")
+    print("   POST /api/materials/batch - Actualizar varios materiales a la vez")
     print("   POST /api/quiz - Registrar quiz")
     print("   POST /api/projects - Completar proyecto")
+    print("   GET  /api/admin/summary - Resumen paginado de estudiantes")
 
     # Iniciar servidor (solo para desarrollo)
     # app.run(debug=True, port=5000)
\ No newline at end of file
@@ -0,0 +1,276 @@
+#!/usr/bin/env python3
+"""
+Variante ASGI del API de user_system.py para los picos de asistencia
+
+Expone las mismas rutas que la app Flask con manejadores async. La lógica es la
+de los manejadores compartidos de user_system.py, que se ejecutan en el pool de
+hilos del bucle (asyncio.to_thread): la espera del diario o de SQLite no bloquea
+al resto de peticiones. El stream de asistencia en vivo espera en el propio
+bucle (CheckinFeed.astream), sin ocupar un hilo por conexión abierta. Se
+inicia con start_server.py --asgi o con:
+
+    uvicorn user_system_asgi:app --workers 4
+
+Con varios workers hace falta USER_STORAGE=sqlite (start_server.py lo fija).
+"""
+
+import asyncio
+import itertools
+import json
+from functools import partial
+from urllib.parse import parse_qsl
+
+import user_system as api
+
+# Límite del cuerpo de la petición (un lote de BATCH_MAX_ITEMS registros cabe de sobra)
+MAX_BODY_BYTES = 2 * 1024 * 1024
+# Filas del resumen NDJSON que se preparan por cada salto al pool de hilos
+STREAM_CHUNK_ROWS = 200
+
+
+def _health(args):
+    return api.api_health()
+
+# Acceso de cada ruta: libre, con sesión de estudiante (o administración) o solo administración
+PUBLIC, USER, ADMIN = 'public', 'user', 'admin'
+
+# ruta -> (manejador, acceso)
+POST_ROUTES = {
+    '/api/register': (api.api_register, PUBLIC),
+    '/api/login': (api.api_login, PUBLIC),
+    '/api/attendance': (api.api_attendance, USER),
+    '/api/attendance/tokens': (api.api_mint_attendance_token, ADMIN),
+    '/api/attendance/tokens/verify': (api.api_verify_attendance_token, PUBLIC),
+    '/api/attendance/checkin': (api.api_checkin, PUBLIC),
+    '/api/attendance/batch': (api.api_attendance_batch, ADMIN),
+    '/api/attendance/sync': (api.api_attendance_upload, PUBLIC),
+    '/api/materials': (api.api_materials, USER),
+    '/api/materials/batch': (api.api_materials_batch, USER),
+    '/api/quiz': (api.api_quiz, USER),
+    '/api/projects': (api.api_projects, USER),
+}
+GET_ROUTES = {
+    '/api/health': (_health, PUBLIC),
+    '/api/users/by-email': (api.api_user_by_email, ADMIN),
+    '/api/users/by-student-id': (api.api_user_by_student_id, ADMIN),
+    '/api/attendance/sync': (api.api_attendance_sync, ADMIN),
+    '/api/admin/summary': (api.api_admin_summary, ADMIN),
+}
+LOGOUT_PATH = '/api/logout'
+STREAM_PATH = '/api/attendance/stream'
+PROGRESS_PREFIX = '/api/progress/'
+
+
+def _headers(scope):
+    return {name.decode('latin-1').lower(): value.decode('latin-1') for name, value in scope['headers']}
+
+
+def _query(scope):
+    # Como request.args.get de Flask: si un parámetro se repite, vale el primero
+    args = {}
+    for key, value in parse_qsl(scope.get('query_string', b'').decode('latin-1')):
+        args.setdefault(key, value)
+    return args
+
+
+async def _read_body(receive):
+    body = bytearray()
+    while True:
+        message = await receive()
+        if message['type'] == 'http.disconnect':
+            return None
+        body += message.get('body', b'')
+        if len(body) > MAX_BODY_BYTES:
+            return None
+        if not message.get('more_body'):
+            return bytes(body)
+
+
+async def _send(send, status, body, content_type='application/json', extra_headers=()):
+    await send({
+        'type': 'http.response.start',
+        'status': status,
+        'headers': [(b'content-type', content_type.encode()),
+                    (b'content-length', str(len(body)).encode()),
+                    (b'access-control-allow-origin', b'*'),
+                    *extra_headers],
+    })
+    await send({'type': 'http.response.body', 'body': body})
+
+
+async def _send_json(send, payload, status, extra_headers=()):
+    await _send(send, status, json.dumps(payload, ensure_ascii=False).encode('utf-8'),
+                extra_headers=extra_headers)
+
+
+async def _send_not_modified(send, extra_headers):
+    # Un 304 no lleva cuerpo ni Content-Length
+    await send({
+        'type': 'http.response.start',
+        'status': 304,
+        'headers': [(b'access-control-allow-origin', b'*'), *extra_headers],
+    })
+    await send({'type': 'http.response.body', 'body': b''})
+
+
+async def _wait_disconnect(receive):
+    while (await receive())['type'] != 'http.disconnect':
+        pass
+
+
+async def _send_stream(send, receive, lines, status, extra_headers=()):
+    """Enviar un generador de filas NDJSON por trozos, leyéndolo en el pool de hilos
+
+    Las filas se agrupan de STREAM_CHUNK_ROWS en STREAM_CHUNK_ROWS. Si el
+    cliente se desconecta se deja de leer el generador.
+    """
+    headers = dict(extra_headers)
+    headers.setdefault(b'content-type', b'application/x-ndjson')
+
+    def next_chunk():
+        return ''.join(itertools.islice(lines, STREAM_CHUNK_ROWS)).encode('utf-8')
+
+    await send({
+        'type': 'http.response.start',
+        'status': status,
+        'headers': [*headers.items(), (b'access-control-allow-origin', b'*')],
+    })
+    disconnected = asyncio.ensure_future(_wait_disconnect(receive))
+    try:
+        while not disconnected.done():
+            chunk = await asyncio.to_thread(next_chunk)
+            if not chunk:
+                break
+            await send({'type': 'http.response.body', 'body': chunk, 'more_body': True})
+        await send({'type': 'http.response.body', 'body': b''})
+    finally:
+        disconnected.cancel()
+        await asyncio.to_thread(lines.close)
+
+
+async def _send_events(send, receive, args):
+    """Stream de asistencia en vivo: espera en el bucle (CheckinFeed.astream), sin ocupar hilos"""
+    try:
+        session, cursor = api.stream_args(args)
+    except ValueError as error:
+        await _send_json(send, {'error': str(error)}, 400)
+        return
+
+    async def forward():
+        await send({'type': 'http.response.body', 'body': b'retry: 3000\n\n', 'more_body': True})
+        async for seq, record in api.checkin_feed.astream(session, cursor):
+            await send({'type': 'http.response.body', 'more_body': True,
+                        'body': api.stream_event(seq, record).encode('utf-8')})
+        await send({'type': 'http.response.body', 'body': b''})
+
+    await send({
+        'type': 'http.response.start',
+        'status': 200,
+        'headers': [(name.lower().encode('latin-1'), value.encode('latin-1'))
+                    for name, value in api.STREAM_HEADERS.items()]
+                   + [(b'access-control-allow-origin', b'*')],
+    })
+    events = asyncio.ensure_future(forward())
+    disconnected = asyncio.ensure_future(_wait_disconnect(receive))
+    try:
+        await asyncio.wait({events, disconnected}, return_when=asyncio.FIRST_COMPLETED)
+    finally:
+        events.cancel()
+        disconnected.cancel()
+
+
+async def _lifespan(receive, send):
+    while True:
+        message = await receive()
+        if message['type'] == 'lifespan.startup':
+            await send({'type': 'lifespan.startup.complete'})
+        elif message['type'] == 'lifespan.shutdown':
+            # Volcar al disco lo pendiente antes de que el worker termine
+            await asyncio.to_thread(api.user_system.storage.close)
+            await send({'type': 'lifespan.shutdown.complete'})
+            return
+
+
+async def app(scope, receive, send):
+    """Aplicación ASGI con las rutas de user_system.py"""
+    if scope['type'] == 'lifespan':
+        await _lifespan(receive, send)
+        return
+    if scope['type'] != 'http':
+        return
+
+    method = scope['method']
+    path = scope['path']
+    headers = _headers(scope)
+
+    if method == 'OPTIONS':
+        # Preflight de CORS, como flask_cors con la configuración por defecto
+        await _send(send, 204, b'', extra_headers=[
+            (b'access-control-allow-methods', b'GET, POST, OPTIONS'),
+            (b'access-control-allow-headers',
+             headers.get('access-control-request-headers', '').encode('latin-1')),
+        ])
+        return
+
+    if method == 'POST' and path == LOGOUT_PATH:
+        body, status = api.api_logout(headers.get('authorization'))
+        await _send_json(send, body, status)
+        return
+
+    if method == 'GET' and path.startswith(PROGRESS_PREFIX) and len(path) > len(PROGRESS_PREFIX):
+        handler, access = api.api_progress, USER
+        arg = {'user_id': path[len(PROGRESS_PREFIX):],
+               'fields': _query(scope).get('fields'),
+               'if_none_match': headers.get('if-none-match')}
+    elif method == 'GET' and path == STREAM_PATH:
+        if not api.admin_authorized(headers.get('x-admin-key', '')):
+            await _send_json(send, {'error': 'Acceso restringido al profesorado'}, 403)
+            return
+        await _send_events(send, receive, dict(_query(scope), last_event_id=headers.get('last-event-id')))
+        return
+    elif method == 'GET' and path in GET_ROUTES:
+        handler, access = GET_ROUTES[path]
+        arg = _query(scope)
+    elif method == 'POST' and path in POST_ROUTES:
+        handler, access = POST_ROUTES[path]
+        raw = await _read_body(receive)
+        if raw is None:
+            await _send_json(send, {'error': 'Petición demasiado grande'}, 413)
+            return
+        try:
+            arg = json.loads(raw) if raw else {}
+        except ValueError:
+            arg = None
+        if not isinstance(arg, dict):
+            await _send_json(send, {'error': 'Se esperaba un objeto JSON'}, 400)
+            return
+    elif (path in POST_ROUTES or path in GET_ROUTES or path in (LOGOUT_PATH, STREAM_PATH)
+          or path.startswith(PROGRESS_PREFIX)):
+        await _send_json(send, {'error': 'Método no permitido'}, 405)
+        return
+    else:
+        await _send_json(send, {'error': 'Ruta no encontrada'}, 404)
+        return
+
+    is_admin = access != PUBLIC and api.admin_authorized(headers.get('x-admin-key', ''))
+    if access == ADMIN and not is_admin:
+        await _send_json(send, {'error': 'Acceso restringido al profesorado'}, 403)
+        return
+
+    if access == USER:
+        user = api.session_user(headers.get('authorization'))
+        if handler is api.api_attendance:
+            # Solo la administración registra asistencia sin el QR de la clase
+            handler = partial(handler, is_admin=is_admin)
+        result = await asyncio.to_thread(api.api_as_user, handler, arg, user, is_admin)
+    else:
+        result = await asyncio.to_thread(handler, arg)
+    body, status, *extra = result
+    extra_headers = [(name.lower().encode('latin-1'), value.encode('latin-1'))
+                     for name, value in (extra[0] if extra else {}).items()]
+    if body is None:
+        await _send_not_modified(send, extra_headers)
+    elif isinstance(body, dict):
+        await _send_json(send, body, status, extra_headers)
+    else:
+        await _send_stream(send, receive, body, status, extra_headers)